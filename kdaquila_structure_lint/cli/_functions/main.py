@@ -6,7 +6,9 @@ import traceback
 from pathlib import Path
 
 from kdaquila_structure_lint import __version__
+from kdaquila_structure_lint.cli._functions.parse_duration import parse_duration
 from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.config._constants import SUPPORTED_ORDERS
 from kdaquila_structure_lint.validation import run_validations
 
 
@@ -17,7 +19,8 @@ def main(argv: list[str] | None = None) -> int:
         argv: Command-line arguments (uses sys.argv if None, for testability)
 
     Returns:
-        Exit code (0 = success, 1 = validation failed, 2 = config error)
+        Exit code (0 = success, 1 = validation failed, 2 = config error,
+        3 = checked files passed but --time-budget ran out first)
     """
     # Ensure UTF-8 encoding for stdout/stderr on Windows
     if sys.platform == "win32":
@@ -47,6 +50,37 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--exact-counts",
+        action="store_true",
+        help="Report exact line counts instead of stopping at the line limit",
+    )
+    parser.add_argument(
+        "--order",
+        choices=sorted(SUPPORTED_ORDERS),
+        help="Order files are checked and reported in (default: mtime, newest first)",
+    )
+    parser.add_argument(
+        "--dirty-first",
+        action="store_true",
+        help="Check files modified or staged in git before the rest of the tree",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory to keep listings and file facts in between runs (overrides cache_dir)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Pass without validating if nothing changed since the last successful run",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=parse_duration,
+        metavar="DURATION",
+        help="Stop starting new file checks after DURATION (e.g. 2s, 500ms), newest files first",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -61,9 +95,19 @@ def main(argv: list[str] | None = None) -> int:
             project_root=args.project_root,
             config_path=args.config
         )
+        if args.exact_counts:
+            config.line_limits.exact_counts = True
+        if args.order is not None:
+            config.order = args.order
+        if args.dirty_first:
+            config.dirty_first = True
+        if args.cache_dir is not None:
+            config.cache_dir = str(args.cache_dir.resolve())
+        if args.skip_unchanged:
+            config.skip_unchanged = True
 
         # Run validations
-        return run_validations(config, verbose=args.verbose)
+        return run_validations(config, verbose=args.verbose, time_budget=args.time_budget)
 
     except FileNotFoundError as e:
         print(f"❌ Error: {e}", file=sys.stderr)
@@ -0,0 +1,21 @@
+"""Parse durations such as 2s or 500ms given on the command line."""
+
+import argparse
+import re
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration with an optional ms, s or m suffix into seconds.
+
+    A bare number is taken as seconds.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive duration
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|s|m)?\s*", value)
+    if match is None or float(match.group(1)) <= 0:
+        raise argparse.ArgumentTypeError(
+            f"invalid duration: {value!r} (expected e.g. 2s, 500ms or 1m)"
+        )
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0}[match.group(2) or "s"]
+    return float(match.group(1)) * scale
@@ -93,3 +93,49 @@ structure = false
 
         exit_code = main(["--project-root", str(tmp_path), "-v"])
         assert exit_code == 0
+
+    def test_cli_exact_counts_flag(self, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+        """Should report exact line counts with --exact-counts."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.structure-lint.validators]
+one_per_file = false
+
+[tool.structure-lint.line_limits]
+max_lines = 5
+""")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "long.py").write_text("x = 1\n" * 8)
+
+        exit_code = main(["--project-root", str(tmp_path), "--exact-counts"])
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert "8 lines (exceeds limit by 3)" in captured.out
+
+    def test_cli_order_flag(self, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+        """Should report files in the order given by --order."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.structure-lint.validators]
+one_per_file = false
+
+[tool.structure-lint.line_limits]
+max_lines = 5
+""")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "b.py").write_text("x = 1\n" * 8)
+        (tmp_path / "src" / "a.py").write_text("x = 1\n" * 9)
+
+        exit_code = main(["--project-root", str(tmp_path), "--order", "path"])
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert captured.out.index("a.py") < captured.out.index("b.py")
+
+    def test_cli_time_budget_rejects_invalid_duration(self) -> None:
+        """Should exit with a usage error for a malformed or non-positive duration."""
+        for value in ["soon", "0s", "-1s"]:
+            with pytest.raises(SystemExit) as exc_info:
+                main(["--time-budget", value])
+            assert exc_info.value.code == 2
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from _pytest.capture import CaptureFixture
+
 from kdaquila_structure_lint.cli import main
 from kdaquila_structure_lint.test_fixtures import create_source_file
 
@@ -91,3 +93,17 @@ enabled = true
 
         exit_code = main(["--config", str(pyproject)])
         assert exit_code == 2
+
+    def test_cli_time_budget_full_coverage_exit_code(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should return 0 when every file was checked within --time-budget."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.structure-lint]\nenabled = true\n")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "module.py").write_text("def hello():\n    pass\n")
+
+        exit_code = main(["--project-root", str(tmp_path), "--time-budget", "1m"])
+
+        assert exit_code == 0
+        assert "checked 1 file(s), skipped 0" in capsys.readouterr().out
@@ -1,27 +1,49 @@
 """Constants package for config defaults."""
 
 from kdaquila_structure_lint.config._constants.defaults import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_DIRTY_FIRST,
+    DEFAULT_DISCOVERY,
     DEFAULT_ENABLED,
     DEFAULT_FILES_ALLOWED_ANYWHERE,
     DEFAULT_FOLDER_DEPTH,
+    DEFAULT_FOLLOW_SYMLINKS,
     DEFAULT_IGNORED_FOLDERS,
+    DEFAULT_LINE_COUNTER,
     DEFAULT_LINE_LIMITS_ENABLED,
     DEFAULT_MAX_LINES,
     DEFAULT_ONE_PER_FILE_ENABLED,
+    DEFAULT_ORDER,
+    DEFAULT_RESPECT_GITIGNORE,
     DEFAULT_SEARCH_PATHS,
+    DEFAULT_SKIP_UNCHANGED,
     DEFAULT_STANDARD_FOLDERS,
     DEFAULT_STRUCTURE_ENABLED,
+    SUPPORTED_DISCOVERY_BACKENDS,
+    SUPPORTED_LINE_COUNTERS,
+    SUPPORTED_ORDERS,
 )
 
 __all__ = [
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_DIRTY_FIRST",
+    "DEFAULT_DISCOVERY",
     "DEFAULT_ENABLED",
     "DEFAULT_FILES_ALLOWED_ANYWHERE",
     "DEFAULT_FOLDER_DEPTH",
+    "DEFAULT_FOLLOW_SYMLINKS",
     "DEFAULT_IGNORED_FOLDERS",
+    "DEFAULT_LINE_COUNTER",
     "DEFAULT_LINE_LIMITS_ENABLED",
     "DEFAULT_MAX_LINES",
     "DEFAULT_ONE_PER_FILE_ENABLED",
+    "DEFAULT_ORDER",
+    "DEFAULT_RESPECT_GITIGNORE",
     "DEFAULT_SEARCH_PATHS",
+    "DEFAULT_SKIP_UNCHANGED",
     "DEFAULT_STANDARD_FOLDERS",
     "DEFAULT_STRUCTURE_ENABLED",
+    "SUPPORTED_DISCOVERY_BACKENDS",
+    "SUPPORTED_LINE_COUNTERS",
+    "SUPPORTED_ORDERS",
 ]
@@ -9,6 +9,8 @@ DEFAULT_ONE_PER_FILE_ENABLED = True
 
 # LineLimits defaults
 DEFAULT_MAX_LINES = 150
+DEFAULT_LINE_COUNTER = "python"  # "python" or "numpy"
+SUPPORTED_LINE_COUNTERS = frozenset({"python", "numpy"})
 
 # Structure defaults
 DEFAULT_FOLDER_DEPTH = 2
@@ -25,3 +27,12 @@ DEFAULT_IGNORED_FOLDERS = frozenset({
 # Config defaults
 DEFAULT_ENABLED = True
 DEFAULT_SEARCH_PATHS = ["src"]
+DEFAULT_RESPECT_GITIGNORE = False  # Opt-in: prune paths ignored by git
+DEFAULT_DISCOVERY = "filesystem"  # "filesystem" or "git"
+SUPPORTED_DISCOVERY_BACKENDS = frozenset({"filesystem", "git"})
+DEFAULT_FOLLOW_SYMLINKS = False
+DEFAULT_ORDER = "mtime"  # Order files are processed and reported in
+SUPPORTED_ORDERS = frozenset({"mtime", "path", "size", "none"})
+DEFAULT_DIRTY_FIRST = False  # Opt-in: check files changed in git first
+DEFAULT_CACHE_DIR: str | None = None  # Opt-in: persist listings between runs
+DEFAULT_SKIP_UNCHANGED = False  # Opt-in: pass without validating an unchanged tree
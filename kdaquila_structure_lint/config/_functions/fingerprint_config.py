@@ -0,0 +1,24 @@
+"""Fingerprint a configuration for cache invalidation."""
+
+import hashlib
+import json
+from dataclasses import asdict
+
+from kdaquila_structure_lint import __version__
+from kdaquila_structure_lint.config._types import Config
+
+
+def fingerprint_config(config: Config) -> str:
+    """Return a hex digest that changes whenever config or the tool version does.
+
+    Sets are sorted and paths turned into strings first, so equal configurations
+    always produce the same digest.
+    """
+
+    def encode(value: object) -> object:
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+        return str(value)
+
+    data = json.dumps([__version__, asdict(config)], sort_keys=True, default=encode)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
@@ -3,7 +3,17 @@
 import sys
 from pathlib import Path
 
+from kdaquila_structure_lint.config._constants import (
+    SUPPORTED_DISCOVERY_BACKENDS,
+    SUPPORTED_ORDERS,
+)
 from kdaquila_structure_lint.config._functions.find_project_root import find_project_root
+from kdaquila_structure_lint.config._functions.load_line_limits_config import (
+    load_line_limits_config,
+)
+from kdaquila_structure_lint.config._functions.load_structure_config import (
+    load_structure_config,
+)
 from kdaquila_structure_lint.config._types import Config
 
 # Python 3.11+ has tomllib, older versions need tomli
@@ -44,6 +54,21 @@ def load_config(
     # Step 4: Deep merge with defaults
     enabled = user_config.get("enabled", True)
     search_paths = user_config.get("search_paths", ["src"])
+    exclude = user_config.get("exclude", [])
+    respect_gitignore = user_config.get("respect_gitignore", False)
+    follow_symlinks = user_config.get("follow_symlinks", False)
+    dirty_first = user_config.get("dirty_first", False)
+    cache_dir = user_config.get("cache_dir")
+    skip_unchanged = user_config.get("skip_unchanged", False)
+    order = user_config.get("order", "mtime")
+    if order not in SUPPORTED_ORDERS:
+        raise ValueError(f"Invalid order: {order!r}. Expected one of {sorted(SUPPORTED_ORDERS)}")
+    discovery = user_config.get("discovery", "filesystem")
+    if discovery not in SUPPORTED_DISCOVERY_BACKENDS:
+        raise ValueError(
+            f"Invalid discovery: {discovery!r}. "
+            f"Expected one of {sorted(SUPPORTED_DISCOVERY_BACKENDS)}"
+        )
 
     # Validators section
     validators_data = user_config.get("validators", {})
@@ -54,18 +79,7 @@ def load_config(
     )
 
     # Line limits section
-    line_limits_data = user_config.get("line_limits", {})
-
-    # Deprecation warning for line_limits.search_paths
-    if "search_paths" in line_limits_data:
-        print(
-            "Warning: 'line_limits.search_paths' is deprecated and will be ignored. "
-            "Use 'search_paths' at the root level of [tool.structure-lint] instead."
-        )
-
-    line_limits = Config.LineLimits(
-        max_lines=line_limits_data.get("max_lines", 150),
-    )
+    line_limits = load_line_limits_config(user_config.get("line_limits", {}))
 
     # One-per-file section
     one_per_file_data = user_config.get("one_per_file", {})
@@ -88,54 +102,20 @@ def load_config(
     )
 
     # Structure section
-    structure_data = user_config.get("structure", {})
-
-    # Deprecation warning for general_folder
-    if "general_folder" in structure_data:
-        print(
-            "Warning: 'general_folder' is deprecated and will be ignored."
-        )
-
-    # Deprecation warning for structure.strict_format_roots
-    if "strict_format_roots" in structure_data:
-        print(
-            "Warning: 'structure.strict_format_roots' is deprecated and will be ignored. "
-            "Use 'search_paths' at the root level of [tool.structure-lint] instead."
-        )
-
-    default_standard_folders = [
-        "_types", "_functions", "_constants", "_tests", "_errors", "_classes",
-        "_components", "_hooks"
-    ]
-    structure = Config.Structure(
-        folder_depth=structure_data.get("folder_depth", 2),
-        standard_folders=set(
-            structure_data.get("standard_folders", default_standard_folders)
-        ),
-        files_allowed_anywhere=set(
-            structure_data.get("files_allowed_anywhere", ["__init__.py", "index.ts", "index.tsx"])
-        ),
-        ignored_folders=set(
-            structure_data.get(
-                "ignored_folders",
-                ["__pycache__", ".mypy_cache", ".pytest_cache", ".ruff_cache",
-                 ".hypothesis", ".tox", ".coverage", "*.egg-info"]
-            )
-        ),
-    )
-
-    # Validate all standard folders start with underscore
-    invalid_folders = {f for f in structure.standard_folders if not f.startswith("_")}
-    if invalid_folders:
-        raise ValueError(
-            f"Invalid standard_folders: {sorted(invalid_folders)}. "
-            f"All entries must start with underscore (e.g., '_models' not 'models')"
-        )
+    structure = load_structure_config(user_config.get("structure", {}))
 
     return Config(
         enabled=enabled,
         project_root=project_root,
         search_paths=search_paths,
+        exclude=exclude,
+        respect_gitignore=respect_gitignore,
+        discovery=discovery,
+        follow_symlinks=follow_symlinks,
+        order=order,
+        dirty_first=dirty_first,
+        cache_dir=cache_dir,
+        skip_unchanged=skip_unchanged,
         validators=validators,
         line_limits=line_limits,
         one_per_file=one_per_file,
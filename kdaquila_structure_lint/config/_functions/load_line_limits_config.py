@@ -0,0 +1,32 @@
+"""Load the line_limits section of the configuration."""
+
+from typing import Any
+
+from kdaquila_structure_lint.config._constants import SUPPORTED_LINE_COUNTERS
+from kdaquila_structure_lint.config._types import Config
+
+
+def load_line_limits_config(line_limits_data: dict[str, Any]) -> Config.LineLimits:
+    """Merge the [tool.structure-lint.line_limits] table with defaults.
+
+    Raises:
+        ValueError: If counter is not a supported line counter
+    """
+    # Deprecation warning for line_limits.search_paths
+    if "search_paths" in line_limits_data:
+        print(
+            "Warning: 'line_limits.search_paths' is deprecated and will be ignored. "
+            "Use 'search_paths' at the root level of [tool.structure-lint] instead."
+        )
+
+    line_limits = Config.LineLimits(
+        max_lines=line_limits_data.get("max_lines", 150),
+        counter=line_limits_data.get("counter", "python"),
+        exact_counts=line_limits_data.get("exact_counts", False),
+    )
+    if line_limits.counter not in SUPPORTED_LINE_COUNTERS:
+        raise ValueError(
+            f"Invalid line_limits.counter: {line_limits.counter!r}. "
+            f"Expected one of {sorted(SUPPORTED_LINE_COUNTERS)}"
+        )
+    return line_limits
@@ -0,0 +1,55 @@
+"""Load the structure section of the configuration."""
+
+from typing import Any
+
+from kdaquila_structure_lint.config._types import Config
+
+
+def load_structure_config(structure_data: dict[str, Any]) -> Config.Structure:
+    """Merge the [tool.structure-lint.structure] table with defaults.
+
+    Raises:
+        ValueError: If a standard folder does not start with an underscore
+    """
+    # Deprecation warning for general_folder
+    if "general_folder" in structure_data:
+        print(
+            "Warning: 'general_folder' is deprecated and will be ignored."
+        )
+
+    # Deprecation warning for structure.strict_format_roots
+    if "strict_format_roots" in structure_data:
+        print(
+            "Warning: 'structure.strict_format_roots' is deprecated and will be ignored. "
+            "Use 'search_paths' at the root level of [tool.structure-lint] instead."
+        )
+
+    default_standard_folders = [
+        "_types", "_functions", "_constants", "_tests", "_errors", "_classes",
+        "_components", "_hooks"
+    ]
+    structure = Config.Structure(
+        folder_depth=structure_data.get("folder_depth", 2),
+        standard_folders=set(
+            structure_data.get("standard_folders", default_standard_folders)
+        ),
+        files_allowed_anywhere=set(
+            structure_data.get("files_allowed_anywhere", ["__init__.py", "index.ts", "index.tsx"])
+        ),
+        ignored_folders=set(
+            structure_data.get(
+                "ignored_folders",
+                ["__pycache__", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+                 ".hypothesis", ".tox", ".coverage", "*.egg-info"]
+            )
+        ),
+    )
+
+    # Validate all standard folders start with underscore
+    invalid_folders = {f for f in structure.standard_folders if not f.startswith("_")}
+    if invalid_folders:
+        raise ValueError(
+            f"Invalid standard_folders: {sorted(invalid_folders)}. "
+            f"All entries must start with underscore (e.g., '_models' not 'models')"
+        )
+    return structure
@@ -15,6 +15,7 @@ class TestLoadConfigDefaults:
         assert config.enabled is True
         assert config.project_root == tmp_path
         assert config.search_paths == ["src"]
+        assert config.respect_gitignore is False
         assert config.validators.structure is False
         assert config.validators.line_limits is True
         assert config.validators.one_per_file is True
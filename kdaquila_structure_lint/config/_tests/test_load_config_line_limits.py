@@ -0,0 +1,54 @@
+"""Tests for load_config line_limits options."""
+
+from pathlib import Path
+
+import pytest
+
+from kdaquila_structure_lint.config import load_config
+
+
+class TestLoadConfigLineLimits:
+    """Tests for line_limits configuration loading."""
+
+    def test_counter_defaults_to_python(self, tmp_path: Path) -> None:
+        """Should use the pure-Python counter by default."""
+        config = load_config(project_root=tmp_path)
+
+        assert config.line_limits.counter == "python"
+
+    def test_load_numpy_counter(self, tmp_path: Path) -> None:
+        """Should load counter from TOML."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.structure-lint.line_limits]
+counter = "numpy"
+""")
+
+        config = load_config(project_root=tmp_path, config_path=pyproject)
+
+        assert config.line_limits.counter == "numpy"
+
+    def test_invalid_counter_raises_error(self, tmp_path: Path) -> None:
+        """Should reject unknown counters."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.structure-lint.line_limits]
+counter = "gpu"
+""")
+
+        with pytest.raises(ValueError, match=r"Invalid line_limits\.counter"):
+            load_config(project_root=tmp_path, config_path=pyproject)
+
+    def test_load_exact_counts(self, tmp_path: Path) -> None:
+        """Should default exact_counts to False and load it from TOML."""
+        assert load_config(project_root=tmp_path).line_limits.exact_counts is False
+
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.structure-lint.line_limits]
+exact_counts = true
+""")
+
+        config = load_config(project_root=tmp_path, config_path=pyproject)
+
+        assert config.line_limits.exact_counts is True
@@ -4,14 +4,22 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from kdaquila_structure_lint.config._constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_DIRTY_FIRST,
+    DEFAULT_DISCOVERY,
     DEFAULT_ENABLED,
     DEFAULT_FILES_ALLOWED_ANYWHERE,
     DEFAULT_FOLDER_DEPTH,
+    DEFAULT_FOLLOW_SYMLINKS,
     DEFAULT_IGNORED_FOLDERS,
+    DEFAULT_LINE_COUNTER,
     DEFAULT_LINE_LIMITS_ENABLED,
     DEFAULT_MAX_LINES,
     DEFAULT_ONE_PER_FILE_ENABLED,
+    DEFAULT_ORDER,
+    DEFAULT_RESPECT_GITIGNORE,
     DEFAULT_SEARCH_PATHS,
+    DEFAULT_SKIP_UNCHANGED,
     DEFAULT_STANDARD_FOLDERS,
     DEFAULT_STRUCTURE_ENABLED,
 )
@@ -32,6 +40,8 @@ class Config:
     class LineLimits:
         """Configuration for line limits validator."""
         max_lines: int = DEFAULT_MAX_LINES
+        counter: str = DEFAULT_LINE_COUNTER  # "numpy" batches files (optional extra)
+        exact_counts: bool = False  # Count to EOF instead of stopping past max_lines
 
     @dataclass
     class OnePerFile:
@@ -67,6 +77,14 @@ class Config:
     enabled: bool = DEFAULT_ENABLED
     project_root: Path = field(default_factory=Path.cwd)
     search_paths: list[str] = field(default_factory=lambda: list(DEFAULT_SEARCH_PATHS))
+    respect_gitignore: bool = DEFAULT_RESPECT_GITIGNORE  # Skip paths ignored by git
+    exclude: list[str] = field(default_factory=list)  # Added to the built-in excludes
+    discovery: str = DEFAULT_DISCOVERY  # "git" lists tracked files from .git/index
+    follow_symlinks: bool = DEFAULT_FOLLOW_SYMLINKS  # Descend into symlinked directories
+    order: str = DEFAULT_ORDER  # "mtime", "path", "size" or "none" (walk order)
+    dirty_first: bool = DEFAULT_DIRTY_FIRST  # Check git-modified files before the rest
+    cache_dir: str | None = DEFAULT_CACHE_DIR  # Relative to project_root
+    skip_unchanged: bool = DEFAULT_SKIP_UNCHANGED  # Needs cache_dir
     validators: Validators = field(default_factory=Validators)
     line_limits: LineLimits = field(default_factory=LineLimits)
     one_per_file: OnePerFile = field(default_factory=OnePerFile)
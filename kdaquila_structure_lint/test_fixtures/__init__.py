@@ -10,6 +10,8 @@ Helper Functions (create_ prefix):
 - create_custom_config: Creates a Config object with custom settings
 - create_source_file: Factory for creating test files
 - build_structure: Builds folder structures from nested dictionaries
+- git: Runs a git command in a test repository
+- scanned_names: Lists the relative paths discovery finds under a directory
 
 Constants (UPPERCASE):
 - SAMPLE_VALID_FILE_CONTENT: Valid Python file content
@@ -17,9 +19,11 @@ Constants (UPPERCASE):
 - SAMPLE_MULTIPLE_DEFINITIONS_CONTENT: Content with multiple definitions
 - SAMPLE_EMPTY_FILE_CONTENT: Empty file content
 - SAMPLE_SYNTAX_ERROR_CONTENT: Content with syntax errors
+- REQUIRES_GIT: Skip marker for tests that need a git executable
 """
 
 from kdaquila_structure_lint.test_fixtures._functions import (
+    REQUIRES_GIT,
     SAMPLE_EMPTY_FILE_CONTENT,
     SAMPLE_MULTIPLE_DEFINITIONS_CONTENT,
     SAMPLE_SYNTAX_ERROR_CONTENT,
@@ -31,9 +35,12 @@ from kdaquila_structure_lint.test_fixtures._functions import (
     create_source_file,
     create_temp_project,
     create_temp_project_with_pyproject,
+    git,
+    scanned_names,
 )
 
 __all__ = [
+    "REQUIRES_GIT",
     "SAMPLE_EMPTY_FILE_CONTENT",
     "SAMPLE_MULTIPLE_DEFINITIONS_CONTENT",
     "SAMPLE_SYNTAX_ERROR_CONTENT",
@@ -45,4 +52,6 @@ __all__ = [
     "create_source_file",
     "create_temp_project",
     "create_temp_project_with_pyproject",
+    "git",
+    "scanned_names",
 ]
@@ -1,5 +1,6 @@
 """Constants package for test fixtures."""
 
+from kdaquila_structure_lint.test_fixtures._constants.requires_git import REQUIRES_GIT
 from kdaquila_structure_lint.test_fixtures._constants.sample_empty_file_content import (
     SAMPLE_EMPTY_FILE_CONTENT,
 )
@@ -17,6 +18,7 @@ from kdaquila_structure_lint.test_fixtures._constants.sample_valid_file_content
 )
 
 __all__ = [
+    "REQUIRES_GIT",
     "SAMPLE_EMPTY_FILE_CONTENT",
     "SAMPLE_MULTIPLE_DEFINITIONS_CONTENT",
     "SAMPLE_SYNTAX_ERROR_CONTENT",
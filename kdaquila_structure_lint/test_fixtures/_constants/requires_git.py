@@ -0,0 +1,7 @@
+"""Constant for skipping tests that need a git executable."""
+
+import shutil
+
+import pytest
+
+REQUIRES_GIT = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
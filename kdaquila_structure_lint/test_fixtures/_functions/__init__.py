@@ -1,6 +1,7 @@
 """Export all test helper functions and constants from individual files."""
 
 from kdaquila_structure_lint.test_fixtures._constants import (
+    REQUIRES_GIT,
     SAMPLE_EMPTY_FILE_CONTENT,
     SAMPLE_MULTIPLE_DEFINITIONS_CONTENT,
     SAMPLE_SYNTAX_ERROR_CONTENT,
@@ -21,8 +22,11 @@ from kdaquila_structure_lint.test_fixtures._functions.create_temp_project import
 from kdaquila_structure_lint.test_fixtures._functions.create_temp_project_with_pyproject import (
     create_temp_project_with_pyproject,
 )
+from kdaquila_structure_lint.test_fixtures._functions.git import git
+from kdaquila_structure_lint.test_fixtures._functions.scanned_names import scanned_names
 
 __all__ = [
+    "REQUIRES_GIT",
     "SAMPLE_EMPTY_FILE_CONTENT",
     "SAMPLE_MULTIPLE_DEFINITIONS_CONTENT",
     "SAMPLE_SYNTAX_ERROR_CONTENT",
@@ -34,4 +38,6 @@ __all__ = [
     "create_source_file",
     "create_temp_project",
     "create_temp_project_with_pyproject",
+    "git",
+    "scanned_names",
 ]
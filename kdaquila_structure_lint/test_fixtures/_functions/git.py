@@ -0,0 +1,23 @@
+"""Helper function for running git commands in test repositories."""
+
+import subprocess
+from pathlib import Path
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run a git command in repo with a fixed test identity.
+
+    Args:
+        repo: Directory to run git in.
+        *args: Arguments passed to git.
+
+    Returns:
+        The command's standard output, stripped.
+    """
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
@@ -0,0 +1,19 @@
+"""Helper function for listing the files discovery finds under a directory."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.scan_source_files import scan_source_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def scanned_names(root: Path, index: DirectoryIndex) -> list[str]:
+    """Return the sorted relative paths discovered under root.
+
+    Args:
+        root: Directory to scan.
+        index: Discovery settings and listing cache to scan with.
+
+    Returns:
+        Paths relative to root in POSIX form, sorted.
+    """
+    return sorted(f.path.relative_to(root).as_posix() for f in scan_source_files(root, index=index))
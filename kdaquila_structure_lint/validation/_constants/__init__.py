@@ -1,7 +1,61 @@
 """Constants package for validation."""
 
 from kdaquila_structure_lint.validation._constants.exclude_dirs import EXCLUDE_DIRS
+from kdaquila_structure_lint.validation._constants.facts_database_format import (
+    FACTS_DATABASE_BATCH_SIZE,
+    FACTS_DATABASE_FILE,
+    FACTS_DATABASE_RACY_NS,
+    FACTS_DATABASE_SCHEMA,
+    FACTS_DATABASE_TIMEOUT,
+    FACTS_DATABASE_VERSION,
+)
+from kdaquila_structure_lint.validation._constants.git_index_format import (
+    GIT_INDEX_EXTENDED_FLAG,
+    GIT_INDEX_PARTIAL_EXTENSIONS,
+    GIT_INDEX_REGULAR_FILE,
+    GIT_INDEX_SIGNATURE,
+    GIT_INDEX_SKIP_WORKTREE_FLAG,
+    GIT_INDEX_SPARSE_DIRECTORY,
+    GIT_INDEX_VERSIONS,
+)
+from kdaquila_structure_lint.validation._constants.listing_snapshot_format import (
+    LISTING_SNAPSHOT_FILE,
+    LISTING_SNAPSHOT_RACY_NS,
+    LISTING_SNAPSHOT_VERSION,
+)
+from kdaquila_structure_lint.validation._constants.numpy_batch_size import NUMPY_BATCH_SIZE
+from kdaquila_structure_lint.validation._constants.partial_coverage_exit_code import (
+    PARTIAL_COVERAGE_EXIT_CODE,
+)
+from kdaquila_structure_lint.validation._constants.read_chunk_size import READ_CHUNK_SIZE
+from kdaquila_structure_lint.validation._constants.run_fingerprint_file import (
+    RUN_FINGERPRINT_FILE,
+)
+from kdaquila_structure_lint.validation._constants.stat_orders import STAT_ORDERS
+from kdaquila_structure_lint.validation._constants.stream_queue_size import STREAM_QUEUE_SIZE
 
 __all__ = [
     "EXCLUDE_DIRS",
+    "FACTS_DATABASE_BATCH_SIZE",
+    "FACTS_DATABASE_FILE",
+    "FACTS_DATABASE_RACY_NS",
+    "FACTS_DATABASE_SCHEMA",
+    "FACTS_DATABASE_TIMEOUT",
+    "FACTS_DATABASE_VERSION",
+    "GIT_INDEX_EXTENDED_FLAG",
+    "GIT_INDEX_PARTIAL_EXTENSIONS",
+    "GIT_INDEX_REGULAR_FILE",
+    "GIT_INDEX_SIGNATURE",
+    "GIT_INDEX_SKIP_WORKTREE_FLAG",
+    "GIT_INDEX_SPARSE_DIRECTORY",
+    "GIT_INDEX_VERSIONS",
+    "LISTING_SNAPSHOT_FILE",
+    "LISTING_SNAPSHOT_RACY_NS",
+    "LISTING_SNAPSHOT_VERSION",
+    "NUMPY_BATCH_SIZE",
+    "PARTIAL_COVERAGE_EXIT_CODE",
+    "READ_CHUNK_SIZE",
+    "RUN_FINGERPRINT_FILE",
+    "STAT_ORDERS",
+    "STREAM_QUEUE_SIZE",
 ]
@@ -1,7 +1,8 @@
 """Directories to exclude when finding source files."""
 
-EXCLUDE_DIRS = {
+# Merged with the root-level `exclude` setting; pruned by every validator
+EXCLUDE_DIRS = frozenset({
     ".git", ".hg", ".svn",
     ".venv", "venv", "node_modules", "__pycache__",
     "dist", "build", ".next", "coverage", ".turbo"
-}
+})
@@ -0,0 +1,18 @@
+"""Constants of the SQLite database holding the file facts cache."""
+
+FACTS_DATABASE_FILE = "facts.sqlite3"
+FACTS_DATABASE_VERSION = 2  # Stored as PRAGMA user_version; a mismatch recreates the tables
+FACTS_DATABASE_TIMEOUT = 30.0  # Seconds to wait for another process's write lock
+FACTS_DATABASE_BATCH_SIZE = 1000  # Pending entries that trigger a write transaction
+# Files modified this close to (or after) the moment they were hashed may have
+# changed within one mtime tick, so their saved content key is not trusted
+FACTS_DATABASE_RACY_NS = 2_000_000_000
+FACTS_DATABASE_SCHEMA = (
+    "CREATE TABLE facts ("
+    " namespace TEXT NOT NULL, key TEXT NOT NULL, line_count INTEGER,"
+    " definitions TEXT, extras TEXT, parse_error INTEGER NOT NULL,"
+    " PRIMARY KEY (namespace, key)) WITHOUT ROWID",
+    "CREATE TABLE content_keys ("
+    " path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+    " hashed_ns INTEGER NOT NULL, key TEXT NOT NULL) WITHOUT ROWID",
+)
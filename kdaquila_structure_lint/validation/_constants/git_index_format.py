@@ -0,0 +1,9 @@
+"""Constants of the git index file format (see git's gitformat-index docs)."""
+
+GIT_INDEX_SIGNATURE = b"DIRC"
+GIT_INDEX_VERSIONS = frozenset({2, 3, 4})
+GIT_INDEX_EXTENDED_FLAG = 0x4000  # Entry has a second flags field (version 3+)
+GIT_INDEX_SKIP_WORKTREE_FLAG = 0x4000  # In the extended flags: outside sparse checkout
+GIT_INDEX_REGULAR_FILE = 0b1000  # Object type bits (mode >> 12) of a regular file
+GIT_INDEX_SPARSE_DIRECTORY = 0b0100  # Object type bits of a collapsed sparse-index directory
+GIT_INDEX_PARTIAL_EXTENSIONS = frozenset({b"link", b"sdir"})  # Split index, sparse index
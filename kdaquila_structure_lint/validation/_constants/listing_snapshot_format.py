@@ -0,0 +1,7 @@
+"""Constants of the persisted directory listing snapshot."""
+
+LISTING_SNAPSHOT_FILE = "listings.json"
+LISTING_SNAPSHOT_VERSION = 1
+# Directories modified this close to (or after) the start of the run that saved a
+# snapshot may have changed within one mtime tick, so they are listed again
+LISTING_SNAPSHOT_RACY_NS = 2_000_000_000
@@ -0,0 +1,3 @@
+"""Target size of the contiguous buffer used by the NumPy line counter."""
+
+NUMPY_BATCH_SIZE = 64 << 20  # 64 MiB
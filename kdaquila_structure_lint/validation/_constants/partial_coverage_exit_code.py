@@ -0,0 +1,3 @@
+"""Exit code for a run that passed but skipped files because of --time-budget."""
+
+PARTIAL_COVERAGE_EXIT_CODE = 3
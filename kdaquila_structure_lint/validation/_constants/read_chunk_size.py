@@ -0,0 +1,3 @@
+"""Chunk size used when reading files as raw bytes."""
+
+READ_CHUNK_SIZE = 1 << 20  # 1 MiB
@@ -0,0 +1,3 @@
+"""File in cache_dir holding the fingerprint of the last successful run."""
+
+RUN_FINGERPRINT_FILE = "last-success"
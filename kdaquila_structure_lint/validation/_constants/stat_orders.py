@@ -0,0 +1,3 @@
+"""File orders that sort on stat data, so discovery must stat each file."""
+
+STAT_ORDERS = frozenset({"mtime", "size"})
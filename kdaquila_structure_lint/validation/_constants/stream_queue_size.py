@@ -0,0 +1,3 @@
+"""Discovered files allowed to wait for analysis before the walk pauses."""
+
+STREAM_QUEUE_SIZE = 256
@@ -2,51 +2,47 @@
 
 from pathlib import Path
 
-from kdaquila_structure_lint.config import Config
-from kdaquila_structure_lint.definition_counter import (
-    count_top_level_definitions,
-    detect_extra_definitions,
-)
-from kdaquila_structure_lint.validation._functions.get_rule_for_file import (
-    get_rule_for_file,
-)
-from kdaquila_structure_lint.validation._functions.get_standard_folder import (
-    get_standard_folder,
-)
-from kdaquila_structure_lint.validation._functions.is_excluded import (
-    is_excluded,
+from kdaquila_structure_lint.validation._functions.get_definition_facts import (
+    get_definition_facts,
 )
+from kdaquila_structure_lint.validation._functions.get_file_language import get_file_language
 from kdaquila_structure_lint.validation._functions.validate_filename_matches_definition import (
     validate_filename_matches_definition,
 )
+from kdaquila_structure_lint.validation._types import (
+    DirectoryClassification,
+    FactsCache,
+    NameMatcher,
+)
 
 
 def _validate_file(
     file_path: Path,
-    config: Config,
+    classification: DirectoryClassification,
     errors: list[str],
     name_errors: list[str],
+    excluded: NameMatcher,
+    *,
+    cache: FactsCache | None = None,
 ) -> None:
-    """Validate a single file and append any errors to the error lists."""
-    project_root = config.project_root
-    standard_folders = config.structure.standard_folders
-    excluded_patterns = config.one_per_file.excluded_patterns
+    """Validate a single file and append any errors to the error lists.
 
-    # Make path relative to project root for cleaner error messages
-    try:
-        relative_path = file_path.relative_to(project_root)
-    except ValueError:
-        relative_path = file_path
+    classification is the memoized classification of the file's directory and
+    excluded is the compiled one_per_file.excluded_patterns matcher. With a
+    facts cache, the file is only parsed if its content was not parsed before.
+    """
+    relative_path = classification.relative_dir / file_path.name
 
     # Check if file is excluded
-    if is_excluded(file_path, excluded_patterns):
+    if excluded.matches(file_path.name):
         return
 
-    # Detect which standard folder the file is in
-    folder = get_standard_folder(file_path, standard_folders)
+    folder = classification.folder
 
     # Get the applicable rule for this file
-    rule = get_rule_for_file(file_path, folder, config)
+    rule = (
+        classification.ts_rule if get_file_language(file_path) == "ts" else classification.py_rule
+    )
 
     # Skip if no rule applies (file not in a standard folder or folder has no rule)
     if rule is None:
@@ -57,13 +53,17 @@ def _validate_file(
         return
 
     # Count definitions and validate
-    result = count_top_level_definitions(file_path)
+    facts = get_definition_facts(file_path, cache)
 
-    if result is None:
+    if facts.definitions is None:
+        # A tracked file deleted from the work tree (discovery = "git") is skipped
+        if not file_path.exists():
+            return
         errors.append(f"{relative_path}: Error parsing file")
         return
 
-    count, names = result
+    names = list(facts.definitions)
+    count = len(names)
     if count > 1:
         # Determine construct type based on folder
         construct_type = "classes" if folder in {"_classes"} else "functions"
@@ -81,7 +81,7 @@ def _validate_file(
 
     # Check for extra definitions (types, constants, etc.)
     if count <= 1:
-        extras = detect_extra_definitions(file_path)
+        extras = facts.extras
         if extras:
             extras_str = ", ".join(extras)
             errors.append(
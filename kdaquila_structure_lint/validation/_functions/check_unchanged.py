@@ -0,0 +1,27 @@
+"""Decide whether a run can reuse the result of the last successful one."""
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._functions.fingerprint_run import fingerprint_run
+from kdaquila_structure_lint.validation._functions.load_run_fingerprint import (
+    load_run_fingerprint,
+)
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def check_unchanged(config: Config, index: DirectoryIndex) -> tuple[bool, str | None]:
+    """Fingerprint the run if skip_unchanged is set, and compare with the last success.
+
+    Returns:
+        (whether the fingerprint matches that of the last successful run, the
+        fingerprint to save if this run succeeds, or None)
+    """
+    if not config.skip_unchanged:
+        return False, None
+    if config.cache_dir is None:
+        print("⚠️  Warning: skip_unchanged needs cache_dir, validating everything")
+        return False, None
+    fingerprint = fingerprint_run(config, index)
+    if fingerprint is None:
+        return False, None
+    stored = load_run_fingerprint(config.project_root / config.cache_dir)
+    return fingerprint == stored, fingerprint
@@ -0,0 +1,29 @@
+"""Classify a directory for one-per-file validation."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._functions.get_rule_for_language import (
+    get_rule_for_language,
+)
+from kdaquila_structure_lint.validation._functions.get_standard_folder import (
+    get_standard_folder,
+)
+from kdaquila_structure_lint.validation._types import DirectoryClassification
+
+
+def classify_directory(directory: Path, config: Config) -> DirectoryClassification:
+    """Compute the standard folder, rules and relative path shared by a directory's files."""
+    # Make path relative to project root for cleaner error messages
+    try:
+        relative_dir = directory.relative_to(config.project_root)
+    except ValueError:
+        relative_dir = directory
+
+    folder = get_standard_folder(directory, config.structure.standard_folders)
+    return DirectoryClassification(
+        folder=folder,
+        py_rule=get_rule_for_language("py", folder, config),
+        ts_rule=get_rule_for_language("ts", folder, config),
+        relative_dir=relative_dir,
+    )
@@ -0,0 +1,37 @@
+"""Compile one line of a .gitignore file."""
+
+import re
+
+from kdaquila_structure_lint.validation._functions.translate_gitignore_pattern import (
+    translate_gitignore_pattern,
+)
+from kdaquila_structure_lint.validation._types import IgnoreRule
+
+
+def compile_ignore_rule(line: str) -> IgnoreRule | None:
+    """Compile a .gitignore line, following the pattern format in gitignore(5).
+
+    Returns None for blank lines and comments. A pattern with a slash anywhere
+    but at the end is anchored to the ignore file's directory; otherwise it
+    matches a name at any depth below it.
+    """
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    directory_only = line.endswith("/")
+    if directory_only:
+        line = line[:-1]
+    anchored = "/" in line
+    line = line.removeprefix("/")
+    if not line:
+        return None
+
+    source = translate_gitignore_pattern(line)
+    if not anchored:
+        source = "(?:.*/)?" + source
+    return IgnoreRule(re.compile(source, re.DOTALL), negated, directory_only)
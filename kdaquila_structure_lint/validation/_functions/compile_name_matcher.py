@@ -0,0 +1,24 @@
+"""Compile fnmatch-style patterns into a NameMatcher."""
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+
+from kdaquila_structure_lint.validation._types import NameMatcher
+
+
+@lru_cache(maxsize=32)
+def compile_name_matcher(patterns: frozenset[str]) -> NameMatcher:
+    """Compile patterns once for fast repeated matching.
+
+    Results are cached per distinct set of patterns, so validators can call this
+    at the start of every run without recompiling.
+    """
+    normalized = {os.path.normcase(pattern) for pattern in patterns}
+    wildcards = sorted(p for p in normalized if any(c in p for c in "*?["))
+    literals = frozenset(normalized.difference(wildcards))
+    wildcard_regex = (
+        re.compile("|".join(fnmatch.translate(p) for p in wildcards)) if wildcards else None
+    )
+    return NameMatcher(literals, wildcard_regex)
@@ -0,0 +1,73 @@
+"""Open the SQLite database of the file facts cache."""
+
+import sqlite3
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.facts_database_format import (
+    FACTS_DATABASE_FILE,
+    FACTS_DATABASE_SCHEMA,
+    FACTS_DATABASE_TIMEOUT,
+    FACTS_DATABASE_VERSION,
+)
+from kdaquila_structure_lint.validation._functions.create_cache_dir import create_cache_dir
+
+
+def connect_facts_database(cache_dir: Path, create: bool) -> sqlite3.Connection | None:
+    """Connect to the facts database in cache_dir, in WAL mode.
+
+    In WAL mode readers never block the one writer and the writer never blocks
+    readers, so an editor, a pre-commit hook and a watch process can share the
+    cache. Transactions are managed explicitly (autocommit mode) and a writer
+    waits up to FACTS_DATABASE_TIMEOUT seconds for another one to finish.
+
+    Args:
+        cache_dir: Cache directory holding the database
+        create: Create the cache directory and the database if needed, and
+            recreate a database that is corrupt or has an older schema
+
+    Returns:
+        Connection usable from any thread, or None if there is no usable
+        database (only when create is False)
+
+    Raises:
+        OSError: If the cache directory cannot be created
+        sqlite3.Error: If the database cannot be created
+    """
+    path = cache_dir / FACTS_DATABASE_FILE
+    if not create and not path.is_file():
+        return None
+    if create:
+        create_cache_dir(cache_dir)
+    for attempt in range(2):
+        connection = sqlite3.connect(
+            path, timeout=FACTS_DATABASE_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version == FACTS_DATABASE_VERSION:
+                return connection
+            if not create:
+                connection.close()
+                return None
+            connection.execute("BEGIN IMMEDIATE")
+            # Another process may have created the tables while we waited
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != FACTS_DATABASE_VERSION:
+                connection.execute("DROP TABLE IF EXISTS facts")
+                connection.execute("DROP TABLE IF EXISTS content_keys")
+                for statement in FACTS_DATABASE_SCHEMA:
+                    connection.execute(statement)
+                connection.execute(f"PRAGMA user_version = {FACTS_DATABASE_VERSION}")
+            connection.execute("COMMIT")
+            return connection
+        except sqlite3.DatabaseError as e:
+            connection.close()
+            if not create:
+                return None
+            # A busy database is left alone; only a damaged one is replaced
+            if attempt or isinstance(e, sqlite3.OperationalError):
+                raise
+            for suffix in ("", "-wal", "-shm"):
+                path.with_name(path.name + suffix).unlink(missing_ok=True)
+    return None
@@ -1,13 +1,59 @@
 """Count lines in source files."""
 
+import codecs
 from pathlib import Path
 
+from kdaquila_structure_lint.validation._constants.read_chunk_size import READ_CHUNK_SIZE
+
+
+def count_file_lines(
+    file_path: Path,
+    validate_utf8: bool = True,
+    chunk_size: int = READ_CHUNK_SIZE,
+    limit: int | None = None,
+) -> int:
+    """Count the number of lines in a file.
+
+    Counts line breaks on raw bytes rather than decoding and iterating lines, but
+    matches text-mode iteration exactly: "\\n", "\\r\\n" and a lone "\\r" each end a
+    line, and a final line without a line break still counts.
+
+    Args:
+        file_path: Path to the file
+        validate_utf8: Also check that the file is valid UTF-8 (pure ASCII chunks
+            are accepted without decoding)
+        chunk_size: Number of bytes read at a time
+        limit: Stop reading once the file is known to have more lines than this;
+            the result is then only a lower bound greater than limit
+
+    Returns:
+        Number of lines, or -1 if the file cannot be read or is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")() if validate_utf8 else None
+    line_breaks = 0
+    last_byte = b""
 
-def count_file_lines(file_path: Path) -> int:
-    """Count the number of lines in a file."""
     try:
-        with file_path.open(encoding="utf-8") as f:
-            return sum(1 for _ in f)
+        with file_path.open("rb") as f:
+            while chunk := f.read(chunk_size):
+                if decoder is not None and not (chunk.isascii() and not decoder.getstate()[0]):
+                    decoder.decode(chunk)
+
+                line_breaks += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+                # A "\r\n" split across two chunks was counted twice above
+                if last_byte == b"\r" and chunk[:1] == b"\n":
+                    line_breaks -= 1
+                last_byte = chunk[-1:]
+
+                if limit is not None and line_breaks > limit:
+                    return line_breaks
+
+            if decoder is not None:
+                decoder.decode(b"", final=True)
     except (OSError, UnicodeDecodeError):
         # Return -1 to indicate error
         return -1
+
+    if last_byte and last_byte not in b"\r\n":
+        line_breaks += 1  # Final line without a line break
+    return line_breaks
@@ -0,0 +1,29 @@
+"""Count lines for a list of files with the configured counter."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+from kdaquila_structure_lint.validation._functions.count_lines_numpy import count_lines_numpy
+
+
+def count_lines(
+    file_paths: list[Path], counter: str = "python", limit: int | None = None
+) -> list[int]:
+    """Count lines in each file, in input order (-1 on read or decode errors).
+
+    With a limit, the pure-Python counter stops reading a file as soon as it has
+    more than limit lines, so counts above limit are lower bounds. The "numpy"
+    counter reads whole files and always returns exact counts.
+
+    The "numpy" counter needs the optional numpy dependency and falls back to the
+    pure-Python counter when it is not installed.
+    """
+    if counter == "numpy" and file_paths:
+        try:
+            import numpy  # noqa: F401, PLC0415
+        except ImportError:
+            print("⚠️  Warning: numpy is not installed, using the pure-Python line counter")
+        else:
+            return count_lines_numpy(file_paths)
+
+    return [count_file_lines(file_path, limit=limit) for file_path in file_paths]
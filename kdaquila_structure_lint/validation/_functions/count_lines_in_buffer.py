@@ -0,0 +1,58 @@
+"""Count lines per file in a contiguous batch buffer."""
+
+
+def count_lines_in_buffer(
+    buffer: bytearray, offsets: list[int], failed: set[int], validate_utf8: bool
+) -> list[int]:
+    """Count lines for each file segment of a batch buffer with NumPy.
+
+    Args:
+        buffer: Contents of all files in the batch, back to back
+        offsets: Start offset of each file within buffer
+        failed: Indices of files that could not be read
+        validate_utf8: Also check that each file is valid UTF-8
+
+    Returns:
+        Line count per file (-1 for unreadable or non-UTF-8 files)
+
+    Raises:
+        ImportError: If numpy is not installed (count_lines checks first)
+    """
+    # numpy is optional, so it is only imported once the NumPy counter runs
+    import numpy as np  # noqa: PLC0415
+
+    if not buffer:
+        return [-1 if index in failed else 0 for index in range(len(offsets))]
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    starts = np.asarray(offsets, dtype=np.int64)
+    ends = np.append(starts[1:], len(data))
+
+    breaks = np.flatnonzero(data == ord("\n"))
+    carriage_returns = np.flatnonzero(data == ord("\r"))
+    if carriage_returns.size:
+        # "\n" directly after "\r" belongs to the same line break, unless the "\r"
+        # is the last byte of the previous file
+        following = carriage_returns + 1
+        following = following[following < len(data)]
+        crlf_tails = following[(data[following] == ord("\n")) & ~np.isin(following, starts)]
+        breaks = np.union1d(np.setdiff1d(breaks, crlf_tails), carriage_returns)
+
+    line_counts = np.searchsorted(breaks, ends) - np.searchsorted(breaks, starts)
+
+    # Final line without a line break
+    non_empty = ends > starts
+    last_bytes = data[np.where(non_empty, ends - 1, 0)]
+    line_counts += non_empty & (last_bytes != ord("\n")) & (last_bytes != ord("\r"))
+
+    results: list[int] = line_counts.tolist()
+    check_utf8 = validate_utf8 and not buffer.isascii()
+    for index, (start, end) in enumerate(zip(offsets, ends.tolist(), strict=True)):
+        if index in failed:
+            results[index] = -1
+        elif check_utf8:
+            try:
+                buffer[start:end].decode("utf-8")
+            except UnicodeDecodeError:
+                results[index] = -1
+    return results
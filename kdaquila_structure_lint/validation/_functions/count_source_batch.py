@@ -0,0 +1,30 @@
+"""Count lines for a batch of discovered source files at once."""
+
+from collections.abc import Iterable
+
+from kdaquila_structure_lint.validation._functions.count_lines import count_lines
+from kdaquila_structure_lint.validation._types import SourceFile, TimeBudget
+
+
+def count_source_batch(
+    source_files: Iterable[SourceFile],
+    counter: str,
+    limit: int | None = None,
+    budget: TimeBudget | None = None,
+) -> list[tuple[SourceFile, int]]:
+    """Count lines in all source_files with a single count_lines call.
+
+    The batch is read at once, so a time budget is all or nothing: if it has run
+    out before the batch starts, every file is skipped.
+
+    Returns:
+        (file, line count) pairs in input order
+    """
+    if budget is not None and budget.expired():
+        budget.skipped.update(f.path for f in source_files)
+        return []
+    batch = list(source_files)
+    if budget is not None:
+        budget.checked.update(f.path for f in batch)
+    counts = count_lines([f.path for f in batch], counter, limit)
+    return list(zip(batch, counts, strict=True))
@@ -0,0 +1,17 @@
+"""Create the cache directory on first use."""
+
+from pathlib import Path
+
+
+def create_cache_dir(cache_dir: Path) -> None:
+    """Create cache_dir, if missing, with a .gitignore that ignores all of it.
+
+    An existing directory is left as it is, so pointing cache_dir at a directory
+    with other content never adds a .gitignore to it.
+
+    Raises:
+        OSError: If the directory cannot be created
+    """
+    if not cache_dir.is_dir():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
@@ -0,0 +1,29 @@
+"""Create the directory index for a run."""
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._constants.exclude_dirs import EXCLUDE_DIRS
+from kdaquila_structure_lint.validation._functions.load_listing_snapshot import (
+    load_listing_snapshot,
+)
+from kdaquila_structure_lint.validation._functions.open_facts_cache import open_facts_cache
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def create_directory_index(config: Config) -> DirectoryIndex:
+    """Create an empty directory index honoring the discovery settings in config.
+
+    With cache_dir set, the listing snapshot of the previous run is loaded and the
+    file facts cache opened too.
+    """
+    snapshot = None
+    if config.cache_dir is not None:
+        snapshot = load_listing_snapshot(config.project_root / config.cache_dir)
+    return DirectoryIndex(
+        exclude=EXCLUDE_DIRS.union(config.exclude),
+        respect_gitignore=config.respect_gitignore,
+        discovery=config.discovery,
+        follow_symlinks=config.follow_symlinks,
+        dirty_first=config.dirty_first,
+        snapshot=snapshot,
+        facts=open_facts_cache(config),
+    )
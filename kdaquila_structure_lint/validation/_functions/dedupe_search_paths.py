@@ -0,0 +1,57 @@
+"""Collapse overlapping search paths before discovery."""
+
+from pathlib import Path
+from typing import Any
+
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def dedupe_search_paths(
+    project_root: Path, search_paths: list[str], index: DirectoryIndex | None = None
+) -> list[str]:
+    """Drop search paths already covered by another entry, warning about each.
+
+    Entries are resolved (following symlinks) and inserted into a trie of path
+    components, shallowest first, so an entry is dropped if it resolves to the
+    same directory as an earlier one or lies inside another entry. Every file is
+    then discovered under exactly one search path. With the run's directory
+    index, the result is computed (and warnings printed) once per run, however
+    many validators ask.
+
+    Returns:
+        The remaining entries in their configured order (missing paths are kept,
+        so validators can report them)
+    """
+    memo_key = (project_root, tuple(search_paths))
+    if index is not None and memo_key in index.search_paths:
+        return index.search_paths[memo_key]
+    resolved = [(project_root / entry).resolve() for entry in search_paths]
+    # Nested dicts keyed by path component; "" marks a kept entry ("" is never a part)
+    trie: dict[str, Any] = {}
+    kept: set[int] = set()
+    for position in sorted(range(len(search_paths)), key=lambda i: len(resolved[i].parts)):
+        node = trie
+        covering: int | None = None
+        for part in resolved[position].parts:
+            if "" in node:
+                covering = node[""]
+                break
+            node = node.setdefault(part, {})
+        else:
+            covering = node.get("")
+
+        entry = search_paths[position]
+        if covering is None:
+            node[""] = position
+            kept.add(position)
+        elif resolved[covering] == resolved[position]:
+            print(
+                f"⚠️  Warning: {entry}/ is the same directory as "
+                f"{search_paths[covering]}/, skipping"
+            )
+        else:
+            print(f"⚠️  Warning: {entry}/ is inside {search_paths[covering]}/, skipping")
+    deduped = [entry for position, entry in enumerate(search_paths) if position in kept]
+    if index is not None:
+        index.search_paths[memo_key] = deduped
+    return deduped
@@ -0,0 +1,40 @@
+"""Remove gitignored entries from a directory listing."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.get_ignore_files import get_ignore_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex, DirectoryListing, IgnoreFile
+
+
+def filter_gitignored(
+    index: DirectoryIndex, directory: Path, listing: DirectoryListing
+) -> DirectoryListing:
+    """Return listing without the entries ignored by git.
+
+    Ignore files are consulted from the innermost outwards and the first one with
+    a matching pattern decides, as in git. Ignored directories are dropped from
+    the listing, so walks never descend into them.
+    """
+    ignore_files = get_ignore_files(index, directory, listing)
+    if not ignore_files:
+        return listing
+
+    # Path of directory relative to each ignore file's base, innermost first
+    scoped: list[tuple[str, IgnoreFile]] = []
+    for ignore_file in reversed(ignore_files):
+        prefix = directory.relative_to(ignore_file.base).as_posix()
+        scoped.append(("" if prefix == "." else prefix + "/", ignore_file))
+
+    def is_ignored(name: str, is_dir: bool) -> bool:
+        for prefix, ignore_file in scoped:
+            decision = ignore_file.match(prefix + name, is_dir)
+            if decision is not None:
+                return decision
+        return False
+
+    return replace(
+        listing,
+        directories=[d for d in listing.directories if not is_ignored(d, True)],
+        files=[f for f in listing.files if not is_ignored(f, False)],
+    )
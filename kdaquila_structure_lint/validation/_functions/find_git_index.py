@@ -0,0 +1,28 @@
+"""Locate the git index file for a path."""
+
+from pathlib import Path
+
+
+def find_git_index(path: Path) -> tuple[Path, Path] | None:
+    """Find the work tree containing path and its index file.
+
+    Looks for a .git directory in path and its parents. A .git file (linked
+    worktree or submodule) is followed through its "gitdir:" line.
+
+    Returns:
+        (work tree root, index file) or None if path is not in a git work tree
+    """
+    for directory in (path, *path.parents):
+        git_path = directory / ".git"
+        if git_path.is_dir():
+            return directory, git_path / "index"
+        if git_path.is_file():
+            try:
+                first_line = git_path.read_text(encoding="utf-8").partition("\n")[0]
+            except OSError:
+                return None
+            if not first_line.startswith("gitdir:"):
+                return None
+            git_dir = directory / first_line.removeprefix("gitdir:").strip()
+            return directory, git_dir / "index"
+    return None
@@ -2,18 +2,14 @@
 
 from pathlib import Path
 
-from kdaquila_structure_lint.config._constants.defaults import DEFAULT_SUPPORTED_EXTENSIONS
-from kdaquila_structure_lint.validation._constants.exclude_dirs import EXCLUDE_DIRS
+from kdaquila_structure_lint.validation._functions.scan_source_files import scan_source_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex
 
 
-def find_source_files(root: Path, extensions: set[str] | None = None) -> list[Path]:
+def find_source_files(
+    root: Path,
+    extensions: set[str] | None = None,
+    index: DirectoryIndex | None = None,
+) -> list[Path]:
     """Find all source files in root, excluding common non-source directories."""
-    if extensions is None:
-        extensions = set(DEFAULT_SUPPORTED_EXTENSIONS)
-    source_files = []
-    for ext in extensions:
-        for file in root.rglob(f"*{ext}"):
-            if any(part in EXCLUDE_DIRS for part in file.parts):
-                continue
-            source_files.append(file)
-    return sorted(source_files, key=lambda p: p.stat().st_mtime, reverse=True)
+    return [source_file.path for source_file in scan_source_files(root, extensions, index)]
@@ -0,0 +1,43 @@
+"""Fingerprint everything a run's result depends on."""
+
+import hashlib
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.config._functions.fingerprint_config import fingerprint_config
+from kdaquila_structure_lint.validation._functions.find_git_index import find_git_index
+from kdaquila_structure_lint.validation._functions.fingerprint_tree import fingerprint_tree
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def fingerprint_run(config: Config, index: DirectoryIndex) -> str | None:
+    """Return a hex digest of the config, tool version and every search path tree.
+
+    Two runs with the same fingerprint validate the same files with the same rules,
+    so they produce the same result. With discovery = "git" only tracked files are
+    validated, so staging a file changes the result without touching the tree; the
+    index file's stat data is included then.
+
+    Returns:
+        The digest, or None if a tree cannot be fingerprinted (see fingerprint_tree)
+    """
+    run = hashlib.blake2b(fingerprint_config(config).encode("utf-8"), digest_size=16)
+    for search_path in config.search_paths:
+        path = config.project_root / search_path
+        run.update(search_path.encode("utf-8") + b"\0")
+        if not path.is_dir():
+            run.update(b"missing\0")
+            continue
+        tree = fingerprint_tree(index, path)
+        if tree is None:
+            return None
+        run.update(tree)
+        location = find_git_index(path) if config.discovery == "git" else None
+        if location is not None:
+            try:
+                stat = location[1].stat()
+            except OSError:
+                run.update(b"no index\0")
+            else:
+                # git replaces the index file on every write, so its inode changes too
+                run.update(f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+    return run.hexdigest()
@@ -0,0 +1,61 @@
+"""Fingerprint a directory tree from its listings and file stat data."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.listing_snapshot_format import (
+    LISTING_SNAPSHOT_RACY_NS,
+)
+from kdaquila_structure_lint.validation._functions.get_directory_listing import (
+    get_directory_listing,
+)
+from kdaquila_structure_lint.validation._functions.mark_visited import mark_visited
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def fingerprint_tree(index: DirectoryIndex, root: Path) -> bytes | None:
+    """Return a Merkle digest of every directory and file under root.
+
+    Each directory's digest covers its (filtered) listing, the size and
+    st_mtime_ns of each file and the digests of its subdirectories; symlinked
+    directories are descended into following the same policy as the walk. The
+    listings come through the shared index, so with a snapshot only changed
+    directories are listed, but every file is stat-ed.
+
+    Returns:
+        The digest, or None if the tree cannot be read or holds an entry modified
+        too recently for its mtime to prove it unchanged later
+    """
+    recent_ns = index.started_ns - LISTING_SNAPSHOT_RACY_NS
+    visited: set[tuple[int, int]] = set()
+
+    def digest(directory: Path) -> bytes | None:
+        listing = get_directory_listing(index, directory)
+        node = hashlib.blake2b(digest_size=16)
+        for name in listing.directories:
+            child = directory / name
+            if name in listing.linked_directories and not index.follow_symlinks:
+                node.update(b"l\0" + os.fsencode(name) + b"\0")
+            elif index.follow_symlinks and not mark_visited(visited, child):
+                node.update(b"c\0" + os.fsencode(name) + b"\0")
+            else:
+                child_digest = digest(child)
+                if child_digest is None:
+                    return None
+                node.update(b"d\0" + os.fsencode(name) + b"\0" + child_digest)
+        for name in listing.files:
+            entry = listing.file_entries.get(name)
+            stat = entry.stat() if entry is not None else (directory / name).stat()
+            if stat.st_mtime_ns >= recent_ns:
+                return None
+            node.update(b"f\0" + os.fsencode(name) + b"\0")
+            node.update(f"{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+        return node.digest()
+
+    if index.follow_symlinks:
+        mark_visited(visited, root)
+    try:
+        return digest(root)
+    except OSError:
+        return None
@@ -0,0 +1,63 @@
+"""Write the pending entries of the facts cache to its database."""
+
+import json
+import sqlite3
+
+from kdaquila_structure_lint.validation._functions.connect_facts_database import (
+    connect_facts_database,
+)
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def flush_facts_cache(cache: FactsCache, *, close: bool = False) -> None:
+    """Write pending facts and content keys in a single transaction.
+
+    Facts of a key already stored by another process are merged field by field,
+    so validators running concurrently never erase each other's facts. A cache
+    that cannot be written is only a missed speed-up, so errors are ignored and
+    the pending entries dropped.
+
+    Args:
+        cache: Facts cache to flush
+        close: Also close the database connection (it reopens on next use)
+    """
+    with cache.lock:
+        facts, cache.pending_facts = cache.pending_facts, {}
+        keys, cache.pending_keys = cache.pending_keys, {}
+        database = cache.database
+        try:
+            if facts or keys:
+                if database is None:
+                    database = connect_facts_database(cache.cache_dir, create=True)
+                    cache.database, cache.database_missing = database, False
+                if database is not None:
+                    database.execute("BEGIN IMMEDIATE")
+                    database.executemany(
+                        "INSERT INTO facts VALUES (?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT (namespace, key) DO UPDATE SET"
+                        " line_count = coalesce(excluded.line_count, line_count),"
+                        " definitions = coalesce(excluded.definitions, definitions),"
+                        " extras = coalesce(excluded.extras, extras),"
+                        " parse_error = max(excluded.parse_error, parse_error)",
+                        [
+                            (
+                                cache.namespace, key, entry.line_count,
+                                None if entry.definitions is None
+                                else json.dumps(entry.definitions),
+                                None if entry.extras is None else json.dumps(entry.extras),
+                                entry.parse_error,
+                            )
+                            for key, entry in facts.items()
+                        ],
+                    )
+                    database.executemany(
+                        "INSERT OR REPLACE INTO content_keys VALUES (?, ?, ?, ?, ?)",
+                        [(str(path), *saved) for path, saved in keys.items()],
+                    )
+                    database.execute("COMMIT")
+        except (OSError, sqlite3.Error):
+            if database is not None and database.in_transaction:
+                database.execute("ROLLBACK")
+        if close and cache.database is not None:
+            cache.database.close()
+            cache.database = None
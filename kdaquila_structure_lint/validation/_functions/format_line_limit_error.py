@@ -0,0 +1,23 @@
+"""Format line limit violations."""
+
+from pathlib import Path
+
+
+def format_line_limit_error(
+    file_path: Path, line_count: int, max_lines: int, exact: bool = True
+) -> str | None:
+    """Turn a line count into an error message, or None if within the limit.
+
+    Pass exact=False when counting stopped early, so line_count is only known to
+    be greater than max_lines.
+    """
+    if line_count == -1:
+        return f"{file_path}: Error reading file"
+
+    if line_count > max_lines:
+        if not exact:
+            return f"{file_path}: more than {max_lines} lines"
+        excess = line_count - max_lines
+        return f"{file_path}: {line_count} lines (exceeds limit by {excess})"
+
+    return None
@@ -0,0 +1,58 @@
+"""Compute the content key of a file for the facts cache."""
+
+import hashlib
+import time
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.facts_database_format import (
+    FACTS_DATABASE_BATCH_SIZE,
+)
+from kdaquila_structure_lint.validation._constants.read_chunk_size import READ_CHUNK_SIZE
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.get_git_object_id import get_git_object_id
+from kdaquila_structure_lint.validation._functions.read_saved_content_key import (
+    read_saved_content_key,
+)
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def get_content_key(cache: FactsCache, path: Path) -> str | None:
+    """Return the key of the facts of path, computing it once per run.
+
+    The key is a digest of the file's bytes followed by its lowercased suffix,
+    since the suffix selects the parser: identical contents parsed as Python
+    and as TypeScript have different facts. A tracked file whose stat data
+    matches its git index entry is keyed by the blob ID git already recorded,
+    and any other file whose stat data matches the digest saved for its path by
+    an earlier run reuses that digest, so neither is read. Remaining files are
+    keyed by a BLAKE2b hash of their content, which is saved with their stat
+    data for the next run. The stat data the key was computed from is kept in
+    cache.stats, so facts parsed from a later read can be checked against it.
+
+    Returns:
+        Hex digest and suffix (e.g. "3b18e5...9c.py"), or None if the file
+        cannot be read
+    """
+    if path in cache.keys:
+        return cache.keys[path]
+    key: str | None = None
+    try:
+        stat = path.stat()
+        cache.stats[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        digest = get_git_object_id(cache, path, stat) or read_saved_content_key(cache, path, stat)
+        if digest is None:
+            hashed_ns = time.time_ns()
+            content_hash = hashlib.blake2b(digest_size=20)
+            with path.open("rb") as f:
+                while chunk := f.read(READ_CHUNK_SIZE):
+                    content_hash.update(chunk)
+            digest = content_hash.hexdigest()
+            with cache.lock:
+                cache.pending_keys[path] = (stat.st_size, stat.st_mtime_ns, hashed_ns, digest)
+                if len(cache.pending_facts) + len(cache.pending_keys) >= FACTS_DATABASE_BATCH_SIZE:
+                    flush_facts_cache(cache)
+        key = digest + path.suffix.lower()
+    except OSError:
+        key = None
+    cache.keys[path] = key
+    return key
@@ -0,0 +1,41 @@
+"""Parse the top-level definitions of a file through the facts cache."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from kdaquila_structure_lint.definition_counter import (
+    count_top_level_definitions,
+    detect_extra_definitions,
+)
+from kdaquila_structure_lint.validation._functions.get_content_key import get_content_key
+from kdaquila_structure_lint.validation._functions.is_content_key_current import (
+    is_content_key_current,
+)
+from kdaquila_structure_lint.validation._functions.read_file_facts import read_file_facts
+from kdaquila_structure_lint.validation._functions.write_file_facts import write_file_facts
+from kdaquila_structure_lint.validation._types import FactsCache, FileFacts
+
+
+def get_definition_facts(path: Path, cache: FactsCache | None = None) -> FileFacts:
+    """Return the definitions (and, for at most one, the extras) of path.
+
+    With a cache, a content that was parsed before is not parsed again, and facts
+    are only stored if the file did not change while being parsed. Extra
+    definitions are only looked for in files with at most one definition, the
+    only files they are reported for.
+    """
+    key = None if cache is None else get_content_key(cache, path)
+    facts = FileFacts() if cache is None or key is None else read_file_facts(cache, key)
+    if facts.definitions is not None or facts.parse_error:
+        return facts
+
+    result = count_top_level_definitions(path)
+    if result is None:
+        facts = replace(facts, parse_error=True)
+    else:
+        names = tuple(result[1])
+        extras = detect_extra_definitions(path) if len(names) <= 1 else None
+        facts = replace(facts, definitions=names, extras=None if extras is None else tuple(extras))
+    if cache is not None and key is not None and is_content_key_current(cache, path):
+        write_file_facts(cache, key, facts)
+    return facts
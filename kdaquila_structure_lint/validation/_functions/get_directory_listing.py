@@ -0,0 +1,36 @@
+"""Look up a directory listing in the shared index."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+from kdaquila_structure_lint.validation._functions.filter_gitignored import filter_gitignored
+from kdaquila_structure_lint.validation._functions.read_directory import read_directory
+from kdaquila_structure_lint.validation._types import DirectoryIndex, DirectoryListing
+
+
+def get_directory_listing(index: DirectoryIndex, path: Path) -> DirectoryListing:
+    """Return the listing of path, listing the directory only on first use.
+
+    The directory is read through read_directory, so with a snapshot an unchanged
+    directory is not listed at all.
+
+    Entries matching index.exclude are left out, and with index.respect_gitignore
+    so are entries ignored by git.
+    """
+    listing = index.listings.get(path)
+    if listing is None:
+        listing = read_directory(index, path)
+        # Gitignore lookup needs the raw listing to find .git and .gitignore
+        if index.respect_gitignore:
+            listing = filter_gitignored(index, path, listing)
+        excluded = compile_name_matcher(index.exclude)
+        listing = replace(
+            listing,
+            directories=[d for d in listing.directories if not excluded.matches(d)],
+            files=[f for f in listing.files if not excluded.matches(f)],
+        )
+        index.listings[path] = listing
+    return listing
@@ -0,0 +1,44 @@
+"""Find the files modified or staged in git."""
+
+import os
+import subprocess
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.find_git_index import find_git_index
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def get_dirty_files(index: DirectoryIndex, root: Path) -> frozenset[Path]:
+    """Return the modified and staged files under root, if dirty_first is set.
+
+    Runs a single "git status --porcelain -z" per work tree and run; untracked
+    files are not included. Outside a git work tree, or if git is unavailable or
+    fails, no file is dirty.
+    """
+    if not index.dirty_first:
+        return frozenset()
+    located = find_git_index(root)
+    if located is None:
+        return frozenset()
+    work_tree = located[0]
+
+    dirty = index.dirty_files.get(work_tree)
+    if dirty is None:
+        try:
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "-z", "--untracked-files=no", "--no-renames"],
+                cwd=work_tree,
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            dirty = frozenset()
+        else:
+            # Each entry is "XY path"; paths are relative to the work tree
+            dirty = frozenset(
+                work_tree / os.fsdecode(entry[3:])
+                for entry in status.stdout.split(b"\0")
+                if len(entry) > 3
+            )
+        index.dirty_files[work_tree] = dirty
+    return frozenset(path for path in dirty if path.is_relative_to(root))
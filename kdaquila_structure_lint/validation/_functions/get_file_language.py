@@ -0,0 +1,8 @@
+"""Determines which language's one-per-file rules apply to a source file."""
+
+from pathlib import Path
+
+
+def get_file_language(file_path: Path) -> str:
+    """Return "ts" for TypeScript files (.ts, .tsx) and "py" for all others."""
+    return "ts" if file_path.suffix in {".ts", ".tsx"} else "py"
@@ -0,0 +1,40 @@
+"""Look up the git blob ID of an unmodified tracked file."""
+
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.find_git_index import find_git_index
+from kdaquila_structure_lint.validation._functions.read_clean_git_entries import (
+    read_clean_git_entries,
+)
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def get_git_object_id(cache: FactsCache, path: Path, stat: os.stat_result) -> str | None:
+    """Return the blob ID git recorded for path, if the file is unchanged since.
+
+    The file counts as unchanged when its size and mtime (to the nanosecond)
+    equal the stat data in its index entry, the check git itself makes with
+    core.checkStat = minimal. Each index is parsed once per run.
+
+    Args:
+        cache: Facts cache memoizing index locations and entries
+        path: Absolute path of the file
+        stat: Current stat result of the file
+
+    Returns:
+        Hex object ID, or None if the file is untracked, modified or racy
+    """
+    directory = path.parent
+    if directory not in cache.git_indexes:
+        location = find_git_index(directory)
+        cache.git_indexes[directory] = None if location is None else location[1]
+        if location is not None and location[1] not in cache.git_entries:
+            cache.git_entries[location[1]] = read_clean_git_entries(*location)
+    index_file = cache.git_indexes[directory]
+    if index_file is None:
+        return None
+    entry = cache.git_entries[index_file].get(path)
+    if entry is None or entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+        return None
+    return entry.object_id
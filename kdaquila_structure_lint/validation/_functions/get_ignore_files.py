@@ -0,0 +1,45 @@
+"""Look up the ignore files that apply to a directory."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.load_ignore_file import load_ignore_file
+from kdaquila_structure_lint.validation._types import DirectoryIndex, DirectoryListing, IgnoreFile
+
+
+def get_ignore_files(
+    index: DirectoryIndex, directory: Path, listing: DirectoryListing
+) -> tuple[IgnoreFile, ...] | None:
+    """Return the ignore files in effect for entries of directory, outermost first.
+
+    These are .git/info/exclude of the enclosing repository followed by every
+    .gitignore from the repository root down to directory. Results are memoized
+    in the index, so each .gitignore is read once per run. The unfiltered listing
+    of directory is used to look for .git and .gitignore without extra stat calls;
+    ancestors that were never listed are checked directly.
+
+    Returns None if directory is not inside a git work tree.
+    """
+    chain: list[tuple[Path, set[str] | None]] = []
+    current: Path = directory
+    names: set[str] | None = {*listing.directories, *listing.files}
+    while current not in index.ignore_files:
+        chain.append((current, names))
+        is_root = ".git" in names if names is not None else (current / ".git").exists()
+        if is_root:
+            exclude = load_ignore_file(current, current / ".git" / "info" / "exclude")
+            inherited: tuple[IgnoreFile, ...] | None = () if exclude is None else (exclude,)
+            break
+        if current.parent == current:
+            inherited = None
+            break
+        current, names = current.parent, None
+    else:
+        inherited = index.ignore_files[current]
+
+    for path, path_names in reversed(chain):
+        if inherited is not None and (path_names is None or ".gitignore" in path_names):
+            own = load_ignore_file(path, path / ".gitignore")
+            if own is not None:
+                inherited = (*inherited, own)
+        index.ignore_files[path] = inherited
+    return inherited
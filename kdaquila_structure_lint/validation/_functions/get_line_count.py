@@ -0,0 +1,31 @@
+"""Count the lines of a file through the facts cache."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+from kdaquila_structure_lint.validation._functions.get_content_key import get_content_key
+from kdaquila_structure_lint.validation._functions.is_content_key_current import (
+    is_content_key_current,
+)
+from kdaquila_structure_lint.validation._functions.read_file_facts import read_file_facts
+from kdaquila_structure_lint.validation._functions.write_file_facts import write_file_facts
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def get_line_count(cache: FactsCache, path: Path) -> int:
+    """Return the exact line count of path, counting only content not seen before.
+
+    Returns:
+        Number of lines, or -1 if the file cannot be read or is not valid UTF-8
+    """
+    key = get_content_key(cache, path)
+    if key is None:
+        return -1
+    facts = read_file_facts(cache, key)
+    line_count = facts.line_count
+    if line_count is None:
+        line_count = count_file_lines(path)
+        if is_content_key_current(cache, path):
+            write_file_facts(cache, key, replace(facts, line_count=line_count))
+    return line_count
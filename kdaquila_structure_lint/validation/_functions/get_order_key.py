@@ -0,0 +1,22 @@
+"""Sort keys for the file ordering strategies."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types import SourceFile
+
+
+def get_order_key(order: str) -> Callable[[SourceFile], tuple[float, Path]] | None:
+    """Return the sort key for an order setting, or None to keep walk order.
+
+    "mtime" puts the most recently modified files first and "size" the largest;
+    both break ties by path. "path" sorts by path alone, and "none" keeps the
+    order in which discovery found the files.
+    """
+    if order == "mtime":
+        return lambda source_file: (-(source_file.mtime or 0.0), source_file.path)
+    if order == "size":
+        return lambda source_file: (-(source_file.size or 0), source_file.path)
+    if order == "path":
+        return lambda source_file: (0.0, source_file.path)
+    return None
@@ -0,0 +1,25 @@
+"""Determines which one-per-file rule applies to a language in a standard folder."""
+
+from kdaquila_structure_lint.config import Config
+
+
+def get_rule_for_language(lang: str, folder: str | None, config: Config) -> bool | None:
+    """
+    Get the applicable rule for a language ("py" or "ts") in a standard folder.
+
+    Returns True if rule is enabled, False if disabled, None if no rule applies.
+    """
+    if folder is None:
+        return None  # File not in a standard folder - no validation
+
+    # Map folder to rule
+    rule_map = {
+        ("ts", "_functions"): config.one_per_file.ts_fun_in_functions,
+        ("ts", "_components"): config.one_per_file.ts_fun_in_components,
+        ("ts", "_hooks"): config.one_per_file.ts_fun_in_hooks,
+        ("ts", "_classes"): config.one_per_file.ts_cls_in_classes,
+        ("py", "_functions"): config.one_per_file.py_fun_in_functions,
+        ("py", "_classes"): config.one_per_file.py_cls_in_classes,
+    }
+
+    return rule_map.get((lang, folder))  # Returns None for _types, _constants, etc.
@@ -0,0 +1,8 @@
+"""Resolve the file suffixes that discovery treats as source files."""
+
+from kdaquila_structure_lint.config._constants.defaults import DEFAULT_SUPPORTED_EXTENSIONS
+
+
+def get_source_suffixes(extensions: set[str] | None = None) -> tuple[str, ...]:
+    """Return extensions (the supported extensions if None) for str.endswith."""
+    return tuple(DEFAULT_SUPPORTED_EXTENSIONS if extensions is None else extensions)
@@ -0,0 +1,19 @@
+"""Check that a file still matches the stat data its content key came from."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def is_content_key_current(cache: FactsCache, path: Path) -> bool:
+    """Check whether path is unchanged since get_content_key read it.
+
+    Facts are computed from a second read of the file; if it was edited in
+    between, they describe other content than the key and must not be stored
+    under it.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return cache.stats.get(path) == (stat.st_ino, stat.st_size, stat.st_mtime_ns)
@@ -4,11 +4,13 @@ Provides pattern matching to exclude certain files from validation based on
 configurable glob patterns.
 """
 
-from fnmatch import fnmatch
 from pathlib import Path
 
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+
 
 def is_excluded(file_path: Path, excluded_patterns: list[str]) -> bool:
     """Check if file matches any excluded pattern."""
-    file_name = file_path.name
-    return any(fnmatch(file_name, pattern) for pattern in excluded_patterns)
+    return compile_name_matcher(frozenset(excluded_patterns)).matches(file_path.name)
@@ -0,0 +1,101 @@
+"""Iterative traversal engine for the structure validator."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.config._constants.defaults import DEFAULT_SUPPORTED_EXTENSIONS
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
+from kdaquila_structure_lint.validation._functions.get_directory_listing import (
+    get_directory_listing,
+)
+from kdaquila_structure_lint.validation._functions.get_forbidden_folder_names import (
+    get_forbidden_folder_names,
+)
+from kdaquila_structure_lint.validation._functions.mark_visited import mark_visited
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def iter_folder_violations(
+    path: Path, config: Config, depth: int = 0, index: DirectoryIndex | None = None
+) -> Iterator[str]:
+    """Yield structure violations for the folder tree rooted at path.
+
+    Rules:
+    1. Standard folders cannot contain subdirectories
+    2. Folders cannot use the non-underscore name of a standard folder
+    3. Feature folders cannot nest deeper than folder_depth
+    4. Only certain files are allowed outside standard folders
+
+    Folders are visited depth-first with an explicit work stack, so very deep trees
+    never grow the Python call stack and no intermediate error lists are built.
+    Violations are yielded in the same pre-order a recursive walk would produce;
+    callers can stop consuming at any time to cancel the traversal. Symlinked
+    folders are entered like any other folder (a symlink cycle ends at
+    folder_depth); with index.follow_symlinks each physical directory is entered
+    only once.
+
+    Args:
+        path: The folder path to validate.
+        config: The configuration object.
+        depth: Depth level of path (0 = direct child of base folder).
+        index: Shared directory index; listings already taken by other validators
+            in this run are reused instead of listing the directory again.
+    """
+    if index is None:
+        index = create_directory_index(config)
+    structure = config.structure
+    forbidden_names = get_forbidden_folder_names(structure.standard_folders)
+    ignored = compile_name_matcher(frozenset(structure.ignored_folders))
+
+    # Children are pushed in reverse so they are popped in sorted order
+    stack: list[tuple[Path, int]] = [(path, depth)]
+    visited: set[tuple[int, int]] = set()  # Physical directories, when following symlinks
+    follow_symlinks = index.follow_symlinks
+
+    def may_enter(folder: Path) -> bool:
+        """Apply the symlink policy; checked only right before a folder is listed."""
+        return not follow_symlinks or mark_visited(visited, folder)
+
+    while stack:
+        folder, folder_depth = stack.pop()
+        name = folder.name
+
+        if name in structure.standard_folders:
+            if not may_enter(folder):
+                continue
+            listing = get_directory_listing(index, folder)
+            if any(not ignored.matches(d) for d in listing.directories):
+                yield f"{folder}: Standard folder cannot have subdirectories"
+            continue
+
+        if name in forbidden_names:
+            yield f"{folder}: Folder name '{name}' is forbidden (use underscore prefix: _{name})"
+            continue
+
+        if folder_depth > structure.folder_depth:
+            yield f"{folder}: Exceeds max depth of {structure.folder_depth}"
+            continue
+
+        if not may_enter(folder):
+            continue
+        listing = get_directory_listing(index, folder)
+
+        disallowed = [
+            f for f in listing.files
+            if Path(f).suffix in DEFAULT_SUPPORTED_EXTENSIONS
+            and f not in structure.files_allowed_anywhere
+        ]
+        if disallowed:
+            yield f"{folder}: Disallowed files: {disallowed}"
+
+        stack.extend(
+            (folder / d, folder_depth + 1)
+            for d in reversed(listing.directories)
+            if not ignored.matches(d)
+        )
@@ -0,0 +1,80 @@
+"""Schedule source files for analysis, git-dirty files first."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.get_directory_listing import (
+    get_directory_listing,
+)
+from kdaquila_structure_lint.validation._functions.get_dirty_files import get_dirty_files
+from kdaquila_structure_lint.validation._functions.get_order_key import get_order_key
+from kdaquila_structure_lint.validation._functions.get_source_suffixes import get_source_suffixes
+from kdaquila_structure_lint.validation._functions.iter_source_files import iter_source_files
+from kdaquila_structure_lint.validation._functions.scan_git_index import scan_git_index
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile
+
+
+def iter_scheduled_files(
+    root: Path,
+    index: DirectoryIndex,
+    stat_files: bool = True,
+    newest_first: bool = False,
+) -> Generator[SourceFile, None, None]:
+    """Yield the source files in root in the order they should be analyzed.
+
+    With index.dirty_first, files modified or staged in git are yielded before the
+    walk starts, so they are analyzed first; the walk then skips them. A dirty file
+    is only yielded if the walk would find it: with index.discovery == "git", if
+    the git index lists it (so no directory is listed), and otherwise through the
+    (shared) listings of its parent directories. The remaining files stream in walk
+    order (see iter_source_files), or newest first with newest_first, which needs
+    the whole walk before the first of them is yielded.
+    """
+
+    suffixes = get_source_suffixes()
+    tracked = None
+    if index.discovery == "git" and index.dirty_first:
+        tracked = scan_git_index(root, index, suffixes)
+    tracked_paths = None if tracked is None else {f.path for f in tracked}
+
+    def is_reachable(path: Path) -> bool:
+        """Check whether discovery from root would find path."""
+        if tracked_paths is not None:
+            return path in tracked_paths
+        directory = root
+        for part in path.relative_to(root).parts[:-1]:
+            listing = get_directory_listing(index, directory)
+            if part not in listing.directories:
+                return False
+            if part in listing.linked_directories and not index.follow_symlinks:
+                return False
+            directory = directory / part
+        return path.name in get_directory_listing(index, directory).files
+
+    dirty: list[SourceFile] = []
+    for path in sorted(get_dirty_files(index, root)):
+        if not path.name.endswith(suffixes):
+            continue
+        try:
+            if not is_reachable(path):
+                continue
+            if stat_files:
+                stat = path.stat()
+                dirty.append(SourceFile(path, stat.st_size, stat.st_mtime))
+            else:
+                dirty.append(SourceFile(path, None, None))
+        except OSError:
+            continue
+    # Recency order sorts the dirty files and the rest separately
+    order_key = get_order_key("mtime" if newest_first else "none")
+    if order_key is not None:
+        dirty.sort(key=order_key)
+    yield from dirty
+
+    scheduled = {source_file.path for source_file in dirty}
+    rest = (
+        source_file
+        for source_file in iter_source_files(root, index=index, stat_files=stat_files)
+        if source_file.path not in scheduled
+    )
+    yield from rest if order_key is None else sorted(rest, key=order_key)
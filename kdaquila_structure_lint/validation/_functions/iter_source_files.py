@@ -0,0 +1,101 @@
+"""Stream source files out of a directory walk."""
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.get_directory_listing import (
+    get_directory_listing,
+)
+from kdaquila_structure_lint.validation._functions.get_source_suffixes import get_source_suffixes
+from kdaquila_structure_lint.validation._functions.mark_visited import mark_visited
+from kdaquila_structure_lint.validation._functions.scan_git_index import scan_git_index
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile
+
+
+def iter_source_files(
+    root: Path,
+    extensions: set[str] | None = None,
+    index: DirectoryIndex | None = None,
+    stat_files: bool = True,
+) -> Generator[SourceFile, None, None]:
+    """Yield source files in root as the walk finds them, in walk order.
+
+    Directories are listed through the shared index, so a tree already walked by
+    another validator in the same run is not listed again; excluded directories
+    are pruned instead of being walked and filtered afterwards. Each source file
+    is stat-ed once. Symlinked directories are walked only with
+    index.follow_symlinks, and then each physical directory once; a file reachable
+    through several paths (file symlinks, hard links) is yielded once. With
+    index.discovery == "git", tracked files are read from the git index instead,
+    and the walk is only used outside a git work tree.
+
+    With stat_files=False, files are not stat-ed (size and mtime are None) unless
+    following symlinks requires their identity; hard links are then not detected.
+    Otherwise the stat comes from the listing's DirEntry, so it is taken at most once.
+
+    Once a walk for the default extensions (with stat data) runs to completion,
+    its files are kept in the index and later calls for the same root replay them
+    without walking.
+    """
+    if index is None:
+        index = DirectoryIndex()
+    if extensions is None:
+        cached = index.source_files.get(root)
+        if cached is not None:
+            yield from cached
+            return
+    suffixes = get_source_suffixes(extensions)
+
+    tracked = scan_git_index(root, index, suffixes) if index.discovery == "git" else None
+    found: list[SourceFile] = [] if tracked is None else tracked
+    yield from found
+    pending = [root] if tracked is None else []
+    # (st_dev, st_ino) of walked directories and found files, so that no physical
+    # directory is walked twice and no file is reported under two paths
+    visited_dirs: set[tuple[int, int]] = set()
+    seen_files: set[tuple[int, int]] = set()
+    real_root = ""
+    while pending:
+        directory = pending.pop()
+        if index.follow_symlinks and not mark_visited(visited_dirs, directory):
+            continue
+        try:
+            listing = get_directory_listing(index, directory)
+        except OSError:
+            continue
+
+        # Symlinked directories are only followed if the policy allows it
+        pending.extend(
+            directory / d
+            for d in listing.directories
+            if index.follow_symlinks or d not in listing.linked_directories
+        )
+        for name in listing.files:
+            if not name.endswith(suffixes):
+                continue
+            file_path = directory / name
+            entry = listing.file_entries.get(name)
+            if stat_files or index.follow_symlinks:
+                try:
+                    stat = entry.stat() if entry is not None else file_path.stat()
+                except OSError:
+                    continue
+                identity = (stat.st_dev, stat.st_ino)
+                if stat.st_ino and identity in seen_files:
+                    continue
+                seen_files.add(identity)
+                source_file = SourceFile(file_path, stat.st_size, stat.st_mtime)
+            else:
+                # Without stat data, a file symlink is skipped if its target lies
+                # in root, where the walk finds the target itself
+                if name in listing.linked_files:
+                    real_root = real_root or os.path.realpath(root) + os.sep
+                    if os.path.realpath(file_path).startswith(real_root):
+                        continue
+                source_file = SourceFile(file_path, None, None)
+            found.append(source_file)
+            yield source_file
+
+    if extensions is None and (stat_files or index.follow_symlinks):
+        index.source_files[root] = found
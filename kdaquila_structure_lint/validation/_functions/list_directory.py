@@ -0,0 +1,38 @@
+"""List a directory with a single scandir call."""
+
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types import DirectoryListing
+
+
+def list_directory(path: Path) -> DirectoryListing:
+    """List subdirectories and files of path with one os.scandir call.
+
+    Entry types come from the DirEntry, which caches them from the directory read
+    on most platforms, so no extra stat is issued per entry (only symlinks are
+    resolved, matching Path.is_dir/is_file).
+    """
+    directories: list[str] = []
+    files: list[str] = []
+    linked_directories: set[str] = set()
+    linked_files: set[str] = set()
+    file_entries: dict[str, os.DirEntry[str]] = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                directories.append(entry.name)
+                if entry.is_symlink():
+                    linked_directories.add(entry.name)
+            elif entry.is_file():
+                files.append(entry.name)
+                file_entries[entry.name] = entry
+                if entry.is_symlink():
+                    linked_files.add(entry.name)
+    return DirectoryListing(
+        sorted(directories),
+        sorted(files),
+        frozenset(linked_directories),
+        frozenset(linked_files),
+        file_entries,
+    )
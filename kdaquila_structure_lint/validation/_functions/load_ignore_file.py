@@ -0,0 +1,21 @@
+"""Read and compile a .gitignore file."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.compile_ignore_rule import compile_ignore_rule
+from kdaquila_structure_lint.validation._types import IgnoreFile
+
+
+def load_ignore_file(base: Path, path: Path) -> IgnoreFile | None:
+    """Compile the ignore file at path, with patterns relative to base.
+
+    Returns None if the file cannot be read or holds no patterns.
+    """
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    rules = tuple(
+        rule for rule in map(compile_ignore_rule, text.splitlines()) if rule is not None
+    )
+    return IgnoreFile(base, rules) if rules else None
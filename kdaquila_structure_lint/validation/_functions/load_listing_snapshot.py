@@ -0,0 +1,38 @@
+"""Load the directory listing snapshot saved by a previous run."""
+
+import json
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.listing_snapshot_format import (
+    LISTING_SNAPSHOT_FILE,
+    LISTING_SNAPSHOT_VERSION,
+)
+from kdaquila_structure_lint.validation._types import DirectoryListing, ListingSnapshot
+
+
+def load_listing_snapshot(cache_dir: Path) -> ListingSnapshot:
+    """Load the listing snapshot from cache_dir.
+
+    A missing, unreadable or outdated snapshot loads as an empty one, so every
+    directory is listed again.
+    """
+    try:
+        with (cache_dir / LISTING_SNAPSHOT_FILE).open(encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != LISTING_SNAPSHOT_VERSION:
+            return ListingSnapshot()
+        return ListingSnapshot(
+            created_ns=data["created_ns"],
+            listings={
+                Path(path): (
+                    mtime_ns,
+                    DirectoryListing(
+                        directories, files, frozenset(linked_dirs), frozenset(linked_files)
+                    ),
+                )
+                for path, (mtime_ns, directories, files, linked_dirs, linked_files)
+                in data["directories"].items()
+            },
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return ListingSnapshot()
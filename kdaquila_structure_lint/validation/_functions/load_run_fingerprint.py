@@ -0,0 +1,15 @@
+"""Read the fingerprint of the last successful run."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.run_fingerprint_file import (
+    RUN_FINGERPRINT_FILE,
+)
+
+
+def load_run_fingerprint(cache_dir: Path) -> str | None:
+    """Return the fingerprint saved in cache_dir, or None if there is none."""
+    try:
+        return (cache_dir / RUN_FINGERPRINT_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
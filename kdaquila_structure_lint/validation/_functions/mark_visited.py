@@ -0,0 +1,21 @@
+"""Track physical directories already visited by a walk."""
+
+from pathlib import Path
+
+
+def mark_visited(visited: set[tuple[int, int]], path: Path) -> bool:
+    """Record the (st_dev, st_ino) of path, following symlinks.
+
+    Returns:
+        True on the first visit of the physical directory, False if it was already
+        visited through another path (or cannot be stat-ed)
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    identity = (stat.st_dev, stat.st_ino)
+    if identity in visited:
+        return False
+    visited.add(identity)
+    return True
@@ -1,8 +1,15 @@
 """Pattern matching utilities for validation."""
 
-import fnmatch
+from collections.abc import Iterable
 
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
 
-def matches_any_pattern(name: str, patterns: set[str]) -> bool:
-    """Check if name matches any pattern (supports wildcards)."""
-    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+def matches_any_pattern(name: str, patterns: Iterable[str]) -> bool:
+    """Check if name matches any pattern (supports wildcards).
+
+    Hot paths should compile the patterns once with compile_name_matcher instead.
+    """
+    return compile_name_matcher(frozenset(patterns)).matches(name)
@@ -0,0 +1,21 @@
+"""Size prefilter deciding which source files the line limit check must read."""
+
+from kdaquila_structure_lint.validation._types import SourceFile
+
+
+def may_exceed_line_limit(source_file: SourceFile, max_lines: int, discovery: str) -> bool:
+    """Check whether a file could exceed max_lines, judging by its size.
+
+    Every line takes at least one byte, so a file with no more bytes than
+    max_lines cannot exceed the limit and need not be read. Sizes found through
+    discovery = "git" date from the file's last `git add`, and an unstaged edit
+    may have grown it since, so a small one is confirmed against the work tree.
+    """
+    if source_file.size is None or source_file.size > max_lines:
+        return True
+    if discovery != "git":
+        return False
+    try:
+        return source_file.path.stat().st_size > max_lines
+    except OSError:
+        return False  # Deleted from the work tree
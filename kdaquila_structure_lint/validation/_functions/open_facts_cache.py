@@ -0,0 +1,19 @@
+"""Open the file facts cache configured for a run."""
+
+from kdaquila_structure_lint import __version__
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def open_facts_cache(config: Config) -> FactsCache | None:
+    """Return the facts cache in config.cache_dir, or None if caching is off.
+
+    Entries are namespaced by the tool version only. Facts describe a file's
+    content and not whether it passes, so rules are always evaluated afresh
+    against them and changing the configuration never invalidates the cache.
+    Neither does moving it, so a cache directory restored into another checkout
+    (or another machine) is still used.
+    """
+    if config.cache_dir is None:
+        return None
+    return FactsCache(config.project_root / config.cache_dir, __version__)
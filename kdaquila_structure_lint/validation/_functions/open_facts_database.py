@@ -0,0 +1,23 @@
+"""Open the facts database of a cache for reading."""
+
+import sqlite3
+
+from kdaquila_structure_lint.validation._functions.connect_facts_database import (
+    connect_facts_database,
+)
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def open_facts_database(cache: FactsCache) -> sqlite3.Connection | None:
+    """Return the cache's database connection, connecting on first use.
+
+    The caller must hold cache.lock. A missing or unusable database is only
+    looked for once, and reads then miss until facts are written.
+
+    Returns:
+        Connection, or None if there is no usable database yet
+    """
+    if cache.database is None and not cache.database_missing:
+        cache.database = connect_facts_database(cache.cache_dir, create=False)
+        cache.database_missing = cache.database is None
+    return cache.database
@@ -0,0 +1,28 @@
+"""Read the index entries whose blob IDs can stand in for a content hash."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.read_git_hash_size import read_git_hash_size
+from kdaquila_structure_lint.validation._functions.read_git_index import read_git_index
+from kdaquila_structure_lint.validation._types import GitIndexEntry
+
+
+def read_clean_git_entries(work_tree: Path, index_file: Path) -> dict[Path, GitIndexEntry]:
+    """Map tracked paths to their index entries, leaving out racy ones.
+
+    An entry whose mtime is not older than the index file itself may have been
+    modified in the same timestamp tick as git hashed it, so its blob ID could
+    describe stale content (git's "racy clean" case). Such files are hashed
+    instead.
+
+    Returns:
+        Entries by absolute path; empty if the index is missing or unreadable
+    """
+    try:
+        index_mtime_ns = index_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    entries = read_git_index(work_tree, index_file, hash_size=read_git_hash_size(index_file))
+    return {
+        entry.path: entry for entry in entries or () if entry.mtime_ns < index_mtime_ns
+    }
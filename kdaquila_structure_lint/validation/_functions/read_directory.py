@@ -0,0 +1,35 @@
+"""List a directory, reusing the previous run's listing if it is unchanged."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.listing_snapshot_format import (
+    LISTING_SNAPSHOT_RACY_NS,
+)
+from kdaquila_structure_lint.validation._functions.list_directory import list_directory
+from kdaquila_structure_lint.validation._types import DirectoryIndex, DirectoryListing
+
+
+def read_directory(index: DirectoryIndex, path: Path) -> DirectoryListing:
+    """Return the unfiltered listing of path.
+
+    Without a snapshot this is list_directory. With one, the directory is stat-ed
+    first, and if its st_mtime_ns matches the snapshot the saved listing is used
+    instead of os.scandir (adding, removing or renaming an entry changes the
+    directory's mtime). Listings modified shortly before the snapshot's run
+    started are never reused, since a change within the same mtime tick would go
+    unnoticed. Either way the listing is recorded for the next snapshot.
+    """
+    if index.snapshot is None:
+        return list_directory(path)
+    mtime_ns = path.stat().st_mtime_ns
+    saved = index.snapshot.listings.get(path)
+    if (
+        saved is not None
+        and saved[0] == mtime_ns
+        and mtime_ns < index.snapshot.created_ns - LISTING_SNAPSHOT_RACY_NS
+    ):
+        listing = saved[1]
+    else:
+        listing = list_directory(path)
+    index.snapshot_listings[path] = (mtime_ns, listing)
+    return listing
@@ -0,0 +1,40 @@
+"""Look up the facts cached for a content key."""
+
+import json
+import sqlite3
+
+from kdaquila_structure_lint.validation._functions.open_facts_database import (
+    open_facts_database,
+)
+from kdaquila_structure_lint.validation._types import FactsCache, FileFacts
+
+
+def read_file_facts(cache: FactsCache, key: str) -> FileFacts:
+    """Return the facts cached for key (empty facts on a miss or a corrupt entry)."""
+    facts = cache.facts.get(key)
+    if facts is not None:
+        return facts
+    facts = FileFacts()
+    with cache.lock:
+        try:
+            database = open_facts_database(cache)
+            row = None if database is None else database.execute(
+                "SELECT line_count, definitions, extras, parse_error FROM facts"
+                " WHERE namespace = ? AND key = ?",
+                (cache.namespace, key),
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+    if row is not None:
+        line_count, definitions, extras, parse_error = row
+        try:
+            facts = FileFacts(
+                line_count=line_count,
+                definitions=None if definitions is None else tuple(json.loads(definitions)),
+                extras=None if extras is None else tuple(json.loads(extras)),
+                parse_error=bool(parse_error),
+            )
+        except (ValueError, TypeError):
+            facts = FileFacts()
+    cache.facts[key] = facts
+    return facts
@@ -0,0 +1,18 @@
+"""Read the object ID size used by a git repository."""
+
+import re
+from pathlib import Path
+
+
+def read_git_hash_size(index_file: Path) -> int:
+    """Return the object ID length in bytes for the repository owning index_file.
+
+    Repositories created with objectformat = sha256 use 32-byte IDs; all
+    others use 20-byte SHA-1 IDs.
+    """
+    try:
+        git_config = (index_file.parent / "config").read_text(encoding="utf-8")
+    except OSError:
+        git_config = ""
+    sha256 = re.search(r"objectformat\s*=\s*sha256", git_config, re.IGNORECASE)
+    return 32 if sha256 else 20
@@ -0,0 +1,103 @@
+"""Parse the tracked files out of a git index file."""
+
+import os
+import struct
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.git_index_format import (
+    GIT_INDEX_EXTENDED_FLAG,
+    GIT_INDEX_PARTIAL_EXTENSIONS,
+    GIT_INDEX_REGULAR_FILE,
+    GIT_INDEX_SIGNATURE,
+    GIT_INDEX_SKIP_WORKTREE_FLAG,
+    GIT_INDEX_SPARSE_DIRECTORY,
+    GIT_INDEX_VERSIONS,
+)
+from kdaquila_structure_lint.validation._types import GitIndexEntry
+
+
+def read_git_index(
+    work_tree: Path, index_file: Path, hash_size: int = 20
+) -> list[GitIndexEntry] | None:
+    """Read the regular files recorded in a git index (versions 2 to 4).
+
+    The file is parsed directly, without running git. Each entry carries the
+    size and mtime git stored for the file, so no file is stat-ed, and the ID
+    of the blob holding its content. Entries that are not regular files
+    (symlinks, submodules), are outside the sparse checkout (skip-worktree) or
+    duplicate a path (merge conflict stages) are left out. A split index or a
+    sparse index does not list every tracked file itself, so neither is used.
+
+    Args:
+        work_tree: Root of the work tree; index paths are relative to it
+        index_file: Path of the index file
+        hash_size: Object ID length in bytes (20 for SHA-1, 32 for SHA-256)
+
+    Returns:
+        Entries in index order, or None if the index is missing, cannot be parsed,
+        or is a split or sparse index
+    """
+    try:
+        data = index_file.read_bytes()
+        signature, version, count = struct.unpack_from(">4sLL", data)
+    except (OSError, struct.error):
+        return None
+    if signature != GIT_INDEX_SIGNATURE or version not in GIT_INDEX_VERSIONS:
+        return None
+
+    # ctime, mtime (seconds, nanoseconds), dev, ino, mode, uid, gid, size, object ID
+    stat_format = struct.Struct(f">LLLLLLLLLL{hash_size}sH")
+    files: list[GitIndexEntry] = []
+    previous_name = b""
+    offset = 12
+    try:
+        for _ in range(count):
+            entry_start = offset
+            (_, _, mtime_s, mtime_ns, _, _, mode, _, _, size, object_id, flags) = (
+                stat_format.unpack_from(data, offset)
+            )
+            offset += stat_format.size
+            skip_worktree = False
+            if version >= 3 and flags & GIT_INDEX_EXTENDED_FLAG:
+                (extended_flags,) = struct.unpack_from(">H", data, offset)
+                skip_worktree = bool(extended_flags & GIT_INDEX_SKIP_WORKTREE_FLAG)
+                offset += 2
+
+            if version == 4:
+                # Prefix-compressed name: bytes to drop from the previous name, then suffix
+                strip = data[offset] & 0x7F
+                while data[offset] & 0x80:
+                    offset += 1
+                    strip = ((strip + 1) << 7) | (data[offset] & 0x7F)
+                offset += 1
+                end = data.index(b"\0", offset)
+                name = previous_name[: len(previous_name) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                end = data.index(b"\0", offset)
+                name = data[offset:end]
+                # Entries are NUL-padded to a multiple of 8 bytes
+                offset = entry_start + ((end - entry_start + 8) & ~7)
+
+            if mode >> 12 == GIT_INDEX_SPARSE_DIRECTORY:
+                return None
+            if (
+                mode >> 12 == GIT_INDEX_REGULAR_FILE
+                and not skip_worktree
+                and name != previous_name
+            ):
+                files.append(GitIndexEntry(
+                    work_tree / os.fsdecode(name), size, mtime_s * 10**9 + mtime_ns,
+                    object_id.hex(),
+                ))
+            previous_name = name
+
+        # Extensions (signature, size, data) run up to the trailing checksum
+        while offset + 8 <= len(data) - hash_size:
+            extension, extension_size = struct.unpack_from(">4sL", data, offset)
+            if extension in GIT_INDEX_PARTIAL_EXTENSIONS:
+                return None
+            offset += 8 + extension_size
+    except (struct.error, ValueError, IndexError):
+        return None
+    return files
@@ -0,0 +1,40 @@
+"""Look up the content digest saved for a path by an earlier run."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.facts_database_format import (
+    FACTS_DATABASE_RACY_NS,
+)
+from kdaquila_structure_lint.validation._functions.open_facts_database import (
+    open_facts_database,
+)
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def read_saved_content_key(cache: FactsCache, path: Path, stat: os.stat_result) -> str | None:
+    """Return the content digest saved for path, if the file is unchanged since.
+
+    As with the git index, the file counts as unchanged when its size and mtime
+    equal those saved with the digest. Digests of files modified less than
+    FACTS_DATABASE_RACY_NS before they were hashed are not trusted.
+
+    Returns:
+        Hex digest, or None if no trustworthy digest was saved for path
+    """
+    with cache.lock:
+        try:
+            database = open_facts_database(cache)
+            row = None if database is None else database.execute(
+                "SELECT size, mtime_ns, hashed_ns, key FROM content_keys WHERE path = ?",
+                (str(path),),
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+    if row is None:
+        return None
+    size, mtime_ns, hashed_ns, key = row
+    if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+        return None
+    return str(key) if mtime_ns < hashed_ns - FACTS_DATABASE_RACY_NS else None
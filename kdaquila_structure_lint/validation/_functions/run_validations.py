@@ -1,14 +1,27 @@
 """Main orchestrator that runs enabled validators."""
 
+import time
+
 from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._constants.partial_coverage_exit_code import (
+    PARTIAL_COVERAGE_EXIT_CODE,
+)
+from kdaquila_structure_lint.validation._functions.check_unchanged import check_unchanged
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
+from kdaquila_structure_lint.validation._functions.save_run_cache import save_run_cache
 from kdaquila_structure_lint.validation._functions.validate_line_limits import validate_line_limits
 from kdaquila_structure_lint.validation._functions.validate_one_per_file import (
     validate_one_per_file,
 )
 from kdaquila_structure_lint.validation._functions.validate_structure import validate_structure
+from kdaquila_structure_lint.validation._types import TimeBudget
 
 
-def run_validations(config: Config, verbose: bool = False) -> int:
+def run_validations(
+    config: Config, verbose: bool = False, time_budget: float | None = None
+) -> int:
     """Run all enabled validators and return combined exit code.
 
     Strategy: Run ALL enabled validators (don't stop on first failure),
@@ -17,15 +30,33 @@ def run_validations(config: Config, verbose: bool = False) -> int:
     Args:
         config: Configuration object
         verbose: Enable verbose output
+        time_budget: Seconds after which no new file checks are started
 
     Returns:
-        0 if all pass, 1 if any fail
+        0 if all pass (or, with skip_unchanged, nothing changed since the last
+        run that did), 1 if any fail, 3 if all checked files pass but the time
+        budget ran out before every file was checked
     """
     if not config.enabled:
         print("INFO: structure-lint is disabled in configuration")
         return 0
 
     results = []
+    # Directory listings are shared, so each directory is listed once per run
+    index = create_directory_index(config)
+    budget = None
+    if time_budget is not None:
+        budget = TimeBudget(
+            deadline=time.monotonic() + time_budget, structure=config.validators.structure
+        )
+    cache_dir = None if config.cache_dir is None else config.project_root / config.cache_dir
+
+    # A tree identical to that of the last successful run passes again
+    unchanged, fingerprint = check_unchanged(config, index)
+    if unchanged and cache_dir is not None:
+        save_run_cache(index, cache_dir, fingerprint)
+        print("✓ Nothing changed since the last successful run, skipping validation")
+        return 0
 
     # Run structure validation if enabled
     if config.validators.structure:
@@ -34,21 +65,21 @@ def run_validations(config: Config, verbose: bool = False) -> int:
         print("=" * 60)
         print("Running structure validation...")
         print("=" * 60)
-        results.append(validate_structure(config))
+        results.append(validate_structure(config, index))
 
     # Run line limits validation if enabled
     if config.validators.line_limits:
         print("\n" + "=" * 60)
         print("Running line limit validation...")
         print("=" * 60)
-        results.append(validate_line_limits(config))
+        results.append(validate_line_limits(config, index, budget))
 
     # Run one-per-file validation if enabled
     if config.validators.one_per_file:
         print("\n" + "=" * 60)
         print("Running one-per-file validation...")
         print("=" * 60)
-        results.append(validate_one_per_file(config))
+        results.append(validate_one_per_file(config, index, budget))
 
     # Check if any validators ran
     if not results:
@@ -56,8 +87,22 @@ def run_validations(config: Config, verbose: bool = False) -> int:
         print("💡 Enable validators in pyproject.toml [tool.structure-lint.validators]")
         return 0
 
+    passed = all(r == 0 for r in results)
+    partial = budget is not None and bool(budget.skipped)
+    if cache_dir is not None:
+        save_run_cache(index, cache_dir, fingerprint if passed and not partial else None)
+
+    if budget is not None:
+        print(f"\n⏱️  Time budget of {time_budget:g}s: {budget.summary()}")
+
     # Report overall results
-    if all(r == 0 for r in results):
+    if passed and partial:
+        print("\n" + "=" * 60)
+        print("⚠️  Checked files passed, but coverage was partial")
+        print("=" * 60)
+        return PARTIAL_COVERAGE_EXIT_CODE
+
+    if passed:
         print("\n" + "=" * 60)
         print("✓ All validations passed!")
         print("=" * 60)
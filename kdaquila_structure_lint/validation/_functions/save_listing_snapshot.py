@@ -0,0 +1,42 @@
+"""Save the directory listings of this run for the next one."""
+
+import json
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.listing_snapshot_format import (
+    LISTING_SNAPSHOT_FILE,
+    LISTING_SNAPSHOT_VERSION,
+)
+from kdaquila_structure_lint.validation._functions.create_cache_dir import create_cache_dir
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def save_listing_snapshot(index: DirectoryIndex, cache_dir: Path) -> None:
+    """Write the listings recorded in index to cache_dir.
+
+    Only directories listed in this run are saved. The file is replaced
+    atomically, so a concurrent run reads either the old or the new snapshot.
+
+    Raises:
+        OSError: If the cache directory or file cannot be written
+    """
+    create_cache_dir(cache_dir)
+    data = {
+        "version": LISTING_SNAPSHOT_VERSION,
+        "created_ns": index.started_ns,
+        "directories": {
+            str(path): [
+                mtime_ns,
+                listing.directories,
+                listing.files,
+                sorted(listing.linked_directories),
+                sorted(listing.linked_files),
+            ]
+            for path, (mtime_ns, listing) in index.snapshot_listings.items()
+        },
+    }
+    target = cache_dir / LISTING_SNAPSHOT_FILE
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(data), encoding="utf-8")
+    temporary.replace(target)
@@ -0,0 +1,25 @@
+"""Write what a run leaves in cache_dir for the next one."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.run_fingerprint_file import (
+    RUN_FINGERPRINT_FILE,
+)
+from kdaquila_structure_lint.validation._functions.save_listing_snapshot import (
+    save_listing_snapshot,
+)
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def save_run_cache(index: DirectoryIndex, cache_dir: Path, fingerprint: str | None) -> None:
+    """Save the listing snapshot and, for a successful run, its fingerprint.
+
+    A cache that cannot be written only costs the next run its speed-up, so
+    errors are reported as a warning instead of failing the run.
+    """
+    try:
+        save_listing_snapshot(index, cache_dir)
+        if fingerprint is not None:
+            (cache_dir / RUN_FINGERPRINT_FILE).write_text(fingerprint, encoding="utf-8")
+    except OSError as e:
+        print(f"\n⚠️  Warning: could not write cache to {cache_dir}: {e}")
@@ -0,0 +1,49 @@
+"""List source files under a directory from the git index."""
+
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+from kdaquila_structure_lint.validation._functions.find_git_index import find_git_index
+from kdaquila_structure_lint.validation._functions.read_git_hash_size import read_git_hash_size
+from kdaquila_structure_lint.validation._functions.read_git_index import read_git_index
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile
+
+
+def scan_git_index(
+    root: Path, index: DirectoryIndex, suffixes: tuple[str, ...]
+) -> list[SourceFile] | None:
+    """Find tracked source files under root using the repository's index file.
+
+    The index is parsed once per run and shared through the directory index.
+    Files matching index.exclude, or inside a directory that does, are skipped,
+    as in the filesystem walk.
+
+    Returns:
+        Matching files in index order, or None if root is not in a git work tree
+        or its index cannot be read (callers then walk the filesystem)
+    """
+    location = find_git_index(root)
+    if location is None:
+        return None
+    work_tree, index_file = location
+    if index_file not in index.git_files:
+        index.git_files[index_file] = read_git_index(
+            work_tree, index_file, hash_size=read_git_hash_size(index_file)
+        )
+    tracked = index.git_files[index_file]
+    if tracked is None:
+        return None
+
+    excluded = compile_name_matcher(index.exclude)
+    prefix = str(root) + os.sep
+    source_files: list[SourceFile] = []
+    for entry in tracked:
+        path = str(entry.path)
+        if not path.startswith(prefix) or not path.endswith(suffixes):
+            continue
+        if not any(map(excluded.matches, entry.path.relative_to(root).parts)):
+            source_files.append(SourceFile(entry.path, entry.size, entry.mtime_ns / 1e9))
+    return source_files
@@ -0,0 +1,27 @@
+"""Scan directories for source files and their stat data."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.get_order_key import get_order_key
+from kdaquila_structure_lint.validation._functions.iter_source_files import iter_source_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile
+
+
+def scan_source_files(
+    root: Path,
+    extensions: set[str] | None = None,
+    index: DirectoryIndex | None = None,
+    order: str = "mtime",
+) -> list[SourceFile]:
+    """Find all source files in root, excluding common non-source directories.
+
+    Collects iter_source_files (see there for pruning, symlink and caching rules).
+
+    Returns files sorted by order (see get_order_key); the default puts the most
+    recently modified first.
+    """
+    source_files = list(iter_source_files(root, extensions, index))
+    order_key = get_order_key(order)
+    if order_key is not None:
+        source_files.sort(key=order_key)
+    return source_files
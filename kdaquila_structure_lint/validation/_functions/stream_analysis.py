@@ -0,0 +1,47 @@
+"""Overlap file discovery with analysis on a thread pool."""
+
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from kdaquila_structure_lint.validation._constants.stream_queue_size import STREAM_QUEUE_SIZE
+from kdaquila_structure_lint.validation._types import AnalysisResult, SourceFile, TimeBudget
+
+
+def stream_analysis(
+    source_files: Iterable[SourceFile],
+    analyze: Callable[[SourceFile], AnalysisResult],
+    queue_size: int = STREAM_QUEUE_SIZE,
+    budget: TimeBudget | None = None,
+) -> list[tuple[SourceFile, AnalysisResult]]:
+    """Run analyze on each file as soon as discovery yields it.
+
+    The calling thread drives source_files (typically a lazy directory walk) and
+    hands each file to a pool of analysis workers, so walking and analysis
+    overlap instead of running one after the other. At most queue_size files wait
+    for a worker; beyond that the walk pauses, which bounds memory on large trees.
+    With a budget, no file is started once its deadline has passed, and every file
+    is recorded on the budget as either checked or skipped.
+
+    Returns:
+        (file, result) pairs in discovery order; callers sort them for reporting.
+        An exception raised by analyze is re-raised here.
+    """
+    slots = threading.BoundedSemaphore(queue_size)
+    submitted: list[tuple[SourceFile, Future[AnalysisResult]]] = []
+
+    def release_slot(_: Future[AnalysisResult]) -> None:
+        slots.release()
+
+    with ThreadPoolExecutor() as executor:
+        for source_file in source_files:
+            if budget is not None:
+                if budget.expired():
+                    budget.skipped.add(source_file.path)
+                    continue
+                budget.checked.add(source_file.path)
+            slots.acquire()
+            future = executor.submit(analyze, source_file)
+            future.add_done_callback(release_slot)
+            submitted.append((source_file, future))
+        return [(source_file, future.result()) for source_file, future in submitted]
@@ -0,0 +1,23 @@
+"""Translate a .gitignore pattern to a regex."""
+
+from kdaquila_structure_lint.validation._functions.translate_gitignore_segment import (
+    translate_gitignore_segment,
+)
+
+
+def translate_gitignore_pattern(pattern: str) -> str:
+    """Translate a slash-separated .gitignore pattern to regex source.
+
+    The pattern must already have its leading and trailing slashes removed.
+    A "**" segment matches any number of directories: "**/x" matches x at any
+    depth, "x/**" everything inside x and "a/**/b" b anywhere below a.
+    """
+    segments = pattern.split("/")
+    parts: list[str] = []
+    for position, segment in enumerate(segments):
+        is_last = position == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if is_last else "(?:.*/)?")
+        else:
+            parts.append(translate_gitignore_segment(segment) + ("" if is_last else "/"))
+    return "".join(parts)
@@ -0,0 +1,35 @@
+"""Translate one path segment of a .gitignore pattern to a regex."""
+
+import re
+
+
+def translate_gitignore_segment(segment: str) -> str:
+    """Translate a segment (no slashes) of a .gitignore pattern to regex source.
+
+    Wildcards never match a slash: "*" matches any run of characters within the
+    segment, "?" matches one character and "[...]" is a character class ("[!...]"
+    negates it). A backslash makes the next character literal.
+    """
+    parts: list[str] = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "\\" and i < len(segment):
+            parts.append(re.escape(segment[i]))
+            i += 1
+        elif char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and (end := segment.find("]", i + 1)) != -1:
+            body = segment[i:end].replace("\\", "\\\\").replace("[", "\\[")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            parts.append(f"(?!/)[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
@@ -4,20 +4,66 @@ Enforces a line limit to encourage modular, focused files.
 """
 
 import sys
+from collections.abc import Iterable
 
 from kdaquila_structure_lint.config import Config
-from kdaquila_structure_lint.validation._functions.find_source_files import find_source_files
-from kdaquila_structure_lint.validation._functions.validate_file_lines import validate_file_lines
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+from kdaquila_structure_lint.validation._functions.count_source_batch import count_source_batch
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
+from kdaquila_structure_lint.validation._functions.dedupe_search_paths import (
+    dedupe_search_paths,
+)
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.format_line_limit_error import (
+    format_line_limit_error,
+)
+from kdaquila_structure_lint.validation._functions.get_line_count import get_line_count
+from kdaquila_structure_lint.validation._functions.get_order_key import get_order_key
+from kdaquila_structure_lint.validation._functions.iter_scheduled_files import (
+    iter_scheduled_files,
+)
+from kdaquila_structure_lint.validation._functions.may_exceed_line_limit import (
+    may_exceed_line_limit,
+)
+from kdaquila_structure_lint.validation._functions.stream_analysis import stream_analysis
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile, TimeBudget
 
 
-def validate_line_limits(config: Config) -> int:
-    """Run validation and return exit code."""
+def validate_line_limits(
+    config: Config, index: DirectoryIndex | None = None, budget: TimeBudget | None = None
+) -> int:
+    """Run validation and return exit code.
+
+    index is the run's shared directory index (a private one is used if None).
+    With a time budget, files are checked newest first until it runs out.
+    """
+    if index is None:
+        index = create_directory_index(config)
     project_root = config.project_root
     max_lines = config.line_limits.max_lines
-    search_paths = config.search_paths
+    # The NumPy counter reads whole files, so its counts are always exact
+    exact_counts = config.line_limits.exact_counts or config.line_limits.counter == "numpy"
+    limit = None if exact_counts else max_lines
+    order_key = get_order_key(config.order)
+    facts = index.facts
     errors = []
 
+    def needs_reading(source_file: SourceFile) -> bool:
+        """Check whether a file could exceed the limit, judging by its size."""
+        return may_exceed_line_limit(source_file, max_lines, config.discovery)
+
+    def measure(source_file: SourceFile) -> int:
+        """Count the lines of one file, through the facts cache if there is one."""
+        # Cached counts are exact, and only content not seen before is counted
+        if facts is not None:
+            return get_line_count(facts, source_file.path)
+        return count_file_lines(source_file.path, limit=limit)
+
     print(f"🔍 Checking source files for {max_lines} line limit...\n")
+    # Overlapping search paths would discover (and report) the same files twice
+    search_paths = dedupe_search_paths(project_root, config.search_paths, index)
 
     for search_path in search_paths:
         path = project_root / search_path
@@ -26,20 +72,41 @@ def validate_line_limits(config: Config) -> int:
             continue
 
         print(f"  Scanning {search_path}/...")
-        python_files = find_source_files(path)
+        # With a time budget, the newest files are checked first
+        source_files: Iterable[SourceFile] = iter_scheduled_files(
+            path, index, newest_first=budget is not None
+        )
+        if budget is not None:
+            source_files = list(source_files)
+            budget.checked.update(f.path for f in source_files if not needs_reading(f))
+        candidates = (f for f in source_files if needs_reading(f))
+        if config.line_limits.counter == "python" or facts is not None:
+            # Count files while the walk is still discovering more
+            results = stream_analysis(candidates, measure, budget=budget)
+        else:
+            results = count_source_batch(candidates, config.line_limits.counter, limit, budget)
+        # Ordering is applied when reporting, not while discovering
+        if order_key is not None:
+            results.sort(key=lambda result: order_key(result[0]))
 
-        for file_path in python_files:
+        for source_file, line_count in results:
+            # A tracked file deleted from the work tree (discovery = "git") is
+            # not an error; only unreadable files are checked for, so no stat
+            # is spent on the others
+            if line_count < 0 and not source_file.path.exists():
+                continue
             # Make path relative to project root for cleaner error messages
             try:
-                relative_path = file_path.relative_to(project_root)
+                relative_path = source_file.path.relative_to(project_root)
             except ValueError:
-                relative_path = file_path
+                relative_path = source_file.path
 
-            error = validate_file_lines(file_path, max_lines)
+            error = format_line_limit_error(relative_path, line_count, max_lines, exact_counts)
             if error:
-                # Replace absolute path with relative path in error message
-                error = error.replace(str(file_path), str(relative_path))
                 errors.append(error)
+    if facts is not None:
+        # New facts are written in one transaction per validator
+        flush_facts_cache(facts, close=True)
 
     if errors:
         print(f"\n❌ Found {len(errors)} file(s) exceeding {max_lines} line limit:\n")
@@ -5,20 +5,76 @@ based on which standard folder the file is in.
 """
 
 import sys
+from pathlib import Path
 
 from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._constants.stat_orders import STAT_ORDERS
 from kdaquila_structure_lint.validation._functions._validate_file import _validate_file
-from kdaquila_structure_lint.validation._functions.find_source_files import find_source_files
-
-
-def validate_one_per_file(config: Config) -> int:
-    """Run validation and return exit code."""
+from kdaquila_structure_lint.validation._functions.classify_directory import classify_directory
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
+from kdaquila_structure_lint.validation._functions.dedupe_search_paths import (
+    dedupe_search_paths,
+)
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.get_order_key import get_order_key
+from kdaquila_structure_lint.validation._functions.iter_scheduled_files import (
+    iter_scheduled_files,
+)
+from kdaquila_structure_lint.validation._functions.stream_analysis import stream_analysis
+from kdaquila_structure_lint.validation._types import (
+    DirectoryClassification,
+    DirectoryIndex,
+    SourceFile,
+    TimeBudget,
+)
+
+
+def validate_one_per_file(
+    config: Config, index: DirectoryIndex | None = None, budget: TimeBudget | None = None
+) -> int:
+    """Run validation and return exit code.
+
+    index is the run's shared directory index (a private one is used if None).
+    With a time budget, files are checked newest first until it runs out.
+    """
+    if index is None:
+        index = create_directory_index(config)
     project_root = config.project_root
-    search_paths = config.search_paths
     errors: list[str] = []
     name_errors: list[str] = []
 
+    excluded = compile_name_matcher(frozenset(config.one_per_file.excluded_patterns))
+    # Files in the same directory share folder, rules and relative prefix
+    classifications: dict[Path, DirectoryClassification] = {}
+    order_key = get_order_key(config.order)
+
+    def analyze(source_file: SourceFile) -> tuple[list[str], list[str]]:
+        """Validate one file, returning its errors and name errors."""
+        directory = source_file.path.parent
+        classification = classifications.get(directory)
+        if classification is None:
+            classification = classify_directory(directory, config)
+            classifications[directory] = classification
+        file_errors: list[str] = []
+        file_name_errors: list[str] = []
+        _validate_file(
+            source_file.path,
+            classification,
+            file_errors,
+            file_name_errors,
+            excluded,
+            cache=index.facts,
+        )
+        return file_errors, file_name_errors
+
     print("🔍 Checking for one function/class per file...\n")
+    # Overlapping search paths would discover (and report) the same files twice
+    search_paths = dedupe_search_paths(project_root, config.search_paths, index)
 
     for search_path in search_paths:
         path = project_root / search_path
@@ -27,10 +83,25 @@ def validate_one_per_file(config: Config) -> int:
             continue
 
         print(f"  Scanning {search_path}/...")
-        source_files = find_source_files(path)
-
-        for file_path in source_files:
-            _validate_file(file_path, config, errors, name_errors)
+        # Files are parsed while the walk is still discovering more, except that
+        # with a time budget the newest files are checked first
+        # Files are only stat-ed if the order needs it
+        source_files = iter_scheduled_files(
+            path,
+            index,
+            stat_files=budget is not None or config.order in STAT_ORDERS,
+            newest_first=budget is not None,
+        )
+        results = stream_analysis(source_files, analyze, budget=budget)
+        # Ordering is applied when reporting, not while discovering
+        if order_key is not None:
+            results.sort(key=lambda result: order_key(result[0]))
+        for _, (file_errors, file_name_errors) in results:
+            errors.extend(file_errors)
+            name_errors.extend(file_name_errors)
+    if index.facts is not None:
+        # New facts are written in one transaction per validator
+        flush_facts_cache(index.facts, close=True)
 
     errors_found = False
 
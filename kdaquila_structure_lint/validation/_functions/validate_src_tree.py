@@ -1,38 +1,58 @@
 """Validation logic for src tree structure."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from kdaquila_structure_lint.config import Config
 from kdaquila_structure_lint.config._constants.defaults import DEFAULT_SUPPORTED_EXTENSIONS
-from kdaquila_structure_lint.validation._functions.matches_any_pattern import matches_any_pattern
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
+from kdaquila_structure_lint.validation._functions.get_directory_listing import (
+    get_directory_listing,
+)
 from kdaquila_structure_lint.validation._functions.validate_custom_folder import (
     validate_custom_folder,
 )
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
 
+def validate_src_tree(
+    root: Path, config: Config, index: DirectoryIndex | None = None
+) -> list[str]:
+    """Validate src tree structure.
 
-def validate_src_tree(root: Path, config: Config) -> list[str]:
-    """Validate src tree structure."""
+    Base folders are independent subtrees, so they are validated concurrently on a
+    thread pool (the work is dominated by directory listing, which releases the GIL).
+    Errors are merged in sorted base folder order, so output is deterministic.
+    """
+    if index is None:
+        index = create_directory_index(config)
     errors: list[str] = []
-    children = {
-        c.name
-        for c in root.iterdir()
-        if c.is_dir() and not matches_any_pattern(c.name, config.structure.ignored_folders)
-    }
+    listing = get_directory_listing(index, root)
+    ignored = compile_name_matcher(frozenset(config.structure.ignored_folders))
+    children = [d for d in listing.directories if not ignored.matches(d)]
 
     # Validate all subdirectories in src/ as base folders
     # No exact match required - accept any folders
 
     source_files = [
-        c.name for c in root.iterdir()
-        if c.is_file() and c.suffix in DEFAULT_SUPPORTED_EXTENSIONS
+        f for f in listing.files
+        if Path(f).suffix in DEFAULT_SUPPORTED_EXTENSIONS
     ]
     disallowed = [f for f in source_files if f not in config.structure.files_allowed_anywhere]
     if disallowed:
         errors.append(f"{root}: Files not allowed in root: {disallowed}")
 
     # Validate all actual subdirectories found in src/
-    for child in children:
-        base_path = root / child
-        errors.extend(validate_custom_folder(base_path, config, depth=0))
+    with ThreadPoolExecutor() as executor:
+        for base_errors in executor.map(
+            lambda child: validate_custom_folder(root / child, config, 0, index),
+            children,
+        ):
+            errors.extend(base_errors)
 
     return errors
@@ -8,11 +8,20 @@ See functions/structure modules for detailed validation logic.
 import sys
 
 from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.validation._functions.create_directory_index import (
+    create_directory_index,
+)
 from kdaquila_structure_lint.validation._functions.validate_src_tree import validate_src_tree
+from kdaquila_structure_lint.validation._types import DirectoryIndex
 
 
-def validate_structure(config: Config) -> int:
-    """Run validation on all search_paths and return exit code."""
+def validate_structure(config: Config, index: DirectoryIndex | None = None) -> int:
+    """Run validation on all search_paths and return exit code.
+
+    index is the run's shared directory index (a private one is used if None).
+    """
+    if index is None:
+        index = create_directory_index(config)
     project_root = config.project_root
     search_paths = config.search_paths
     all_errors: list[str] = []
@@ -32,7 +41,7 @@ def validate_structure(config: Config) -> int:
             continue
 
         print(f"Validating {root_name}/ tree...")
-        root_errors = validate_src_tree(root_path, config)
+        root_errors = validate_src_tree(root_path, config, index)
         # Make paths relative to project root for cleaner error messages
         root_errors = [
             error.replace(str(project_root) + "\\", "").replace(str(project_root) + "/", "")
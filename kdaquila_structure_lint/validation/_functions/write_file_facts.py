@@ -0,0 +1,20 @@
+"""Store the facts of a content key in the cache."""
+
+from kdaquila_structure_lint.validation._constants.facts_database_format import (
+    FACTS_DATABASE_BATCH_SIZE,
+)
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._types import FactsCache, FileFacts
+
+
+def write_file_facts(cache: FactsCache, key: str, facts: FileFacts) -> None:
+    """Store facts under key.
+
+    The entry is queued and written with others in one transaction, once
+    FACTS_DATABASE_BATCH_SIZE entries are pending or the cache is flushed.
+    """
+    with cache.lock:
+        cache.facts[key] = facts
+        cache.pending_facts[key] = facts
+        if len(cache.pending_facts) + len(cache.pending_keys) >= FACTS_DATABASE_BATCH_SIZE:
+            flush_facts_cache(cache)
@@ -0,0 +1,67 @@
+"""Tests for compiling .gitignore patterns."""
+
+import pytest
+
+from kdaquila_structure_lint.validation._functions.compile_ignore_rule import compile_ignore_rule
+
+
+def matches(line: str, path: str, is_dir: bool = False) -> bool:
+    """Check whether a single .gitignore line ignores path."""
+    rule = compile_ignore_rule(line)
+    assert rule is not None
+    if rule.directory_only and not is_dir:
+        return False
+    return rule.regex.fullmatch(path) is not None
+
+
+class TestCompileIgnoreRule:
+    """Tests for the .gitignore pattern format."""
+
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "/"])
+    def test_blank_and_comment_lines_are_skipped(self, line: str) -> None:
+        """Should return None for lines without a pattern."""
+        assert compile_ignore_rule(line) is None
+
+    def test_name_without_slash_matches_at_any_depth(self) -> None:
+        """Should match a bare name in any directory."""
+        assert matches("build", "build", is_dir=True)
+        assert matches("build", "pkg/sub/build", is_dir=True)
+        assert not matches("build", "builder", is_dir=True)
+
+    def test_pattern_with_slash_is_anchored(self) -> None:
+        """Should match slash-containing patterns relative to the ignore file."""
+        assert matches("/dist", "dist")
+        assert not matches("/dist", "pkg/dist")
+        assert matches("docs/*.md", "docs/a.md")
+        assert not matches("docs/*.md", "pkg/docs/a.md")
+
+    def test_wildcards_do_not_cross_slashes(self) -> None:
+        """Should keep * and ? within one path segment."""
+        assert matches("*.gen.py", "pkg/api.gen.py")
+        assert not matches("a/*", "a/b/c")
+        assert matches("file?.py", "file1.py")
+        assert matches("file[0-9].py", "file7.py")
+        assert not matches("file[!0-9].py", "file7.py")
+
+    def test_double_star(self) -> None:
+        """Should match any number of directories with **."""
+        assert matches("**/generated", "generated", is_dir=True)
+        assert matches("**/generated", "a/b/generated", is_dir=True)
+        assert matches("out/**", "out/a/b.py")
+        assert matches("a/**/b", "a/b")
+        assert matches("a/**/b", "a/x/y/b")
+
+    def test_directory_only_and_negation(self) -> None:
+        """Should parse trailing slash and leading ! flags."""
+        rule = compile_ignore_rule("!cache/")
+        assert rule is not None
+        assert rule.negated
+        assert rule.directory_only
+        assert not matches("cache/", "cache")
+
+    def test_escapes(self) -> None:
+        """Should treat backslash-escaped characters literally."""
+        assert matches(r"\#notes", "#notes")
+        assert matches(r"\!important", "!important")
+        assert matches("trailing\\ ", "trailing ")
+        assert matches("trailing   ", "trailing")
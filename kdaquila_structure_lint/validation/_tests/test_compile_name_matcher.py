@@ -0,0 +1,52 @@
+"""Tests for precompiled name pattern matching."""
+
+import fnmatch
+
+import pytest
+
+from kdaquila_structure_lint.validation._functions.compile_name_matcher import (
+    compile_name_matcher,
+)
+
+PATTERNS = frozenset({"__pycache__", ".tox", "*.egg-info", "*.d.ts", "build-[0-9]", "tmp?"})
+NAMES = [
+    "__pycache__",
+    "pycache",
+    ".tox",
+    "pkg.egg-info",
+    "egg-info",
+    "types.d.ts",
+    "types.ts",
+    "build-1",
+    "build-x",
+    "tmp1",
+    "tmp12",
+    "src",
+]
+
+
+class TestCompileNameMatcher:
+    """Tests for compile_name_matcher."""
+
+    @pytest.mark.parametrize("name", NAMES)
+    def test_matches_like_fnmatch(self, name: str) -> None:
+        """Should agree with fnmatch.fnmatch for every pattern."""
+        expected = any(fnmatch.fnmatch(name, pattern) for pattern in PATTERNS)
+
+        assert compile_name_matcher(PATTERNS).matches(name) is expected
+
+    def test_literal_patterns_skip_regex(self) -> None:
+        """Should match patterns without wildcards by set lookup only."""
+        matcher = compile_name_matcher(frozenset({"__pycache__", ".tox"}))
+
+        assert matcher.wildcard_regex is None
+        assert matcher.matches(".tox")
+        assert not matcher.matches("tox")
+
+    def test_empty_patterns_match_nothing(self) -> None:
+        """Should never match with no patterns."""
+        assert not compile_name_matcher(frozenset()).matches("anything")
+
+    def test_compiled_once_per_pattern_set(self) -> None:
+        """Should return the cached matcher for an equal pattern set."""
+        assert compile_name_matcher(frozenset(PATTERNS)) is compile_name_matcher(PATTERNS)
@@ -0,0 +1,63 @@
+"""Tests for byte-level line counting."""
+
+from pathlib import Path
+
+import pytest
+
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+
+CONTENTS = [
+    b"",
+    b"\n",
+    b"one line",
+    b"one line\n",
+    b"a\nb\nc",
+    b"a\r\nb\r\nc\r\n",
+    b"a\rb\rc",
+    b"mixed\r\nends\nhere\r",
+    b"\n\n\n",
+    "unicode こんにちは\ncafé\n".encode(),
+]
+
+
+class TestCountFileLines:
+    """Tests for count_file_lines."""
+
+    @pytest.mark.parametrize("content", CONTENTS)
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+    def test_matches_text_mode_iteration(
+        self, tmp_path: Path, content: bytes, chunk_size: int
+    ) -> None:
+        """Should count exactly what text-mode line iteration counts."""
+        file_path = tmp_path / "sample.py"
+        file_path.write_bytes(content)
+
+        with file_path.open(encoding="utf-8") as f:
+            expected = sum(1 for _ in f)
+
+        assert count_file_lines(file_path, chunk_size=chunk_size) == expected
+
+    def test_invalid_utf8_returns_error(self, tmp_path: Path) -> None:
+        """Should return -1 for files that are not valid UTF-8."""
+        file_path = tmp_path / "binary.py"
+        file_path.write_bytes(b"ok\n\xff\xfe\n")
+
+        assert count_file_lines(file_path) == -1
+
+    def test_truncated_multibyte_sequence_returns_error(self, tmp_path: Path) -> None:
+        """Should detect a multi-byte sequence cut off at end of file."""
+        file_path = tmp_path / "truncated.py"
+        file_path.write_bytes("é".encode()[:1])
+
+        assert count_file_lines(file_path, chunk_size=1) == -1
+
+    def test_validation_can_be_skipped(self, tmp_path: Path) -> None:
+        """Should count lines of undecodable files when validation is disabled."""
+        file_path = tmp_path / "binary.py"
+        file_path.write_bytes(b"ok\n\xff\xfe\n")
+
+        assert count_file_lines(file_path, validate_utf8=False) == 2
+
+    def test_missing_file_returns_error(self, tmp_path: Path) -> None:
+        """Should return -1 when the file cannot be opened."""
+        assert count_file_lines(tmp_path / "missing.py") == -1
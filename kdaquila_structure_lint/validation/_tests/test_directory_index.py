@@ -0,0 +1,74 @@
+"""Tests for the directory index shared between validators."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._functions.scan_source_files import scan_source_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+class TestDirectoryIndex:
+    """Tests for listing each directory once per run."""
+
+    def test_all_validators_list_each_directory_once(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should not list any directory twice when all validators run."""
+        config = create_minimal_config(tmp_path)
+        config.validators.structure = True
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "features": {
+                        "auth": {
+                            "_functions": {"login.py": "def login():\n    pass\n"},
+                            "_types": {"user.py": "def user():\n    pass\n"},
+                        },
+                    },
+                },
+            },
+        )
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        exit_code = run_validations(config)
+
+        assert exit_code == 0
+        # src, features, auth, auth/_functions, auth/_types
+        assert len(listed) == 5
+        assert len(set(listed)) == len(listed)
+
+    def test_scan_results_are_cached_in_index(self, tmp_path: Path) -> None:
+        """Should return the cached scan for the same root and index."""
+        build_structure(tmp_path, {"src": {"a.py": "", "b.ts": ""}})
+        index = DirectoryIndex()
+
+        first = scan_source_files(tmp_path / "src", index=index)
+        (tmp_path / "src" / "c.py").write_text("")
+        second = scan_source_files(tmp_path / "src", index=index)
+
+        assert second == first
+        assert len(scan_source_files(tmp_path / "src")) == 3
+
+    def test_custom_extensions_bypass_cache(self, tmp_path: Path) -> None:
+        """Should filter by custom extensions using the cached listings."""
+        build_structure(tmp_path, {"src": {"a.py": "", "b.ts": ""}})
+        index = DirectoryIndex()
+
+        scan_source_files(tmp_path / "src", index=index)
+        only_ts = scan_source_files(tmp_path / "src", {".ts"}, index=index)
+
+        assert [f.path.name for f in only_ts] == ["b.ts"]
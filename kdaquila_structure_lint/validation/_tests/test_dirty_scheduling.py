@@ -0,0 +1,116 @@
+"""Tests for scheduling git-dirty files first."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import REQUIRES_GIT, build_structure, git
+from kdaquila_structure_lint.validation._functions.get_dirty_files import get_dirty_files
+from kdaquila_structure_lint.validation._functions.iter_scheduled_files import (
+    iter_scheduled_files,
+)
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+def make_repo(root: Path) -> None:
+    """Commit a small tree, then modify, stage and add files on top of it."""
+    build_structure(
+        root,
+        {"src": {"a.py": "", "b.py": "", "pkg": {"c.py": "", "d.py": ""}, "vendor": {"v.py": ""}}},
+    )
+    git(root, "init", "-q")
+    git(root, "add", ".")
+    git(root, "commit", "-q", "-m", "initial")
+    (root / "src" / "pkg" / "d.py").write_text("x = 1\n")  # modified
+    (root / "src" / "vendor" / "v.py").write_text("x = 1\n")  # modified, but excluded
+    (root / "src" / "new.py").write_text("")
+    git(root, "add", "src/new.py")  # staged
+    (root / "src" / "untracked.py").write_text("")
+    for name in ["a.py", "b.py", "new.py", "untracked.py", "pkg/c.py", "pkg/d.py"]:
+        os.utime(root / "src" / name, (1000, 1000) if name == "pkg/d.py" else (2000, 2000))
+
+
+def scheduled_names(root: Path, index: DirectoryIndex, newest_first: bool = False) -> list[str]:
+    """Return the relative paths under root in scheduling order."""
+    return [
+        f.path.relative_to(root).as_posix()
+        for f in iter_scheduled_files(root, index, newest_first=newest_first)
+    ]
+
+
+@REQUIRES_GIT
+class TestDirtyScheduling:
+    """Tests for dirty_first."""
+
+    def test_load_dirty_first(self, tmp_path: Path) -> None:
+        """Should load dirty_first from the root table, defaulting to false."""
+        (tmp_path / "pyproject.toml").write_text("[tool.structure-lint]\ndirty_first = true\n")
+
+        assert load_config(project_root=tmp_path).dirty_first is True
+        assert load_config(project_root=tmp_path / "missing").dirty_first is False
+
+    def test_modified_and_staged_files_are_dirty(self, tmp_path: Path) -> None:
+        """Should report modified and staged files under root, but not untracked ones."""
+        make_repo(tmp_path)
+        index = DirectoryIndex(dirty_first=True)
+
+        dirty = get_dirty_files(index, tmp_path / "src" / "pkg")
+
+        assert dirty == {tmp_path / "src" / "pkg" / "d.py"}
+        assert get_dirty_files(index, tmp_path / "src") == {
+            tmp_path / "src" / "new.py",
+            tmp_path / "src" / "pkg" / "d.py",
+            tmp_path / "src" / "vendor" / "v.py",
+        }
+        assert get_dirty_files(DirectoryIndex(), tmp_path / "src") == frozenset()
+
+    def test_dirty_files_scheduled_first(self, tmp_path: Path) -> None:
+        """Should yield dirty files first, the rest after them, each file once."""
+        make_repo(tmp_path)
+        index = DirectoryIndex(dirty_first=True, exclude=frozenset({"vendor"}))
+
+        names = scheduled_names(tmp_path / "src", index)
+
+        assert names[:2] == ["new.py", "pkg/d.py"]
+        assert sorted(names[2:]) == ["a.py", "b.py", "pkg/c.py", "untracked.py"]
+
+    def test_dirty_files_lead_recency_order(self, tmp_path: Path) -> None:
+        """Should put an old dirty file before newer files that are unchanged."""
+        make_repo(tmp_path)
+        index = DirectoryIndex(dirty_first=True, exclude=frozenset({"vendor"}))
+
+        names = scheduled_names(tmp_path / "src", index, newest_first=True)
+
+        assert names == ["new.py", "pkg/d.py", "a.py", "b.py", "pkg/c.py", "untracked.py"]
+
+    def test_git_discovery_lists_no_directory(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should check dirty files against the git index, not directory listings."""
+        make_repo(tmp_path)
+        index = DirectoryIndex(dirty_first=True, discovery="git", exclude=frozenset({"vendor"}))
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        names = scheduled_names(tmp_path / "src", index)
+
+        assert names[:2] == ["new.py", "pkg/d.py"]
+        assert sorted(names[2:]) == ["a.py", "b.py", "pkg/c.py"]
+        assert listed == []
+
+    def test_outside_git_work_tree(self, tmp_path: Path) -> None:
+        """Should schedule in walk order when root is not in a git work tree."""
+        build_structure(tmp_path, {"src": {"a.py": "", "b.py": ""}})
+
+        names = scheduled_names(tmp_path / "src", DirectoryIndex(dirty_first=True))
+
+        assert sorted(names) == ["a.py", "b.py"]
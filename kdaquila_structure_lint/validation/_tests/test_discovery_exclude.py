@@ -0,0 +1,91 @@
+"""Tests for the root-level exclude setting."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+
+
+class TestDiscoveryExclude:
+    """Tests for pruning excluded names in every validator."""
+
+    def test_load_exclude(self, tmp_path: Path) -> None:
+        """Should load exclude from the root table, defaulting to an empty list."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.structure-lint]\nexclude = ["vendor", "*_pb2.py"]\n'
+        )
+
+        assert load_config(project_root=tmp_path).exclude == ["vendor", "*_pb2.py"]
+        assert load_config(project_root=tmp_path / "missing").exclude == []
+
+    def test_excluded_directory_is_never_listed(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should prune excluded directories in all validators, including structure."""
+        config = create_minimal_config(tmp_path)
+        config.validators.structure = True
+        config.exclude = ["third_*"]
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "features": {"_functions": {"run.py": "def run():\n    pass\n"}},
+                    "third_party": {"lib": {"big.py": SAMPLE_TOO_LONG_FILE_CONTENT}},
+                },
+            },
+        )
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        assert run_validations(config) == 0
+        assert "third_party" not in listed
+        assert "lib" not in listed
+
+    def test_builtin_excludes_still_apply(self, tmp_path: Path) -> None:
+        """Should keep pruning the built-in directories when exclude is set."""
+        config = create_minimal_config(tmp_path)
+        config.exclude = ["vendor"]
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "node_modules": {"dep.py": SAMPLE_TOO_LONG_FILE_CONTENT},
+                    "vendor": {"v.py": SAMPLE_TOO_LONG_FILE_CONTENT},
+                }
+            },
+        )
+
+        assert run_validations(config) == 0
+
+    def test_excluded_file_pattern(self, tmp_path: Path) -> None:
+        """Should skip files whose name matches an exclude pattern."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "api_pb2.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                    "main.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                }
+            },
+        )
+
+        assert run_validations(config) == 1
+
+        config.exclude = ["*_pb2.py", "main.py"]
+        assert run_validations(config) == 0
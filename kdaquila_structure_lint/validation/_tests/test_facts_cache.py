@@ -0,0 +1,147 @@
+"""Tests for the content-addressed file facts cache."""
+
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._constants import FACTS_DATABASE_FILE
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.get_definition_facts import (
+    get_definition_facts,
+)
+from kdaquila_structure_lint.validation._functions.get_line_count import get_line_count
+from kdaquila_structure_lint.validation._functions.open_facts_cache import open_facts_cache
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+
+TREE = {
+    "src": {
+        "big.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+        "_functions": {"two.py": "def a():\n    pass\n\n\ndef b():\n    pass\n", "bad.py": "def ("},
+    },
+}
+
+
+def make_config(root: Path) -> Config:
+    """Create a config caching into a cache directory under root."""
+    config = create_minimal_config(root)
+    config.cache_dir = ".structure-lint"
+    return config
+
+
+def forbid_analysis(monkeypatch: MonkeyPatch) -> None:
+    """Make any parsing or line counting fail the test."""
+
+    def fail(*_: Any, **__: Any) -> Any:
+        raise AssertionError("file analyzed despite a cached entry")
+
+    definitions_module = sys.modules[get_definition_facts.__module__]
+    monkeypatch.setattr(definitions_module, "count_top_level_definitions", fail)
+    monkeypatch.setattr(sys.modules[get_line_count.__module__], "count_file_lines", fail)
+
+
+class TestFactsCache:
+    """Tests for caching line counts and definitions by content."""
+
+    def test_warm_run_analyzes_nothing(
+        self, tmp_path: Path, capsys: CaptureFixture[str], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should report the same errors from cached facts alone."""
+        config = make_config(tmp_path)
+        build_structure(tmp_path, TREE)
+        assert run_validations(config) == 1
+        cold = capsys.readouterr().out
+
+        forbid_analysis(monkeypatch)
+        assert run_validations(config) == 1
+        warm = capsys.readouterr().out
+
+        expected_errors = ["big.py: more than", "two.py: 2 functions", "bad.py: Error parsing"]
+        for expected in expected_errors:
+            assert expected in cold
+            assert expected in warm
+
+    def test_cache_is_relocatable(
+        self, tmp_path: Path, capsys: CaptureFixture[str], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should reuse a cache directory restored into another checkout."""
+        build_structure(tmp_path / "first", TREE)
+        assert run_validations(make_config(tmp_path / "first")) == 1
+        build_structure(tmp_path / "second", TREE)
+        shutil.copytree(
+            tmp_path / "first" / ".structure-lint", tmp_path / "second" / ".structure-lint"
+        )
+        capsys.readouterr()
+
+        forbid_analysis(monkeypatch)
+        assert run_validations(make_config(tmp_path / "second")) == 1
+        assert "two.py: 2 functions" in capsys.readouterr().out
+
+    def test_changed_content_is_analyzed(self, tmp_path: Path) -> None:
+        """Should key facts by content, so an edited file is analyzed again."""
+        build_structure(tmp_path, {"src": {"a.py": "def a():\n    pass\n"}})
+        path = tmp_path / "src" / "a.py"
+        cache = open_facts_cache(make_config(tmp_path))
+        assert cache is not None
+        assert get_definition_facts(path, cache).definitions == ("a",)
+
+        path.write_text("def b():\n    pass\n\n\nX = 1\n")
+        cache = open_facts_cache(make_config(tmp_path))
+        assert cache is not None
+        facts = get_definition_facts(path, cache)
+
+        assert facts.definitions == ("b",)
+        assert facts.extras == ("X",)
+        assert get_line_count(cache, path) == 5
+
+    def test_config_changes_reuse_facts(
+        self, tmp_path: Path, capsys: CaptureFixture[str], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should evaluate changed settings against cached facts without re-parsing."""
+        config = make_config(tmp_path)
+        build_structure(tmp_path, TREE)
+        assert run_validations(config) == 1
+        capsys.readouterr()
+
+        forbid_analysis(monkeypatch)
+        config.line_limits.max_lines = 250
+        config.one_per_file.excluded_patterns = ["two.py", "bad.py"]
+        assert run_validations(config) == 0
+
+        config.line_limits.max_lines = 100
+        assert run_validations(config) == 1
+        assert "big.py: more than" in capsys.readouterr().out
+
+    def test_namespace_ignores_config_and_location(self, tmp_path: Path) -> None:
+        """Should use the same namespace whatever the settings and paths."""
+        moved = make_config(tmp_path / "elsewhere")
+        moved.cache_dir = "other-cache"
+        moved.line_limits.max_lines = 100
+
+        caches = [open_facts_cache(c) for c in [make_config(tmp_path), moved]]
+
+        assert caches[0] is not None and caches[1] is not None
+        assert caches[0].namespace == caches[1].namespace
+
+    def test_corrupt_database_is_recomputed(self, tmp_path: Path) -> None:
+        """Should treat an unreadable database as a miss."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        path = tmp_path / "src" / "a.py"
+        cache = open_facts_cache(make_config(tmp_path))
+        assert cache is not None
+        assert get_line_count(cache, path) == 1
+        flush_facts_cache(cache, close=True)
+        (tmp_path / ".structure-lint" / FACTS_DATABASE_FILE).write_bytes(b"{" * 4096)
+
+        cache = open_facts_cache(make_config(tmp_path))
+        assert cache is not None
+        assert get_line_count(cache, path) == 1
@@ -0,0 +1,87 @@
+"""Tests for not caching facts of files edited while they are analyzed."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.get_content_key import get_content_key
+from kdaquila_structure_lint.validation._functions.get_definition_facts import (
+    get_definition_facts,
+)
+from kdaquila_structure_lint.validation._functions.get_line_count import get_line_count
+from kdaquila_structure_lint.validation._functions.open_facts_cache import open_facts_cache
+from kdaquila_structure_lint.validation._functions.read_file_facts import read_file_facts
+from kdaquila_structure_lint.validation._types import FactsCache, FileFacts
+
+
+def open_cache(root: Path) -> FactsCache:
+    """Open a facts cache for a project at root."""
+    config = create_minimal_config(root)
+    config.cache_dir = ".structure-lint"
+    cache = open_facts_cache(config)
+    assert cache is not None
+    return cache
+
+
+def edit_before(monkeypatch: MonkeyPatch, module: str, name: str, content: str) -> None:
+    """Make module's name function rewrite its path argument before running."""
+    real = getattr(sys.modules[module], name)
+
+    def edit_then_run(path: Path, *args: Any, **kwargs: Any) -> Any:
+        path.write_text(content)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(sys.modules[module], name, edit_then_run)
+
+
+class TestFactsCacheChanges:
+    """Tests for checking a file's stat data before storing its facts."""
+
+    def test_line_count_of_edited_file_is_not_stored(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should not store a count taken after the file changed under its key."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        path = tmp_path / "src" / "a.py"
+        key = get_content_key(open_cache(tmp_path), path)
+        assert key is not None
+        edit_before(monkeypatch, get_line_count.__module__, "count_file_lines", "x = 1\n" * 3)
+
+        cache = open_cache(tmp_path)
+        assert get_line_count(cache, path) == 3
+        flush_facts_cache(cache, close=True)
+
+        assert read_file_facts(open_cache(tmp_path), key) == FileFacts()
+
+    def test_definitions_of_edited_file_are_not_stored(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should not store definitions parsed after the file changed under its key."""
+        build_structure(tmp_path, {"src": {"a.py": "def a():\n    pass\n"}})
+        path = tmp_path / "src" / "a.py"
+        key = get_content_key(open_cache(tmp_path), path)
+        assert key is not None
+        module = get_definition_facts.__module__
+        edit_before(monkeypatch, module, "count_top_level_definitions", "def b():\n    pass\n\n")
+
+        cache = open_cache(tmp_path)
+        assert get_definition_facts(path, cache).definitions == ("b",)
+        flush_facts_cache(cache, close=True)
+
+        assert read_file_facts(open_cache(tmp_path), key) == FileFacts()
+
+    def test_unchanged_file_is_stored(self, tmp_path: Path) -> None:
+        """Should store facts of a file that did not change while analyzed."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        path = tmp_path / "src" / "a.py"
+        cache = open_cache(tmp_path)
+        assert get_line_count(cache, path) == 1
+        key = get_content_key(cache, path)
+        assert key is not None
+        flush_facts_cache(cache, close=True)
+
+        assert read_file_facts(open_cache(tmp_path), key) == FileFacts(line_count=1)
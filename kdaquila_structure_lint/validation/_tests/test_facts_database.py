@@ -0,0 +1,149 @@
+"""Tests for the SQLite store behind the facts cache."""
+
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._constants import FACTS_DATABASE_FILE
+from kdaquila_structure_lint.validation._functions.flush_facts_cache import flush_facts_cache
+from kdaquila_structure_lint.validation._functions.get_content_key import get_content_key
+from kdaquila_structure_lint.validation._functions.open_facts_cache import open_facts_cache
+from kdaquila_structure_lint.validation._functions.read_file_facts import read_file_facts
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._functions.write_file_facts import write_file_facts
+from kdaquila_structure_lint.validation._types import FactsCache, FileFacts
+
+
+def open_cache(root: Path) -> FactsCache:
+    """Open a facts cache for a project at root."""
+    config = create_minimal_config(root)
+    config.cache_dir = ".structure-lint"
+    cache = open_facts_cache(config)
+    assert cache is not None
+    return cache
+
+
+def query(root: Path, sql: str) -> list[Any]:
+    """Run a query against the facts database under root."""
+    connection = sqlite3.connect(root / ".structure-lint" / FACTS_DATABASE_FILE)
+    try:
+        return connection.execute(sql).fetchall()
+    finally:
+        connection.close()
+
+
+class TestFactsDatabase:
+    """Tests for storing facts and content keys in one WAL-mode database."""
+
+    def test_run_writes_single_wal_database(self, tmp_path: Path) -> None:
+        """Should keep every entry in one database file in WAL mode."""
+        config = create_minimal_config(tmp_path)
+        config.cache_dir = ".structure-lint"
+        build_structure(tmp_path, {"src": {"_functions": {"a.py": "def a():\n    pass\n"}}})
+
+        assert run_validations(config) == 0
+
+        assert (tmp_path / ".structure-lint" / FACTS_DATABASE_FILE).is_file()
+        assert not any(p.is_dir() for p in (tmp_path / ".structure-lint").iterdir())
+        assert query(tmp_path, "PRAGMA journal_mode") == [("wal",)]
+        assert len(query(tmp_path, "SELECT * FROM facts")) == 1
+
+    def test_writes_wait_for_flush(self, tmp_path: Path) -> None:
+        """Should queue new entries and write them in one transaction."""
+        cache = open_cache(tmp_path)
+        for i in range(3):
+            write_file_facts(cache, f"{i:040x}", FileFacts(line_count=i))
+
+        assert not (tmp_path / ".structure-lint" / FACTS_DATABASE_FILE).exists()
+        flush_facts_cache(cache, close=True)
+
+        assert query(tmp_path, "SELECT line_count FROM facts ORDER BY key") == [(0,), (1,), (2,)]
+
+    def test_saved_content_key_skips_hashing(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should reuse the key saved for an unchanged path without reading the file."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        path = tmp_path / "src" / "a.py"
+        os.utime(path, (1000, 1000))
+        cache = open_cache(tmp_path)
+        key = get_content_key(cache, path)
+        flush_facts_cache(cache, close=True)
+        cache = open_cache(tmp_path)
+
+        def fail(*_: Any, **__: Any) -> Any:
+            raise AssertionError("file hashed despite a saved content key")
+
+        monkeypatch.setattr(sys.modules[get_content_key.__module__].hashlib, "blake2b", fail)
+
+        assert get_content_key(cache, path) == key
+
+        os.utime(path, (2000, 2000))
+        with pytest.raises(AssertionError, match=r"file hashed"):
+            get_content_key(open_cache(tmp_path), path)
+
+    def test_concurrent_writers_merge_facts(self, tmp_path: Path) -> None:
+        """Should keep every entry written by concurrent connections, merging fields."""
+        caches = [open_cache(tmp_path) for _ in range(4)]
+        for n, cache in enumerate(caches):
+            for i in range(200):
+                write_file_facts(cache, f"{n}-{i}", FileFacts(line_count=n))
+            shared = FileFacts(line_count=7) if n % 2 else FileFacts(definitions=("a",))
+            write_file_facts(cache, "shared", shared)
+
+        threads = [
+            threading.Thread(target=flush_facts_cache, args=(cache,), kwargs={"close": True})
+            for cache in caches
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert query(tmp_path, "SELECT count(*) FROM facts") == [(801,)]
+        assert read_file_facts(open_cache(tmp_path), "shared") == FileFacts(
+            line_count=7, definitions=("a",)
+        )
+
+    def test_corrupt_database_is_replaced(self, tmp_path: Path) -> None:
+        """Should replace a file that is not a database on the next write."""
+        (tmp_path / ".structure-lint").mkdir()
+        (tmp_path / ".structure-lint" / FACTS_DATABASE_FILE).write_bytes(b"\0" * 4096)
+        cache = open_cache(tmp_path)
+
+        assert read_file_facts(cache, "k") == FileFacts()
+        write_file_facts(cache, "k", FileFacts(line_count=3))
+        flush_facts_cache(cache, close=True)
+
+        assert read_file_facts(open_cache(tmp_path), "k") == FileFacts(line_count=3)
+
+    def test_same_content_with_another_parser_is_analyzed(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should not share facts between identical .py and .ts files."""
+        config = create_minimal_config(tmp_path)
+        config.cache_dir = ".structure-lint"
+        content = "def helper():\n    pass\n\nX = 1\n"
+        build_structure(
+            tmp_path, {"src": {"_functions": {"helper.py": content, "helper.ts": content}}}
+        )
+        cache = open_cache(tmp_path)
+        keys = {
+            get_content_key(cache, tmp_path / "src" / "_functions" / name)
+            for name in ["helper.py", "helper.ts"]
+        }
+        assert len(keys) == 2
+
+        for _ in range(2):  # Cold, then warm
+            assert run_validations(config) == 1
+            output = capsys.readouterr().out
+            assert "helper.py: Extra definitions" in output
+            assert "helper.ts: Extra" not in output
@@ -0,0 +1,121 @@
+"""Tests for the file ordering strategies."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.get_order_key import get_order_key
+from kdaquila_structure_lint.validation._functions.iter_scheduled_files import (
+    iter_scheduled_files,
+)
+from kdaquila_structure_lint.validation._functions.iter_source_files import iter_source_files
+from kdaquila_structure_lint.validation._functions.validate_line_limits import (
+    validate_line_limits,
+)
+from kdaquila_structure_lint.validation._functions.validate_one_per_file import (
+    validate_one_per_file,
+)
+from kdaquila_structure_lint.validation._types import SourceFile
+
+
+def reported_names(output: str) -> list[str]:
+    """Return the file names of the reported errors, in output order."""
+    return [Path(line.split()[1].rstrip(":")).name for line in output.splitlines() if "•" in line]
+
+
+class TestFileOrdering:
+    """Tests for order = "mtime" | "path" | "size" | "none"."""
+
+    def test_order_keys(self) -> None:
+        """Should sort newest, largest or by path, and keep walk order for none."""
+        files = [
+            SourceFile(Path("b.py"), 10, 1.0),
+            SourceFile(Path("a.py"), 5, 2.0),
+            SourceFile(Path("c.py"), 20, 1.0),
+        ]
+
+        def sorted_names(order: str) -> list[str]:
+            key = get_order_key(order)
+            assert key is not None
+            return [f.path.name for f in sorted(files, key=key)]
+
+        assert sorted_names("mtime") == ["a.py", "b.py", "c.py"]
+        assert sorted_names("size") == ["c.py", "b.py", "a.py"]
+        assert sorted_names("path") == ["a.py", "b.py", "c.py"]
+        assert get_order_key("none") is None
+
+    def test_invalid_order_raises_error(self, tmp_path: Path) -> None:
+        """Should reject unknown orders."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\norder = "random"\n')
+
+        with pytest.raises(ValueError, match=r"Invalid order: 'random'"):
+            load_config(project_root=tmp_path)
+
+    @pytest.mark.parametrize(
+        ("order", "expected"),
+        [("path", ["a.py", "b.py", "c.py"]), ("size", ["c.py", "a.py", "b.py"])],
+    )
+    def test_report_order(
+        self, tmp_path: Path, capsys: CaptureFixture[str], order: str, expected: list[str]
+    ) -> None:
+        """Should report line limit errors in the configured order."""
+        config = create_minimal_config(tmp_path)
+        config.order = order
+        build_structure(
+            tmp_path,
+            {"src": {"b.py": "x\n" * 160, "a.py": "x\n" * 170, "c.py": "x\n" * 180}},
+        )
+
+        assert validate_line_limits(config) == 1
+
+        assert reported_names(capsys.readouterr().out) == expected
+
+    def test_walk_reuses_dir_entry_stat(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Should take stat data from the DirEntry instead of stat-ing the path."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+
+        def no_path_stat(*_: Any, **__: Any) -> Any:
+            raise AssertionError("Path.stat called")
+
+        monkeypatch.setattr(Path, "stat", no_path_stat)
+
+        files = list(iter_source_files(tmp_path / "src"))
+
+        assert [f.size for f in files] == [6]
+
+    def test_stat_free_walk(self, tmp_path: Path) -> None:
+        """Should skip stat data and drop symlinks to files inside the root."""
+        build_structure(tmp_path, {"src": {"real.py": ""}, "outside.py": ""})
+        (tmp_path / "src" / "alias.py").symlink_to(tmp_path / "src" / "real.py")
+        (tmp_path / "src" / "external.py").symlink_to(tmp_path / "outside.py")
+
+        files = list(iter_source_files(tmp_path / "src", stat_files=False))
+
+        assert sorted(f.path.name for f in files) == ["external.py", "real.py"]
+        assert all(f.size is None and f.mtime is None for f in files)
+
+    @pytest.mark.parametrize(("order", "stat_files"), [("none", False), ("mtime", True)])
+    def test_one_per_file_stats_only_when_ordering_needs_it(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, order: str, stat_files: bool
+    ) -> None:
+        """Should only ask discovery for stat data when sorting by it."""
+        config = create_minimal_config(tmp_path)
+        config.order = order
+        build_structure(tmp_path, {"src": {"_functions": {"run.py": "def run():\n    pass\n"}}})
+        requested: list[bool] = []
+        module = sys.modules[validate_one_per_file.__module__]
+
+        def spy(*args: Any, **kwargs: Any) -> Any:
+            requested.append(kwargs["stat_files"])
+            return iter_scheduled_files(*args, **kwargs)
+
+        monkeypatch.setattr(module, "iter_scheduled_files", spy)
+
+        assert validate_one_per_file(config) == 0
+        assert requested == [stat_files]
@@ -0,0 +1,93 @@
+"""Tests for using git blob IDs as facts cache keys."""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import (
+    REQUIRES_GIT,
+    build_structure,
+    create_minimal_config,
+    git,
+)
+from kdaquila_structure_lint.validation._functions.get_content_key import get_content_key
+from kdaquila_structure_lint.validation._functions.open_facts_cache import open_facts_cache
+from kdaquila_structure_lint.validation._types import FactsCache
+
+
+def open_cache(root: Path) -> FactsCache:
+    """Open a facts cache for a project at root."""
+    config = create_minimal_config(root)
+    config.cache_dir = ".structure-lint"
+    cache = open_facts_cache(config)
+    assert cache is not None
+    return cache
+
+
+def commit_files(repo: Path, files: dict[str, str]) -> None:
+    """Create files with an old mtime and stage them in a new repository."""
+    build_structure(repo, {"src": files})
+    for name in files:
+        os.utime(repo / "src" / name, (1000, 1000))
+    git(repo, "init", "-q")
+    git(repo, "add", ".")
+
+
+def forbid_hashing(monkeypatch: MonkeyPatch) -> None:
+    """Make hashing any file content fail the test."""
+
+    def fail(*_: Any, **__: Any) -> Any:
+        raise AssertionError("file hashed despite a clean index entry")
+
+    monkeypatch.setattr(sys.modules[get_content_key.__module__].hashlib, "blake2b", fail)
+
+
+@REQUIRES_GIT
+class TestGitContentKeys:
+    """Tests for reading content keys from the git index."""
+
+    def test_clean_tracked_file_uses_blob_id(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should key an unmodified tracked file by its blob ID without hashing it."""
+        commit_files(tmp_path, {"a.py": "x = 1\n"})
+        blob_id = git(tmp_path, "hash-object", "src/a.py")
+        cache = open_cache(tmp_path)
+
+        forbid_hashing(monkeypatch)
+
+        assert get_content_key(cache, tmp_path / "src" / "a.py") == f"{blob_id}.py"
+
+    def test_modified_and_untracked_files_are_hashed(self, tmp_path: Path) -> None:
+        """Should hash files whose stat data does not match an index entry."""
+        commit_files(tmp_path, {"a.py": "x = 1\n"})
+        (tmp_path / "src" / "a.py").write_text("x = 2\n")
+        (tmp_path / "src" / "new.py").write_text("x = 1\n")
+        cache = open_cache(tmp_path)
+
+        for name, content in [("a.py", b"x = 2\n"), ("new.py", b"x = 1\n")]:
+            expected = hashlib.blake2b(content, digest_size=20).hexdigest() + ".py"
+            assert get_content_key(cache, tmp_path / "src" / name) == expected
+
+    def test_racy_entry_is_hashed(self, tmp_path: Path) -> None:
+        """Should not trust an entry that is not older than the index file."""
+        commit_files(tmp_path, {"a.py": "x = 1\n"})
+        path = tmp_path / "src" / "a.py"
+        index_mtime = (tmp_path / ".git" / "index").stat().st_mtime
+        os.utime(path, (index_mtime, index_mtime))
+        git(tmp_path, "update-index", "src/a.py")
+        os.utime(tmp_path / ".git" / "index", (index_mtime, index_mtime))
+
+        expected = hashlib.blake2b(b"x = 1\n", digest_size=20).hexdigest() + ".py"
+        assert get_content_key(open_cache(tmp_path), path) == expected
+
+    def test_outside_work_tree_is_hashed(self, tmp_path: Path) -> None:
+        """Should hash files that are not inside a git work tree."""
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+
+        expected = hashlib.blake2b(b"x = 1\n", digest_size=20).hexdigest() + ".py"
+        assert get_content_key(open_cache(tmp_path), tmp_path / "src" / "a.py") == expected
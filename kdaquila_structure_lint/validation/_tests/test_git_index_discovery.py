@@ -0,0 +1,143 @@
+"""Tests for discovering source files from the git index."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import REQUIRES_GIT, build_structure, git, scanned_names
+from kdaquila_structure_lint.validation._functions.read_git_index import read_git_index
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+@REQUIRES_GIT
+class TestGitIndexDiscovery:
+    """Tests for discovery = "git"."""
+
+    @pytest.mark.parametrize("version", ["2", "3", "4"])
+    def test_lists_tracked_files_with_stat_data(self, tmp_path: Path, version: str) -> None:
+        """Should read paths, sizes and mtimes from every index version."""
+        build_structure(
+            tmp_path,
+            {"src": {"a.py": "x = 1\n", "pkg": {"deep": {"b.ts": ""}, "notes.md": ""}}},
+        )
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", ".")
+        git(tmp_path, "update-index", "--index-version", version)
+
+        files = read_git_index(tmp_path, tmp_path / ".git" / "index")
+
+        assert files is not None
+        assert [f.path for f in files] == [
+            tmp_path / "src" / "a.py",
+            tmp_path / "src" / "pkg" / "deep" / "b.ts",
+            tmp_path / "src" / "pkg" / "notes.md",
+        ]
+        stat = (tmp_path / "src" / "a.py").stat()
+        assert files[0].size == stat.st_size
+        assert files[0].mtime_ns == stat.st_mtime_ns
+        assert files[0].object_id == git(tmp_path, "hash-object", "src/a.py")
+
+    def test_no_directory_walk(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Should not list any directory when the index is available."""
+        build_structure(tmp_path, {"src": {"a.py": "", "untracked.py": "", "pkg": {"b.py": ""}}})
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", "src/a.py", "src/pkg/b.py")
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(discovery="git"))
+
+        assert names == ["a.py", "pkg/b.py"]
+        assert listed == []
+
+    def test_skips_excluded_dirs_and_skip_worktree(self, tmp_path: Path) -> None:
+        """Should skip EXCLUDE_DIRS and entries outside the sparse checkout."""
+        build_structure(
+            tmp_path,
+            {"src": {"a.py": "", "sparse.py": "", "node_modules": {"dep.ts": ""}}},
+        )
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", ".")
+        git(tmp_path, "update-index", "--skip-worktree", "src/sparse.py")
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(discovery="git"))
+
+        assert names == ["a.py"]
+
+    def test_deleted_tracked_file_is_skipped(self, tmp_path: Path) -> None:
+        """Should not report a tracked file deleted from the work tree."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\ndiscovery = "git"\n')
+        build_structure(
+            tmp_path,
+            {"src": {"big.py": "x = 1\n" * 200, "_functions": {"b.py": "def b():\n    pass\n"}}},
+        )
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", ".")
+        (tmp_path / "src" / "big.py").unlink()
+        (tmp_path / "src" / "_functions" / "b.py").unlink()
+
+        assert run_validations(load_config(project_root=tmp_path)) == 0
+
+    def test_falls_back_without_index(self, tmp_path: Path) -> None:
+        """Should walk the filesystem outside a repository or with a broken index."""
+        build_structure(tmp_path, {"src": {"a.py": ""}})
+
+        assert scanned_names(tmp_path / "src", DirectoryIndex(discovery="git")) == ["a.py"]
+
+        (tmp_path / ".git").mkdir()
+        assert scanned_names(tmp_path / "src", DirectoryIndex(discovery="git")) == ["a.py"]
+
+        (tmp_path / ".git" / "index").write_bytes(b"DIRC\x00\x00\x00\x02\x00\x00\x00\x05")
+        assert scanned_names(tmp_path / "src", DirectoryIndex(discovery="git")) == ["a.py"]
+
+    def test_split_index_falls_back(self, tmp_path: Path) -> None:
+        """Should walk the filesystem when entries live in a shared split index."""
+        build_structure(tmp_path, {"src": {"a.py": "", "untracked.py": ""}})
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", "src/a.py")
+        git(tmp_path, "update-index", "--split-index")
+
+        assert read_git_index(tmp_path, tmp_path / ".git" / "index") is None
+        names = scanned_names(tmp_path / "src", DirectoryIndex(discovery="git"))
+        assert names == ["a.py", "untracked.py"]
+
+    def test_sparse_index_falls_back(self, tmp_path: Path) -> None:
+        """Should walk the filesystem when directories are collapsed in a sparse index."""
+        build_structure(tmp_path, {"src": {"a.py": "", "untracked.py": ""}, "docs": {"b.py": ""}})
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", "src/a.py", "docs/b.py")
+        git(tmp_path, "commit", "-q", "-m", "init")
+        git(tmp_path, "sparse-checkout", "set", "--cone", "--sparse-index", "src")
+
+        assert read_git_index(tmp_path, tmp_path / ".git" / "index") is None
+        names = scanned_names(tmp_path / "src", DirectoryIndex(discovery="git"))
+        assert names == ["a.py", "untracked.py"]
+
+
+class TestDiscoveryConfig:
+    """Tests for loading the discovery setting."""
+
+    def test_load_git_discovery(self, tmp_path: Path) -> None:
+        """Should load discovery from the root table."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\ndiscovery = "git"\n')
+
+        assert load_config(project_root=tmp_path).discovery == "git"
+        assert load_config(project_root=tmp_path / "missing").discovery == "filesystem"
+
+    def test_invalid_discovery_raises_error(self, tmp_path: Path) -> None:
+        """Should reject unknown discovery backends."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\ndiscovery = "svn"\n')
+
+        with pytest.raises(ValueError, match=r"Invalid discovery: 'svn'"):
+            load_config(project_root=tmp_path)
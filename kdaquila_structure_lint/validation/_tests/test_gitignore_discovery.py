@@ -0,0 +1,127 @@
+"""Tests for gitignore-aware discovery."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+    scanned_names,
+)
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+class TestGitignoreDiscovery:
+    """Tests for respect_gitignore."""
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Should find ignored files when respect_gitignore is off."""
+        (tmp_path / ".git").mkdir()
+        build_structure(tmp_path, {".gitignore": "gen/\n", "src": {"gen": {"a.py": ""}}})
+
+        assert scanned_names(tmp_path / "src", DirectoryIndex()) == ["gen/a.py"]
+
+    def test_ignored_directory_is_pruned(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Should never list a directory ignored by the root .gitignore."""
+        (tmp_path / ".git").mkdir()
+        build_structure(
+            tmp_path,
+            {
+                ".gitignore": "target/\n",
+                "src": {"main.py": "", "target": {"deep": {"out.py": ""}}},
+            },
+        )
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(respect_gitignore=True))
+
+        assert names == ["main.py"]
+        assert listed == ["src"]
+
+    def test_search_root_is_repository_root(self, tmp_path: Path) -> None:
+        """Should find .git in the search root itself, even though .git is excluded."""
+        (tmp_path / ".git").mkdir()
+        build_structure(tmp_path, {".gitignore": "gen/\n", "main.py": "", "gen": {"a.py": ""}})
+
+        assert scanned_names(tmp_path, DirectoryIndex(respect_gitignore=True)) == ["main.py"]
+
+    def test_nested_gitignore_and_negation(self, tmp_path: Path) -> None:
+        """Should apply nested .gitignore files with the innermost taking precedence."""
+        (tmp_path / ".git").mkdir()
+        build_structure(
+            tmp_path,
+            {
+                ".gitignore": "*.gen.py\n",
+                "src": {
+                    "api.gen.py": "",
+                    "pkg": {
+                        ".gitignore": "!keep.gen.py\n/local.py\n",
+                        "keep.gen.py": "",
+                        "drop.gen.py": "",
+                        "local.py": "",
+                        "sub": {"local.py": ""},
+                    },
+                },
+            },
+        )
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(respect_gitignore=True))
+
+        assert names == ["pkg/keep.gen.py", "pkg/sub/local.py"]
+
+    def test_info_exclude(self, tmp_path: Path) -> None:
+        """Should apply .git/info/exclude of the enclosing repository."""
+        build_structure(tmp_path, {".git": {"info": {"exclude": "scratch.py\n"}}})
+        build_structure(tmp_path, {"src": {"main.py": "", "scratch.py": ""}})
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(respect_gitignore=True))
+
+        assert names == ["main.py"]
+
+    def test_outside_git_work_tree_nothing_is_ignored(self, tmp_path: Path) -> None:
+        """Should ignore .gitignore files that are not inside a repository."""
+        build_structure(tmp_path, {"src": {".gitignore": "*.py\n", "main.py": ""}})
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(respect_gitignore=True))
+
+        assert names == ["main.py"]
+
+    def test_all_validators_skip_ignored_output(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should skip ignored build output in every validator when configured."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "pyproject.toml").write_text(
+            "[tool.structure-lint]\nrespect_gitignore = true\n"
+            "[tool.structure-lint.validators]\nstructure = true\n"
+        )
+        build_structure(
+            tmp_path,
+            {
+                ".gitignore": "storybook-static/\n",
+                "src": {
+                    "features": {"_functions": {"run.py": "def run():\n    pass\n"}},
+                    "storybook-static": {"bundle.py": SAMPLE_TOO_LONG_FILE_CONTENT},
+                },
+            },
+        )
+        config = load_config(project_root=tmp_path)
+
+        assert config.respect_gitignore is True
+        assert run_validations(config) == 0
+        assert run_validations(create_minimal_config(tmp_path)) == 1
+        assert "bundle.py" in capsys.readouterr().out
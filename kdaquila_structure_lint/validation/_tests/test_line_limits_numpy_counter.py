@@ -0,0 +1,76 @@
+"""Tests for the optional NumPy batch line counter."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import create_minimal_config, create_source_file
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+from kdaquila_structure_lint.validation._functions.count_lines import count_lines
+from kdaquila_structure_lint.validation._functions.count_lines_numpy import count_lines_numpy
+from kdaquila_structure_lint.validation._functions.validate_line_limits import validate_line_limits
+
+CONTENTS = [
+    b"",
+    b"one line",
+    b"a\nb\nc\n",
+    b"a\r\nb\r\nc",
+    b"a\rb\r",
+    b"\n",
+    "café\n".encode(),
+    b"bad \xff utf-8\n",
+]
+
+
+class TestLineLimitsNumpyCounter:
+    """Tests for count_lines_numpy and the counter fallback."""
+
+    @pytest.mark.parametrize("batch_size", [1, 8, 1 << 20])
+    def test_matches_pure_python_counter(self, tmp_path: Path, batch_size: int) -> None:
+        """Should produce the same counts as count_file_lines for every file."""
+        pytest.importorskip("numpy")
+
+        paths = []
+        for index, content in enumerate(CONTENTS):
+            path = tmp_path / f"file{index}.py"
+            path.write_bytes(content)
+            paths.append(path)
+        paths.append(tmp_path / "missing.py")
+
+        expected = [count_file_lines(path) for path in paths]
+        assert count_lines_numpy(paths, batch_size=batch_size) == expected
+
+    def test_crlf_is_not_joined_across_files(self, tmp_path: Path) -> None:
+        """Should not treat a trailing \\r and a leading \\n of the next file as one break."""
+        pytest.importorskip("numpy")
+        first = tmp_path / "first.py"
+        second = tmp_path / "second.py"
+        first.write_bytes(b"a\r")
+        second.write_bytes(b"\nb")
+
+        assert count_lines([first, second], counter="numpy") == [1, 2]
+
+    def test_falls_back_without_numpy(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should use the pure-Python counter when numpy cannot be imported."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        path = tmp_path / "module.py"
+        path.write_bytes(b"a\nb\n")
+
+        assert count_lines([path], counter="numpy") == [2]
+        assert "numpy is not installed" in capsys.readouterr().out
+
+    def test_validator_uses_numpy_counter(self, tmp_path: Path) -> None:
+        """Should detect violations with counter = "numpy"."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 10
+        config.line_limits.counter = "numpy"
+        create_source_file(tmp_path, "src/ok.py", "x = 1\n" * 10)
+        create_source_file(tmp_path, "src/too_long.py", "x = 1\n" * 11)
+
+        exit_code = validate_line_limits(config)
+        assert exit_code == 1
@@ -0,0 +1,58 @@
+"""Tests for bounded (early-exit) line counting in line limits validation."""
+
+from pathlib import Path
+
+from _pytest.capture import CaptureFixture
+
+from kdaquila_structure_lint.test_fixtures import create_minimal_config, create_source_file
+from kdaquila_structure_lint.validation._functions.count_file_lines import count_file_lines
+from kdaquila_structure_lint.validation._functions.validate_line_limits import validate_line_limits
+
+
+class TestLineLimitsValidatorEarlyExit:
+    """Tests for stopping line counting once the limit is exceeded."""
+
+    def test_count_stops_after_limit(self, tmp_path: Path) -> None:
+        """Should stop reading once more than limit lines have been seen."""
+        file_path = tmp_path / "generated.py"
+        file_path.write_text("x = 1\n" * 1000, encoding="utf-8")
+
+        count = count_file_lines(file_path, chunk_size=60, limit=10)
+
+        assert 10 < count < 1000
+
+    def test_count_below_limit_is_exact(self, tmp_path: Path) -> None:
+        """Should return the exact count when the limit is not exceeded."""
+        file_path = tmp_path / "small.py"
+        file_path.write_text("x = 1\n" * 10, encoding="utf-8")
+
+        assert count_file_lines(file_path, chunk_size=4, limit=10) == 10
+
+    def test_reports_more_than_limit_by_default(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should report "more than N lines" without counting to EOF."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 10
+        create_source_file(tmp_path, "src/too_long.py", "x = 1\n" * 50)
+
+        exit_code = validate_line_limits(config)
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert "more than 10 lines" in captured.out
+
+    def test_exact_counts_reports_line_count(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should report the exact count and excess with exact_counts."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 10
+        config.line_limits.exact_counts = True
+        create_source_file(tmp_path, "src/too_long.py", "x = 1\n" * 50)
+
+        exit_code = validate_line_limits(config)
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert "50 lines (exceeds limit by 40)" in captured.out
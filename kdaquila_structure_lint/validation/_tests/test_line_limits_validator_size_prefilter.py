@@ -0,0 +1,66 @@
+"""Tests for the stat-size prefilter in line limits validation."""
+
+from pathlib import Path
+
+from _pytest.capture import CaptureFixture
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import (
+    REQUIRES_GIT,
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+    create_source_file,
+    git,
+)
+from kdaquila_structure_lint.validation._functions.validate_line_limits import validate_line_limits
+
+
+class TestLineLimitsValidatorSizePrefilter:
+    """Tests for skipping files that are too small to exceed the limit."""
+
+    def test_small_undecodable_file_is_not_read(self, tmp_path: Path) -> None:
+        """Should skip files with no more bytes than max_lines without reading them."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 10
+        (tmp_path / "src").mkdir()
+        # Would be reported as "Error reading file" if it were opened
+        (tmp_path / "src" / "small.py").write_bytes(b"\xff" * 10)
+
+        exit_code = validate_line_limits(config)
+        assert exit_code == 0
+
+    def test_file_just_over_size_is_read(self, tmp_path: Path) -> None:
+        """Should still detect a file made of empty lines that exceeds the limit."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 10
+        create_source_file(tmp_path, "src/blank_lines.py", "\n" * 11)
+
+        exit_code = validate_line_limits(config)
+        assert exit_code == 1
+
+    def test_large_undecodable_file_reports_error(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should report undecodable files that are large enough to be read."""
+        config = create_minimal_config(tmp_path)
+        config.line_limits.max_lines = 5
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "binary.py").write_bytes(b"\xff\xfe" * 20)
+
+        exit_code = validate_line_limits(config)
+        captured = capsys.readouterr()
+
+        assert exit_code == 1
+        assert "Error reading file" in captured.out
+
+    @REQUIRES_GIT
+    def test_unstaged_growth_is_read(self, tmp_path: Path) -> None:
+        """Should not trust a small git index size for a file edited since git add."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\ndiscovery = "git"\n')
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", ".")
+        (tmp_path / "src" / "a.py").write_text(SAMPLE_TOO_LONG_FILE_CONTENT)
+
+        assert validate_line_limits(load_config(project_root=tmp_path)) == 1
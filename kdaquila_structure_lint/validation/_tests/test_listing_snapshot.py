@@ -0,0 +1,132 @@
+"""Tests for the persisted directory listing snapshot."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._functions.load_listing_snapshot import (
+    load_listing_snapshot,
+)
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._functions.save_listing_snapshot import (
+    save_listing_snapshot,
+)
+from kdaquila_structure_lint.validation._functions.scan_source_files import scan_source_files
+from kdaquila_structure_lint.validation._types import DirectoryIndex, ListingSnapshot
+
+
+def make_tree(root: Path) -> None:
+    """Create a small source tree whose directories were last modified long ago."""
+    build_structure(
+        root, {"src": {"big.py": SAMPLE_TOO_LONG_FILE_CONTENT, "pkg": {"a.py": "", "sub": {}}}}
+    )
+    for directory in [root / "src", root / "src" / "pkg", root / "src" / "pkg" / "sub"]:
+        os.utime(directory, (1000, 1000))
+
+
+def count_scandir(monkeypatch: MonkeyPatch) -> list[str]:
+    """Record the names of the directories listed with os.scandir."""
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path: Any) -> Any:
+        listed.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    return listed
+
+
+class TestListingSnapshot:
+    """Tests for reusing directory listings across runs."""
+
+    def test_load_cache_dir(self, tmp_path: Path) -> None:
+        """Should load cache_dir from the root table, defaulting to no cache."""
+        (tmp_path / "pyproject.toml").write_text('[tool.structure-lint]\ncache_dir = ".cache"\n')
+
+        assert load_config(project_root=tmp_path).cache_dir == ".cache"
+        assert load_config(project_root=tmp_path / "missing").cache_dir is None
+
+    def test_unchanged_directories_are_not_listed(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should reuse every listing on a no-op run and still find the same errors."""
+        config = create_minimal_config(tmp_path)
+        config.cache_dir = ".structure-lint"
+        make_tree(tmp_path)
+
+        assert run_validations(config) == 1
+        assert (tmp_path / ".structure-lint" / ".gitignore").read_text() == "*\n"
+
+        listed = count_scandir(monkeypatch)
+        assert run_validations(config) == 1
+        assert listed == []
+
+    def test_changed_directory_is_listed_again(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should list only the directory whose mtime changed since the snapshot."""
+        config = create_minimal_config(tmp_path)
+        config.cache_dir = ".structure-lint"
+        make_tree(tmp_path)
+        assert run_validations(config) == 1
+
+        (tmp_path / "src" / "pkg" / "sub" / "new.py").write_text(SAMPLE_TOO_LONG_FILE_CONTENT)
+        os.utime(tmp_path / "src" / "pkg" / "sub", (2000, 2000))
+        listed = count_scandir(monkeypatch)
+        index = DirectoryIndex(snapshot=load_listing_snapshot(tmp_path / ".structure-lint"))
+
+        names = [f.path.name for f in scan_source_files(tmp_path / "src", index=index)]
+
+        assert listed == ["sub"]
+        assert sorted(names) == ["a.py", "big.py", "new.py"]
+
+    def test_recently_modified_directory_is_not_trusted(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should list a directory modified just before the snapshot's run started."""
+        build_structure(tmp_path, {"src": {"a.py": ""}})
+        index = DirectoryIndex(snapshot=ListingSnapshot())
+        scan_source_files(tmp_path / "src", index=index)
+        save_listing_snapshot(index, tmp_path / "cache")
+
+        listed = count_scandir(monkeypatch)
+        index = DirectoryIndex(snapshot=load_listing_snapshot(tmp_path / "cache"))
+        scan_source_files(tmp_path / "src", index=index)
+
+        assert listed == ["src"]
+
+    def test_round_trip_keeps_symlinks(self, tmp_path: Path) -> None:
+        """Should save and load listings including their symlink names."""
+        build_structure(tmp_path, {"src": {"real.py": "", "pkg": {}}})
+        (tmp_path / "src" / "alias.py").symlink_to(tmp_path / "src" / "real.py")
+        (tmp_path / "src" / "linked").symlink_to(tmp_path / "src" / "pkg")
+        index = DirectoryIndex(snapshot=ListingSnapshot())
+        scan_source_files(tmp_path / "src", index=index)
+
+        save_listing_snapshot(index, tmp_path / "cache")
+        snapshot = load_listing_snapshot(tmp_path / "cache")
+
+        assert snapshot.created_ns == index.started_ns
+        assert snapshot.listings == index.snapshot_listings
+        listing = snapshot.listings[tmp_path / "src"][1]
+        assert listing.linked_files == {"alias.py"}
+        assert listing.linked_directories == {"linked"}
+
+    def test_unreadable_snapshot_is_empty(self, tmp_path: Path) -> None:
+        """Should start from an empty snapshot if the file is missing or corrupt."""
+        assert load_listing_snapshot(tmp_path) == ListingSnapshot()
+
+        (tmp_path / "listings.json").write_text("{not json")
+        assert load_listing_snapshot(tmp_path) == ListingSnapshot()
+
+        (tmp_path / "listings.json").write_text('{"version": 0, "created_ns": 1}')
+        assert load_listing_snapshot(tmp_path) == ListingSnapshot()
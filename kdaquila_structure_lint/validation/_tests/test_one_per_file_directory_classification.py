@@ -0,0 +1,65 @@
+"""Tests for per-directory rule classification in one-per-file validation."""
+
+import sys
+from pathlib import Path
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.test_fixtures import create_minimal_config, create_source_file
+from kdaquila_structure_lint.validation._functions.classify_directory import classify_directory
+from kdaquila_structure_lint.validation._functions.validate_one_per_file import (
+    validate_one_per_file,
+)
+from kdaquila_structure_lint.validation._types import DirectoryClassification
+
+
+class TestOnePerFileDirectoryClassification:
+    """Tests for classify_directory and its memoization."""
+
+    def test_classifies_innermost_standard_folder(self, tmp_path: Path) -> None:
+        """Should record the innermost standard folder and per-language rules."""
+        config = create_minimal_config(tmp_path)
+        config.one_per_file.ts_fun_in_functions = False
+
+        classification = classify_directory(
+            tmp_path / "src" / "_types" / "models" / "_functions", config
+        )
+
+        assert classification.folder == "_functions"
+        assert classification.py_rule is True
+        assert classification.ts_rule is False
+        assert classification.relative_dir == Path("src/_types/models/_functions")
+
+    def test_no_rule_outside_standard_folders(self, tmp_path: Path) -> None:
+        """Should have no rules for directories outside standard folders."""
+        config = create_minimal_config(tmp_path)
+
+        classification = classify_directory(tmp_path / "src" / "auth", config)
+
+        assert classification.folder is None
+        assert classification.py_rule is None
+        assert classification.ts_rule is None
+
+    def test_classified_once_per_directory(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should classify each directory once, however many files it holds."""
+        config = create_minimal_config(tmp_path)
+        for name in ["alpha", "beta", "gamma"]:
+            create_source_file(tmp_path, f"src/_functions/{name}.py", f"def {name}(): ...\n")
+            create_source_file(tmp_path, f"src/_types/{name}.py", f"{name} = 1\n")
+
+        classified: list[Path] = []
+
+        def counting_classify(directory: Path, config: Config) -> DirectoryClassification:
+            classified.append(directory)
+            return classify_directory(directory, config)
+
+        module = sys.modules[validate_one_per_file.__module__]
+        monkeypatch.setattr(module, "classify_directory", counting_classify)
+
+        exit_code = validate_one_per_file(config)
+
+        assert exit_code == 0
+        assert sorted(classified) == [tmp_path / "src" / "_functions", tmp_path / "src" / "_types"]
@@ -0,0 +1,142 @@
+"""Tests for skipping validation of an unchanged tree."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.config import Config
+from kdaquila_structure_lint.config._functions.fingerprint_config import fingerprint_config
+from kdaquila_structure_lint.test_fixtures import (
+    REQUIRES_GIT,
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+    git,
+)
+from kdaquila_structure_lint.validation._functions.fingerprint_tree import fingerprint_tree
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+SKIPPED = "Nothing changed since the last successful run"
+
+
+def make_config(root: Path) -> Config:
+    """Create a config with skip_unchanged and a cache directory."""
+    config = create_minimal_config(root)
+    config.cache_dir = ".structure-lint"
+    config.skip_unchanged = True
+    return config
+
+
+def age_tree(root: Path) -> None:
+    """Give every directory and file under root an old modification time."""
+    for directory, _, files in os.walk(root):
+        for name in [*files, ""]:
+            os.utime(Path(directory) / name, (1000, 1000))
+
+
+class TestRunFingerprint:
+    """Tests for skip_unchanged."""
+
+    def test_config_fingerprint_is_stable(self, tmp_path: Path) -> None:
+        """Should not depend on set order, but change with any setting."""
+        config = create_minimal_config(tmp_path)
+        other = create_minimal_config(tmp_path)
+        config.structure.ignored_folders = {"a", "b", "c"}
+        other.structure.ignored_folders = {"c", "b", "a"}
+
+        assert fingerprint_config(config) == fingerprint_config(other)
+
+        other.line_limits.max_lines = 151
+        assert fingerprint_config(config) != fingerprint_config(other)
+
+    def test_unchanged_tree_is_not_validated(
+        self, tmp_path: Path, capsys: CaptureFixture[str], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Should pass without listing or analyzing anything on a repeated run."""
+        config = make_config(tmp_path)
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n", "pkg": {"b.py": ""}}})
+        age_tree(tmp_path / "src")
+        assert run_validations(config) == 0
+        assert SKIPPED not in capsys.readouterr().out
+
+        listed: list[Any] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        assert run_validations(config) == 0
+        output = capsys.readouterr().out
+        assert SKIPPED in output
+        assert "Running line limit validation" not in output
+        assert listed == []
+
+    def test_changes_trigger_validation(self, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+        """Should validate again after a file or the config changes."""
+        config = make_config(tmp_path)
+        build_structure(tmp_path, {"src": {"a.py": "x = 1\n"}})
+        age_tree(tmp_path / "src")
+        assert run_validations(config) == 0
+
+        (tmp_path / "src" / "a.py").write_text(SAMPLE_TOO_LONG_FILE_CONTENT)
+        os.utime(tmp_path / "src" / "a.py", (2000, 2000))
+        assert run_validations(config) == 1
+
+        (tmp_path / "src" / "a.py").write_text("x = 1\n")
+        os.utime(tmp_path / "src" / "a.py", (1000, 1000))
+        config.line_limits.max_lines = 100
+        assert run_validations(config) == 0
+        assert SKIPPED not in capsys.readouterr().out
+
+    def test_failed_run_is_validated_again(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should only remember runs that passed."""
+        config = make_config(tmp_path)
+        build_structure(tmp_path, {"src": {"a.py": SAMPLE_TOO_LONG_FILE_CONTENT}})
+        age_tree(tmp_path / "src")
+
+        assert run_validations(config) == 1
+        assert run_validations(config) == 1
+        assert SKIPPED not in capsys.readouterr().out
+
+    @REQUIRES_GIT
+    def test_staging_triggers_validation(self, tmp_path: Path) -> None:
+        """Should validate again after git add with discovery = "git"."""
+        config = make_config(tmp_path)
+        config.discovery = "git"
+        build_structure(
+            tmp_path, {"src": {"a.py": "x = 1\n", "b.py": SAMPLE_TOO_LONG_FILE_CONTENT}}
+        )
+        git(tmp_path, "init", "-q")
+        git(tmp_path, "add", "src/a.py")
+        age_tree(tmp_path / "src")
+        assert run_validations(config) == 0
+
+        git(tmp_path, "add", "src/b.py")
+        assert run_validations(config) == 1
+
+    def test_recently_modified_file_is_never_trusted(self, tmp_path: Path) -> None:
+        """Should not fingerprint a tree whose files may change within one mtime tick."""
+        build_structure(tmp_path, {"src": {"a.py": ""}})
+        age_tree(tmp_path / "src")
+        assert fingerprint_tree(DirectoryIndex(), tmp_path / "src") is not None
+
+        (tmp_path / "src" / "a.py").write_text("x = 1\n")
+        assert fingerprint_tree(DirectoryIndex(), tmp_path / "src") is None
+
+    def test_needs_cache_dir(self, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+        """Should warn and validate normally without a cache directory."""
+        config = make_config(tmp_path)
+        config.cache_dir = None
+        build_structure(tmp_path, {"src": {"a.py": ""}})
+
+        assert run_validations(config) == 0
+        assert "skip_unchanged needs cache_dir" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+"""Tests for collapsing overlapping search paths."""
+
+from pathlib import Path
+
+from _pytest.capture import CaptureFixture
+
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._functions.dedupe_search_paths import (
+    dedupe_search_paths,
+)
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._functions.validate_line_limits import (
+    validate_line_limits,
+)
+from kdaquila_structure_lint.validation._functions.validate_one_per_file import (
+    validate_one_per_file,
+)
+
+TWO_FUNCTIONS = "def a():\n    pass\n\n\ndef b():\n    pass\n"
+
+
+class TestSearchPathDedup:
+    """Tests for dedupe_search_paths."""
+
+    def test_nested_paths_collapse_into_ancestor(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should keep the ancestor and warn about the nested entry."""
+        build_structure(tmp_path, {"src": {"pkg": {"sub": {}}}, "lib": {}})
+
+        kept = dedupe_search_paths(tmp_path, ["src/pkg/sub", "lib", "src", "src/pkg"])
+
+        assert kept == ["lib", "src"]
+        output = capsys.readouterr().out
+        assert "src/pkg/ is inside src/, skipping" in output
+        assert "src/pkg/sub/ is inside src/, skipping" in output
+
+    def test_same_directory_keeps_first_entry(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should drop repeated entries and symlinks to the same directory."""
+        build_structure(tmp_path, {"src": {}})
+        (tmp_path / "alias").symlink_to(tmp_path / "src")
+
+        kept = dedupe_search_paths(tmp_path, ["src", "./src", "alias"])
+
+        assert kept == ["src"]
+        output = capsys.readouterr().out
+        assert "./src/ is the same directory as src/, skipping" in output
+        assert "alias/ is the same directory as src/, skipping" in output
+
+    def test_sibling_prefix_is_not_nested(self, tmp_path: Path) -> None:
+        """Should compare whole path components, not string prefixes."""
+        build_structure(tmp_path, {"src": {}, "src2": {}})
+
+        assert dedupe_search_paths(tmp_path, ["src", "src2"]) == ["src", "src2"]
+
+    def test_missing_paths_are_kept(self, tmp_path: Path) -> None:
+        """Should leave missing entries for the validators to report."""
+        assert dedupe_search_paths(tmp_path, ["missing"]) == ["missing"]
+
+    def test_validators_report_each_file_once(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should not report duplicate errors for overlapping search paths."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "pkg": {
+                        "big.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                        "_functions": {"two.py": TWO_FUNCTIONS},
+                    }
+                }
+            },
+        )
+        assert validate_line_limits(config) == 1
+        assert validate_one_per_file(config) == 1
+        expected = capsys.readouterr().out
+
+        config.search_paths = ["src", "src/pkg"]
+        assert validate_line_limits(config) == 1
+        assert validate_one_per_file(config) == 1
+
+        output = capsys.readouterr().out
+        assert output.count("big.py") == expected.count("big.py") == 1
+        assert output.count("two.py") == expected.count("two.py") > 0
+
+    def test_overlap_warned_once_per_run(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should print each overlap warning once, not once per validator."""
+        config = create_minimal_config(tmp_path)
+        config.search_paths = ["src", "src/pkg"]
+        build_structure(tmp_path, {"src": {"pkg": {"a.py": ""}}})
+
+        assert run_validations(config) == 0
+
+        assert capsys.readouterr().out.count("src/pkg/ is inside src/, skipping") == 1
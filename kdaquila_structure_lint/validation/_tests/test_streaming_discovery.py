@@ -0,0 +1,139 @@
+"""Tests for streaming discovery into analysis workers."""
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._functions.iter_source_files import iter_source_files
+from kdaquila_structure_lint.validation._functions.stream_analysis import stream_analysis
+from kdaquila_structure_lint.validation._functions.validate_line_limits import (
+    validate_line_limits,
+)
+from kdaquila_structure_lint.validation._types import DirectoryIndex, SourceFile
+
+
+def make_files(count: int) -> list[SourceFile]:
+    """Create placeholder source file records."""
+    return [SourceFile(Path(f"f{i}.py"), 0, 0.0) for i in range(count)]
+
+
+class TestStreamAnalysis:
+    """Tests for stream_analysis."""
+
+    def test_analysis_starts_before_discovery_ends(self) -> None:
+        """Should analyze the first file while discovery is still running."""
+        first_analyzed = threading.Event()
+        files = make_files(2)
+
+        def discover() -> Iterator[SourceFile]:
+            yield files[0]
+            # Only reachable without a deadlock if analysis runs concurrently
+            assert first_analyzed.wait(timeout=5)
+            yield files[1]
+
+        def analyze(source_file: SourceFile) -> str:
+            first_analyzed.set()
+            return source_file.path.name
+
+        results = stream_analysis(discover(), analyze)
+
+        assert results == [(files[0], "f0.py"), (files[1], "f1.py")]
+
+    def test_pending_files_are_bounded(self, monkeypatch: MonkeyPatch) -> None:
+        """Should never have more than queue_size files submitted but unfinished."""
+        lock = threading.Lock()
+        in_flight = {"count": 0, "peak": 0}
+        full = threading.Event()
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+                with lock:
+                    in_flight["count"] += 1
+                    in_flight["peak"] = max(in_flight["peak"], in_flight["count"])
+                    if in_flight["count"] >= 3:
+                        full.set()
+
+                def run() -> Any:
+                    try:
+                        return fn(*args, **kwargs)
+                    finally:
+                        with lock:
+                            in_flight["count"] -= 1
+
+                return super().submit(run)
+
+        def analyze(_: SourceFile) -> None:
+            full.wait(timeout=5)  # Hold workers until discovery has filled the queue
+            time.sleep(0.01)
+
+        module = sys.modules[stream_analysis.__module__]
+        monkeypatch.setattr(module, "ThreadPoolExecutor", CountingExecutor)
+        stream_analysis(make_files(20), analyze, queue_size=3)
+
+        assert in_flight["peak"] == 3
+
+    def test_errors_propagate(self) -> None:
+        """Should re-raise exceptions from analysis workers."""
+
+        def analyze(_: SourceFile) -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match=r"boom"):
+            stream_analysis(make_files(3), analyze)
+
+
+class TestIterSourceFiles:
+    """Tests for the lazy directory walk."""
+
+    def test_partial_walk_is_not_cached(self, tmp_path: Path) -> None:
+        """Should only cache a walk that ran to completion."""
+        build_structure(tmp_path, {"src": {"a.py": "", "b.py": "", "pkg": {"c.py": ""}}})
+        index = DirectoryIndex()
+
+        walk = iter_source_files(tmp_path / "src", index=index)
+        next(walk)
+        walk.close()
+        assert index.source_files == {}
+
+        assert len(list(iter_source_files(tmp_path / "src", index=index))) == 3
+        assert len(index.source_files[tmp_path / "src"]) == 3
+
+    def test_report_order_is_deterministic(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should report newest files first and equal mtimes in path order."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "b.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                    "a.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                    "z": {"old.py": SAMPLE_TOO_LONG_FILE_CONTENT},
+                }
+            },
+        )
+        os.utime(tmp_path / "src" / "a.py", (2000, 2000))
+        os.utime(tmp_path / "src" / "b.py", (2000, 2000))
+        os.utime(tmp_path / "src" / "z" / "old.py", (1000, 1000))
+
+        assert validate_line_limits(config) == 1
+
+        reported = [line for line in capsys.readouterr().out.splitlines() if "•" in line]
+        assert [Path(line.split()[1].rstrip(":")).name for line in reported] == [
+            "a.py", "b.py", "old.py",
+        ]
@@ -0,0 +1,61 @@
+"""Tests for directory listing in structure validation."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.validate_src_tree import validate_src_tree
+
+
+class TestStructureValidatorListing:
+    """Tests for listing each directory exactly once."""
+
+    def test_each_directory_listed_once(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Should call os.scandir once per visited directory."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "features": {
+                        "auth": {
+                            "_functions": {"login.py": ""},
+                            "_types": {"user.py": ""},
+                            "oauth": {"_functions": {"google.py": ""}},
+                        },
+                    },
+                },
+            },
+        )
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert errors == []
+        # src, features, auth, auth/_functions, auth/_types, oauth, oauth/_functions
+        assert len(listed) == 7
+        assert len(set(listed)) == len(listed)
+
+    def test_symlinked_file_counts_as_file(self, tmp_path: Path) -> None:
+        """Should treat symlinks to files like regular files."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"src": {"features": {"real.txt": ""}}})
+        (tmp_path / "src" / "features" / "link.py").symlink_to(
+            tmp_path / "src" / "features" / "real.txt"
+        )
+
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert len(errors) == 1
+        assert "link.py" in errors[0]
@@ -0,0 +1,38 @@
+"""Tests for parallel base folder validation in structure validation."""
+
+from pathlib import Path
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.validate_src_tree import validate_src_tree
+
+
+class TestStructureValidatorParallel:
+    """Tests for validating base folders on a thread pool."""
+
+    def test_errors_follow_sorted_base_folder_order(self, tmp_path: Path) -> None:
+        """Should merge errors in sorted base folder order on every run."""
+        config = create_minimal_config(tmp_path)
+        names = [f"base_{index:02d}" for index in reversed(range(20))]
+        build_structure(
+            tmp_path,
+            {"src": {name: {"feature": {"stray.py": ""}} for name in names}},
+        )
+
+        expected = [
+            f"{tmp_path / 'src' / f'base_{index:02d}' / 'feature'}: "
+            "Disallowed files: ['stray.py']"
+            for index in range(20)
+        ]
+
+        assert validate_src_tree(tmp_path / "src", config) == expected
+        assert validate_src_tree(tmp_path / "src", config) == expected
+
+    def test_single_base_folder(self, tmp_path: Path) -> None:
+        """Should report errors from a lone base folder."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"src": {"features": {"types": {}}}})
+
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert len(errors) == 1
+        assert "forbidden" in errors[0]
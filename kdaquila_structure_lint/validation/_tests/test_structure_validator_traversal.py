@@ -0,0 +1,82 @@
+"""Tests for the iterative structure traversal engine."""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from kdaquila_structure_lint.test_fixtures import build_structure, create_minimal_config
+from kdaquila_structure_lint.validation._functions.iter_folder_violations import (
+    iter_folder_violations,
+)
+
+
+class TestStructureValidatorTraversal:
+    """Tests for iter_folder_violations."""
+
+    def test_tree_deeper_than_recursion_limit(self, tmp_path: Path) -> None:
+        """Should walk trees deeper than the Python recursion limit."""
+        config = create_minimal_config(tmp_path)
+        levels = sys.getrecursionlimit() + 100
+        config.structure.folder_depth = levels
+        deepest = tmp_path
+        for _ in range(levels):
+            deepest = deepest / "d"
+            deepest.mkdir()
+        (deepest / "stray.py").write_text("", encoding="utf-8")
+
+        try:
+            violations = list(iter_folder_violations(tmp_path / "d", config))
+        finally:
+            # shutil.rmtree recurses per level, so tear the tree down bottom-up
+            (deepest / "stray.py").unlink()
+            while deepest != tmp_path:
+                deepest.rmdir()
+                deepest = deepest.parent
+
+        assert len(violations) == 1
+        assert "stray.py" in violations[0]
+
+    def test_violations_in_depth_first_order(self, tmp_path: Path) -> None:
+        """Should yield violations in sorted depth-first order."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {
+                "base": {
+                    "a": {"types": {}, "b": {"x.py": ""}},
+                    "c": {"y.py": ""},
+                    "z.py": "",
+                },
+            },
+        )
+
+        violations = list(iter_folder_violations(tmp_path / "base", config))
+
+        assert [v.split(":")[0] for v in violations] == [
+            str(tmp_path / "base"),
+            str(tmp_path / "base" / "a" / "b"),
+            str(tmp_path / "base" / "a" / "types"),
+            str(tmp_path / "base" / "c"),
+        ]
+
+    def test_generator_is_lazy(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Should only list what is needed to produce the next violation."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"base": {"first.py": "", "a": {}, "b": {}, "c": {}}})
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        first = next(iter_folder_violations(tmp_path / "base", config))
+
+        assert "first.py" in first
+        assert listed == [str(tmp_path / "base")]
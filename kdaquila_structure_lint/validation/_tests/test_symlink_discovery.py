@@ -0,0 +1,94 @@
+"""Tests for symlink-safe discovery."""
+
+import os
+from pathlib import Path
+
+from kdaquila_structure_lint.config import load_config
+from kdaquila_structure_lint.test_fixtures import (
+    build_structure,
+    create_minimal_config,
+    scanned_names,
+)
+from kdaquila_structure_lint.validation._functions.validate_src_tree import validate_src_tree
+from kdaquila_structure_lint.validation._types import DirectoryIndex
+
+
+class TestSymlinkDiscovery:
+    """Tests for the follow_symlinks policy and inode deduplication."""
+
+    def test_load_follow_symlinks(self, tmp_path: Path) -> None:
+        """Should load follow_symlinks from the root table, defaulting to false."""
+        (tmp_path / "pyproject.toml").write_text("[tool.structure-lint]\nfollow_symlinks = true\n")
+
+        assert load_config(project_root=tmp_path).follow_symlinks is True
+        assert load_config(project_root=tmp_path / "missing").follow_symlinks is False
+
+    def test_symlinked_directory_not_followed_by_default(self, tmp_path: Path) -> None:
+        """Should skip symlinked directories unless follow_symlinks is set."""
+        build_structure(tmp_path, {"src": {"a.py": ""}, "shared": {"b.py": ""}})
+        (tmp_path / "src" / "linked").symlink_to(tmp_path / "shared")
+
+        assert scanned_names(tmp_path / "src", DirectoryIndex()) == ["a.py"]
+        assert scanned_names(tmp_path / "src", DirectoryIndex(follow_symlinks=True)) == [
+            "a.py",
+            "linked/b.py",
+        ]
+
+    def test_cycles_and_aliases_walked_once(self, tmp_path: Path) -> None:
+        """Should walk each physical directory once when following symlinks."""
+        build_structure(tmp_path, {"src": {"pkg": {"a.py": ""}}})
+        (tmp_path / "src" / "pkg" / "loop").symlink_to(tmp_path / "src")
+        (tmp_path / "src" / "alias").symlink_to(tmp_path / "src" / "pkg")
+
+        names = scanned_names(tmp_path / "src", DirectoryIndex(follow_symlinks=True))
+
+        assert len(names) == 1
+        assert names[0].endswith("a.py")
+
+    def test_same_file_reported_once(self, tmp_path: Path) -> None:
+        """Should report a file reachable through a symlink or hard link once."""
+        build_structure(tmp_path, {"src": {"real.py": ""}})
+        (tmp_path / "src" / "soft.py").symlink_to(tmp_path / "src" / "real.py")
+        os.link(tmp_path / "src" / "real.py", tmp_path / "src" / "hard.py")
+
+        assert len(scanned_names(tmp_path / "src", DirectoryIndex())) == 1
+
+    def test_structure_enters_linked_folders(self, tmp_path: Path) -> None:
+        """Should check symlinked folders like any other by default."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"src": {"features": {}}, "outside": {"stray.py": ""}})
+        (tmp_path / "src" / "features" / "functions").symlink_to(tmp_path / "outside")
+        (tmp_path / "src" / "features" / "other").symlink_to(tmp_path / "outside")
+        (tmp_path / "src" / "features" / "alias").symlink_to(tmp_path / "outside")
+
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert len(errors) == 3
+        assert "Disallowed files: ['stray.py']" in errors[0]
+        assert "Folder name 'functions' is forbidden" in errors[1]
+        assert "Disallowed files: ['stray.py']" in errors[2]
+
+        config.follow_symlinks = True
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert len(errors) == 2  # alias and other are one physical directory
+
+    def test_structure_default_symlink_cycle_terminates(self, tmp_path: Path) -> None:
+        """Should stop a symlink cycle at folder_depth without follow_symlinks."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"src": {"features": {"auth": {}}}})
+        (tmp_path / "src" / "features" / "auth" / "back").symlink_to(tmp_path / "src" / "features")
+
+        errors = validate_src_tree(tmp_path / "src", config)
+
+        assert len(errors) == 1
+        assert f"Exceeds max depth of {config.structure.folder_depth}" in errors[0]
+
+    def test_structure_symlink_cycle_terminates(self, tmp_path: Path) -> None:
+        """Should not re-enter a folder through a symlink cycle."""
+        config = create_minimal_config(tmp_path)
+        config.follow_symlinks = True
+        build_structure(tmp_path, {"src": {"features": {"auth": {}}}})
+        (tmp_path / "src" / "features" / "auth" / "back").symlink_to(tmp_path / "src" / "features")
+
+        assert validate_src_tree(tmp_path / "src", config) == []
@@ -0,0 +1,117 @@
+"""Tests for the --time-budget partial coverage mode."""
+
+import os
+from pathlib import Path
+
+from _pytest.capture import CaptureFixture
+
+from kdaquila_structure_lint.test_fixtures import (
+    SAMPLE_TOO_LONG_FILE_CONTENT,
+    build_structure,
+    create_minimal_config,
+)
+from kdaquila_structure_lint.validation._constants import PARTIAL_COVERAGE_EXIT_CODE
+from kdaquila_structure_lint.validation._functions.run_validations import run_validations
+from kdaquila_structure_lint.validation._functions.stream_analysis import stream_analysis
+from kdaquila_structure_lint.validation._functions.validate_line_limits import (
+    validate_line_limits,
+)
+from kdaquila_structure_lint.validation._types import SourceFile, TimeBudget
+
+
+class CountdownBudget(TimeBudget):
+    """A budget that runs out after a fixed number of checks."""
+
+    def __init__(self, checks: int) -> None:
+        super().__init__(deadline=0.0)
+        self.remaining = checks
+
+    def expired(self) -> bool:
+        """Expire once the allowed checks have been used."""
+        self.remaining -= 1
+        return self.remaining < 0
+
+
+class TestTimeBudget:
+    """Tests for stopping new checks once the time budget is spent."""
+
+    def test_stream_analysis_skips_after_deadline(self) -> None:
+        """Should not start files after the deadline and count them as skipped."""
+        files = [SourceFile(Path(f"f{i}.py"), 0, 0.0) for i in range(5)]
+        budget = CountdownBudget(checks=2)
+
+        results = stream_analysis(files, lambda f: f.path.name, budget=budget)
+
+        assert [name for _, name in results] == ["f0.py", "f1.py"]
+        assert budget.coverage() == (2, 3)
+
+    def test_newest_files_checked_first(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should spend the budget on the most recently modified files."""
+        config = create_minimal_config(tmp_path)
+        config.order = "path"
+        build_structure(
+            tmp_path,
+            {
+                "src": {
+                    "a.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                    "b.py": SAMPLE_TOO_LONG_FILE_CONTENT,
+                    "c.py": "",
+                }
+            },
+        )
+        os.utime(tmp_path / "src" / "a.py", (1000, 1000))
+        os.utime(tmp_path / "src" / "b.py", (2000, 2000))
+        budget = CountdownBudget(checks=1)
+
+        assert validate_line_limits(config, budget=budget) == 1
+
+        output = capsys.readouterr().out
+        assert "b.py" in output
+        assert "a.py" not in output
+        # c.py is too small to exceed the limit, so it is checked without reading
+        assert budget.coverage() == (2, 1)
+
+    def test_partial_coverage_exit_code(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should exit with the partial coverage code when files were skipped."""
+        config = create_minimal_config(tmp_path)
+        build_structure(
+            tmp_path,
+            {"src": {"a.py": SAMPLE_TOO_LONG_FILE_CONTENT, "b.py": "def b():\n    pass\n"}},
+        )
+
+        assert run_validations(config, time_budget=0.0) == PARTIAL_COVERAGE_EXIT_CODE
+
+        output = capsys.readouterr().out
+        # The small b.py passes the line limit by size alone, but one-per-file
+        # skips it too, so neither file was fully checked
+        assert "checked 0 file(s), skipped 2" in output
+        assert "coverage was partial" in output
+
+    def test_full_coverage_within_budget(
+        self, tmp_path: Path, capsys: CaptureFixture[str]
+    ) -> None:
+        """Should exit normally when every file was checked in time."""
+        config = create_minimal_config(tmp_path)
+        build_structure(tmp_path, {"src": {"a.py": SAMPLE_TOO_LONG_FILE_CONTENT}})
+
+        assert run_validations(config, time_budget=60.0) == 1
+        # Both validators check a.py, which counts as one file
+        output = capsys.readouterr().out
+        assert "checked 1 file(s), skipped 0" in output
+        assert "folder structure" not in output
+
+    def test_structure_runs_in_full(self, tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+        """Should run the structure validator whatever the budget, and say so."""
+        config = create_minimal_config(tmp_path)
+        config.validators.structure = True
+        build_structure(tmp_path, {"src": {"features": {"functions": {}}}})
+
+        assert run_validations(config, time_budget=0.0) == 1
+
+        output = capsys.readouterr().out
+        assert "Folder name 'functions' is forbidden" in output
+        assert "skipped 0; folder structure always checked in full" in output
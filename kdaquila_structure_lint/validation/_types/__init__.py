@@ -0,0 +1,33 @@
+"""Validation types package."""
+
+from kdaquila_structure_lint.validation._types.analysis_result import AnalysisResult
+from kdaquila_structure_lint.validation._types.directory_classification import (
+    DirectoryClassification,
+)
+from kdaquila_structure_lint.validation._types.directory_index import DirectoryIndex
+from kdaquila_structure_lint.validation._types.directory_listing import DirectoryListing
+from kdaquila_structure_lint.validation._types.facts_cache import FactsCache
+from kdaquila_structure_lint.validation._types.file_facts import FileFacts
+from kdaquila_structure_lint.validation._types.git_index_entry import GitIndexEntry
+from kdaquila_structure_lint.validation._types.ignore_file import IgnoreFile
+from kdaquila_structure_lint.validation._types.ignore_rule import IgnoreRule
+from kdaquila_structure_lint.validation._types.listing_snapshot import ListingSnapshot
+from kdaquila_structure_lint.validation._types.name_matcher import NameMatcher
+from kdaquila_structure_lint.validation._types.source_file import SourceFile
+from kdaquila_structure_lint.validation._types.time_budget import TimeBudget
+
+__all__ = [
+    "AnalysisResult",
+    "DirectoryClassification",
+    "DirectoryIndex",
+    "DirectoryListing",
+    "FactsCache",
+    "FileFacts",
+    "GitIndexEntry",
+    "IgnoreFile",
+    "IgnoreRule",
+    "ListingSnapshot",
+    "NameMatcher",
+    "SourceFile",
+    "TimeBudget",
+]
@@ -0,0 +1,5 @@
+"""Type variable for per-file analysis results."""
+
+from typing import TypeVar
+
+AnalysisResult = TypeVar("AnalysisResult")  # Whatever a validator computes for one file
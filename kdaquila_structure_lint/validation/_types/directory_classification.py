@@ -0,0 +1,16 @@
+"""Per-directory classification used by the one-per-file validator."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class DirectoryClassification:
+    """Everything one-per-file needs to know about a directory, computed once.
+
+    All files in a directory share the same standard folder and rules.
+    """
+    folder: str | None  # Innermost standard folder, None if not in one
+    py_rule: bool | None  # Rule for Python files (None = no rule applies)
+    ts_rule: bool | None  # Rule for TypeScript files (None = no rule applies)
+    relative_dir: Path  # Directory relative to project root, for error messages
@@ -0,0 +1,49 @@
+"""In-memory directory index shared by the validators during a run."""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._constants.exclude_dirs import EXCLUDE_DIRS
+from kdaquila_structure_lint.validation._types.directory_listing import DirectoryListing
+from kdaquila_structure_lint.validation._types.facts_cache import FactsCache
+from kdaquila_structure_lint.validation._types.git_index_entry import GitIndexEntry
+from kdaquila_structure_lint.validation._types.ignore_file import IgnoreFile
+from kdaquila_structure_lint.validation._types.listing_snapshot import ListingSnapshot
+from kdaquila_structure_lint.validation._types.source_file import SourceFile
+
+
+@dataclass
+class DirectoryIndex:
+    """Directory listings and discovered source files, built once per run.
+
+    Listings are filled in lazily as validators walk the tree, so each directory
+    is listed at most once no matter how many validators visit it. Entries
+    matching exclude are never stored, so excluded directories are never entered. With
+    respect_gitignore, listings are stored with ignored entries already removed,
+    so every validator prunes ignored directories instead of walking them.
+
+    With a snapshot from the previous run, a directory whose st_mtime_ns has not
+    changed is not listed again; the unfiltered listings of this run are kept in
+    snapshot_listings so that they can be saved for the next one.
+    """
+    exclude: frozenset[str] = EXCLUDE_DIRS  # Name patterns dropped from every listing
+    respect_gitignore: bool = False
+    discovery: str = "filesystem"  # "git" reads tracked files from .git/index
+    follow_symlinks: bool = False  # Walks descend into symlinked directories
+    dirty_first: bool = False  # Files modified or staged in git are scheduled first
+    listings: dict[Path, DirectoryListing] = field(default_factory=dict)
+    source_files: dict[Path, list[SourceFile]] = field(default_factory=dict)  # Per scan root
+    # Ignore files in effect per directory (None = not inside a git work tree)
+    ignore_files: dict[Path, tuple[IgnoreFile, ...] | None] = field(default_factory=dict)
+    # Tracked files per git index file (None = index missing or unreadable)
+    git_files: dict[Path, list[GitIndexEntry] | None] = field(default_factory=dict)
+    # Modified and staged files per git work tree, from one git status call each
+    dirty_files: dict[Path, frozenset[Path]] = field(default_factory=dict)
+    # Deduplicated search paths per project root and configured list, so overlap
+    # warnings print once per run
+    search_paths: dict[tuple[Path, tuple[str, ...]], list[str]] = field(default_factory=dict)
+    snapshot: ListingSnapshot | None = None  # Previous run's listings (None = no cache)
+    snapshot_listings: dict[Path, tuple[int, DirectoryListing]] = field(default_factory=dict)
+    started_ns: int = field(default_factory=time.time_ns)
+    facts: FactsCache | None = None  # File facts shared by the validators (None = no cache)
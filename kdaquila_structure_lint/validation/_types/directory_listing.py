@@ -0,0 +1,22 @@
+"""Directory listing type shared by the validators."""
+
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Sorted names of the subdirectories and files directly inside a directory.
+
+    Symlinks are classified by their target; linked_directories names the
+    directories that are symlinks, which source file discovery does not follow,
+    and linked_files the files that are symlinks. file_entries keeps the
+    os.DirEntry of each file, so the stat data of a file is fetched at most once
+    (and comes free with the directory read on Windows); it is empty for listings
+    reused from a snapshot.
+    """
+    directories: list[str]
+    files: list[str]
+    linked_directories: frozenset[str] = field(default_factory=frozenset)
+    linked_files: frozenset[str] = field(default_factory=frozenset)
+    file_entries: dict[str, os.DirEntry[str]] = field(default_factory=dict, compare=False)
@@ -0,0 +1,38 @@
+"""Content-addressed cache of file facts."""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types.file_facts import FileFacts
+from kdaquila_structure_lint.validation._types.git_index_entry import GitIndexEntry
+
+
+@dataclass
+class FactsCache:
+    """File facts stored in a SQLite database in cache_dir, by namespace and content key.
+
+    Facts do not depend on the configuration, so the namespace is just the tool
+    version and entries are shared by any checkout and any settings. keys and
+    facts memoize, for this run, the content key of each path and the facts of
+    each key. New facts and content keys wait in pending_facts and pending_keys
+    until they are written in one transaction. The connection is shared by the
+    analysis threads, which take lock to use it.
+    """
+    cache_dir: Path
+    namespace: str
+    keys: dict[Path, str | None] = field(default_factory=dict)
+    # Path -> (inode, size, mtime_ns) seen when its content key was computed
+    stats: dict[Path, tuple[int, int, int]] = field(default_factory=dict)
+    facts: dict[str, FileFacts] = field(default_factory=dict)
+    # Git index file per directory (None = not inside a git work tree)
+    git_indexes: dict[Path, Path | None] = field(default_factory=dict)
+    # Trustworthy index entries per git index file, by path
+    git_entries: dict[Path, dict[Path, GitIndexEntry]] = field(default_factory=dict)
+    database: sqlite3.Connection | None = None  # Opened on first use
+    database_missing: bool = False  # No readable database exists (until the next write)
+    pending_facts: dict[str, FileFacts] = field(default_factory=dict)
+    # Path -> (size, mtime_ns, hashed_ns, digest) of files hashed this run
+    pending_keys: dict[Path, tuple[int, int, int, str]] = field(default_factory=dict)
+    lock: threading.RLock = field(default_factory=threading.RLock)
@@ -0,0 +1,15 @@
+"""Facts about a file's content, as stored in the facts cache."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileFacts:
+    """What the validators learned from one file content.
+
+    Facts are filled in as validators need them; None means not computed yet.
+    """
+    line_count: int | None = None  # Exact line count (-1 = unreadable or not UTF-8)
+    definitions: tuple[str, ...] | None = None  # Top-level functions and classes
+    extras: tuple[str, ...] | None = None  # Other top-level definitions
+    parse_error: bool = False  # Definitions could not be parsed
@@ -0,0 +1,17 @@
+"""Entry record parsed from a git index file."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class GitIndexEntry:
+    """A regular file tracked in a git index.
+
+    size and mtime_ns are the stat data git recorded when it last hashed the
+    file, and object_id is the hex ID of the blob holding its content.
+    """
+    path: Path
+    size: int
+    mtime_ns: int
+    object_id: str
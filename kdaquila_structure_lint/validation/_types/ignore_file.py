@@ -0,0 +1,27 @@
+"""Compiled rules of one .gitignore (or .git/info/exclude) file."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types.ignore_rule import IgnoreRule
+
+
+@dataclass(frozen=True)
+class IgnoreFile:
+    """The rules of one ignore file and the directory they are relative to."""
+    base: Path
+    rules: tuple[IgnoreRule, ...]
+
+    def match(self, relative: str, is_dir: bool) -> bool | None:
+        """Decide whether relative is ignored by this file.
+
+        Returns True if ignored, False if re-included by a negated pattern, and
+        None if no pattern matches (the decision is left to parent ignore files).
+        As in git, the last matching pattern wins.
+        """
+        for rule in reversed(self.rules):
+            if rule.directory_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(relative) is not None:
+                return not rule.negated
+        return None
@@ -0,0 +1,16 @@
+"""A single compiled .gitignore pattern."""
+
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One .gitignore line compiled to a regular expression.
+
+    The regex is matched with fullmatch against the slash-separated path relative
+    to the directory holding the ignore file.
+    """
+    regex: re.Pattern[str]
+    negated: bool  # "!pattern" re-includes a previously ignored path
+    directory_only: bool  # "pattern/" only matches directories
@@ -0,0 +1,18 @@
+"""Directory listings persisted by a previous run."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._types.directory_listing import DirectoryListing
+
+
+@dataclass
+class ListingSnapshot:
+    """Unfiltered directory listings keyed by path, each with the st_mtime_ns of
+    the directory when it was listed.
+
+    created_ns is the time.time_ns() at which the run that saved the snapshot
+    started; it decides which listings are too recent to trust.
+    """
+    created_ns: int = 0
+    listings: dict[Path, tuple[int, DirectoryListing]] = field(default_factory=dict)
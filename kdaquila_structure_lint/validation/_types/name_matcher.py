@@ -0,0 +1,24 @@
+"""Precompiled matcher for fnmatch-style name patterns."""
+
+import os
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class NameMatcher:
+    """A set of fnmatch-style patterns compiled for repeated matching.
+
+    Patterns without wildcards are matched by set lookup; the rest are combined
+    into a single regular expression. Matching is equivalent to calling
+    fnmatch.fnmatch for each pattern.
+    """
+    literals: frozenset[str]
+    wildcard_regex: re.Pattern[str] | None
+
+    def matches(self, name: str) -> bool:
+        """Check if name matches any of the patterns."""
+        name = os.path.normcase(name)
+        if name in self.literals:
+            return True
+        return self.wildcard_regex is not None and self.wildcard_regex.match(name) is not None
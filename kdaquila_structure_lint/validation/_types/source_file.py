@@ -0,0 +1,16 @@
+"""Source file record produced by the directory scan."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """A source file together with the stat data captured while scanning.
+
+    Validators use these fields instead of stat-ing the file again. Both are None
+    when discovery was asked not to stat files.
+    """
+    path: Path
+    size: int | None
+    mtime: float | None
@@ -0,0 +1,37 @@
+"""Wall-clock budget shared by the validators of one run."""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class TimeBudget:
+    """A deadline for starting new file checks, with the files checked and skipped.
+
+    Files already being checked when the deadline passes are finished; files not
+    yet started are recorded as skipped. Paths are recorded once however many
+    validators visit them, and a file any validator skipped counts as skipped.
+    The structure validator checks folders, not files, and always runs in full
+    (its time still counts toward the deadline); structure records whether it ran.
+    """
+    deadline: float  # time.monotonic() value
+    structure: bool = False
+    checked: set[Path] = field(default_factory=set)
+    skipped: set[Path] = field(default_factory=set)
+
+    def expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        return time.monotonic() >= self.deadline
+
+    def coverage(self) -> tuple[int, int]:
+        """Return the numbers of fully checked and of skipped files."""
+        return len(self.checked - self.skipped), len(self.skipped)
+
+    def summary(self) -> str:
+        """Describe the coverage, e.g. "checked 3 file(s), skipped 1"."""
+        checked, skipped = self.coverage()
+        text = f"checked {checked} file(s), skipped {skipped}"
+        if self.structure:
+            text += "; folder structure always checked in full"
+        return text
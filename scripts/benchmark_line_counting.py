@@ -0,0 +1,65 @@
+"""Benchmark the pure-Python and NumPy line counters to find the crossover point.
+
+Usage: python scripts/benchmark_line_counting.py [--lines N] [--repeat N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from kdaquila_structure_lint.validation._functions.count_lines import count_lines
+
+FILE_COUNTS = [10, 100, 1_000, 10_000, 50_000]
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=80, help="Lines per generated file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401, PLC0415
+    except ImportError:
+        print("numpy is not installed: pip install 'kdaquila-structure-lint[numpy]'")
+        return 1
+
+    line = "    value = compute(value, other_value)  # typical source line\n"
+    content = line * args.lines
+
+    print(f"{'files':>8} {'python (s)':>12} {'numpy (s)':>12} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths: list[Path] = []
+        for file_count in FILE_COUNTS:
+            while len(paths) < file_count:
+                path = Path(tmp) / f"module_{len(paths)}.py"
+                path.write_text(content, encoding="utf-8")
+                paths.append(path)
+
+            batch = paths[:file_count]
+            python_time = best_time(partial(count_lines, batch, "python"), args.repeat)
+            numpy_time = best_time(partial(count_lines, batch, "numpy"), args.repeat)
+            print(
+                f"{file_count:>8} {python_time:>12.4f} {numpy_time:>12.4f} "
+                f"{python_time / numpy_time:>7.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())